@@ -7,21 +7,36 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import heapq
 import json
 import re
+from collections import deque
 from datetime import datetime, timedelta
-import pandas as pd
 from urllib.parse import urlparse
 import webbrowser
 
+from crawl_record import record_to_dict
+from exporters import EXPORT_FORMATS, export_records
+
+DISPLAY_LIMIT = 500  # 화면에 그리는 최대 항목 수 (개수/통계/태그/내보내기는 전체 항목 기준)
+
 class AdvancedResultsViewer:
-    """고급 크롤링 결과 뷰어"""
+    """고급 크롤링 결과 뷰어
+
+    crawled_data는 결과 저장소(또는 목록)이며 복사하지 않습니다.
+    필터/통계/태그 집계는 저장소를 처음부터 이어 읽어 계산하고, 화면에는 정렬 기준으로
+    고른 DISPLAY_LIMIT개만 그립니다. 태그는 항목을 읽을 때 붙입니다. (저장된 태그 + 자동 태그 + 사용자 태그)
+    """
     
     def __init__(self, parent_frame, crawled_data):
         self.parent_frame = parent_frame
         self.crawled_data = crawled_data
-        self.filtered_data = crawled_data.copy()
+        self.filtered_data = []   # 화면에 표시 중인 항목
+        self.filtered_count = 0   # 필터에 맞는 전체 항목 수
+        self.filtered_prices = []
         self.tags = set()
+        self.tag_counts = {}
+        self.custom_tags = {}     # 항목 키(URL, 없으면 제목) -> 사용자 태그 목록
         
         # 초기 태그 추출
         self.extract_initial_tags()
@@ -30,15 +45,39 @@ class AdvancedResultsViewer:
         self.setup_ui()
         
         # 초기 데이터 로드
-        self.refresh_display()
+        self.apply_filters()
+    
+    @staticmethod
+    def item_key(item):
+        return item.get('url') or item.get('title')
+    
+    def item_tags(self, item):
+        """저장된 태그, 자동 태그, 사용자 태그 (중복 제거, 순서 유지)"""
+        tags = list(item.get('tags', [])) + self.generate_auto_tags(item)
+        tags += self.custom_tags.get(self.item_key(item), [])
+        return list(dict.fromkeys(tags))
+    
+    def tagged_item(self, record):
+        """레코드를 태그를 붙인 dict로 변환합니다."""
+        item = record_to_dict(record, with_crawl_time=True)
+        item['tags'] = self.item_tags(item)
+        return item
+    
+    def iter_items(self):
+        """태그를 붙인 dict로 전체 항목을 이어 읽습니다. (저장소는 일정 개수씩 조회)"""
+        return map(self.tagged_item, self.crawled_data)
+    
+    def iter_filtered(self):
+        """현재 필터에 맞는 전체 항목"""
+        return (item for item in self.iter_items() if self.matches(item))
     
     def extract_initial_tags(self):
-        """초기 태그 추출"""
-        for item in self.crawled_data:
-            # 자동 태그 생성
-            auto_tags = self.generate_auto_tags(item)
-            item['tags'] = item.get('tags', []) + auto_tags
-            self.tags.update(item['tags'])
+        """전체 항목의 태그와 사용 빈도 집계"""
+        self.tag_counts = {}
+        for item in self.iter_items():
+            for tag in item['tags']:
+                self.tag_counts[tag] = self.tag_counts.get(tag, 0) + 1
+        self.tags.update(self.tag_counts)
     
     def generate_auto_tags(self, item):
         """아이템에 대한 자동 태그 생성"""
@@ -198,7 +237,7 @@ class AdvancedResultsViewer:
         sort_combo = ttk.Combobox(view_controls, textvariable=self.sort_var, width=15,
                                  values=["기본순", "제목순", "가격 낮은순", "가격 높은순", "날짜순"])
         sort_combo.pack(side=tk.LEFT)
-        sort_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_display())
+        sort_combo.bind('<<ComboboxSelected>>', lambda e: self.apply_filters())
         
         # 결과 컨테이너 (스크롤 가능)
         self.results_container = ttk.Frame(results_frame)
@@ -247,51 +286,63 @@ class AdvancedResultsViewer:
             self.parent_frame.after_cancel(self.search_timer)
         self.search_timer = self.parent_frame.after(500, self.apply_filters)
     
-    def apply_filters(self):
-        """필터 적용"""
-        self.filtered_data = []
+    def matches(self, item):
+        """항목이 현재 검색/가격/도메인/태그 필터에 맞는지 (내보내기 창에도 전달)"""
         keyword = self.keyword_var.get().strip()
         min_price = self.min_price_var.get().strip()
         max_price = self.max_price_var.get().strip()
         domain = self.domain_var.get().strip()
         
-        for item in self.crawled_data:
-            # 키워드 필터
-            if keyword:
-                text_to_search = f"{item.get('title', '')} {item.get('description', '')}"
-                if not self.case_sensitive.get():
-                    text_to_search = text_to_search.lower()
-                    keyword = keyword.lower()
-                
-                if keyword not in text_to_search:
-                    continue
-            
-            # 가격 필터
-            if min_price or max_price:
-                item_price = self.extract_price(item.get('price', ''))
-                if item_price is not None:
-                    try:
-                        if min_price and item_price < int(min_price):
-                            continue
-                        if max_price and item_price > int(max_price):
-                            continue
-                    except ValueError:
-                        pass
-            
-            # 도메인 필터
-            if domain and domain != "전체":
-                item_domain = urlparse(item.get('url', '')).netloc
-                if domain not in item_domain:
-                    continue
-            
-            # 태그 필터
-            if self.selected_tags:
-                item_tags = set(item.get('tags', []))
-                if not self.selected_tags.intersection(item_tags):
-                    continue
+        # 키워드 필터
+        if keyword:
+            text_to_search = f"{item.get('title', '')} {item.get('description', '')}"
+            if not self.case_sensitive.get():
+                text_to_search = text_to_search.lower()
+                keyword = keyword.lower()
             
-            self.filtered_data.append(item)
-        
+            if keyword not in text_to_search:
+                return False
+        
+        # 가격 필터
+        if min_price or max_price:
+            item_price = self.extract_price(item.get('price', ''))
+            if item_price is not None:
+                try:
+                    if min_price and item_price < int(min_price):
+                        return False
+                    if max_price and item_price > int(max_price):
+                        return False
+                except ValueError:
+                    pass
+        
+        # 도메인 필터
+        if domain and domain != "전체":
+            item_domain = urlparse(item.get('url', '')).netloc
+            if domain not in item_domain:
+                return False
+        
+        # 태그 필터
+        if self.selected_tags:
+            item_tags = set(item.get('tags', []))
+            if not self.selected_tags.intersection(item_tags):
+                return False
+        
+        return True
+    
+    def apply_filters(self):
+        """필터 적용 (전체 항목을 한 번 읽으며 개수/가격을 세고 표시할 항목만 고름)"""
+        self.filtered_count = 0
+        self.filtered_prices = []
+        
+        def counted(items):
+            for item in items:
+                self.filtered_count += 1
+                price = self.extract_price(item.get('price', ''))
+                if price:
+                    self.filtered_prices.append(price)
+                yield item
+        
+        self.filtered_data = self.select_display(counted(self.iter_filtered()))
         self.refresh_display()
     
     def extract_price(self, price_str):
@@ -335,6 +386,21 @@ class AdvancedResultsViewer:
         self.results_inner_frame.update_idletasks()
         self.results_canvas.configure(scrollregion=self.results_canvas.bbox("all"))
     
+    def select_display(self, items):
+        """정렬 기준으로 화면에 그릴 DISPLAY_LIMIT개를 고릅니다. (기본순은 최근 항목)"""
+        sort_option = self.sort_var.get()
+        
+        if sort_option == "제목순":
+            return heapq.nsmallest(DISPLAY_LIMIT, items, key=lambda x: x.get('title', '').lower())
+        elif sort_option == "가격 낮은순":
+            return heapq.nsmallest(DISPLAY_LIMIT, items, key=lambda x: self.extract_price(x.get('price', '')) or 0)
+        elif sort_option == "가격 높은순":
+            return heapq.nlargest(DISPLAY_LIMIT, items, key=lambda x: self.extract_price(x.get('price', '')) or 0)
+        elif sort_option == "날짜순":
+            return heapq.nlargest(DISPLAY_LIMIT, items, key=lambda x: x.get('crawl_time', datetime.now()))
+        else:
+            return list(deque(items, maxlen=DISPLAY_LIMIT))
+    
     def sort_data(self, data):
         """데이터 정렬"""
         sort_option = self.sort_var.get()
@@ -476,11 +542,10 @@ class AdvancedResultsViewer:
     
     def update_domain_combo(self):
         """도메인 콤보박스 업데이트"""
-        domains = set()
-        for item in self.crawled_data:
-            if item.get('url'):
-                domain = urlparse(item['url']).netloc
-                domains.add(domain)
+        if hasattr(self.crawled_data, 'count_by'):
+            domains = {domain for domain in self.crawled_data.count_by('domain') if domain}
+        else:
+            domains = {urlparse(item['url']).netloc for item in self.crawled_data if item.get('url')}
         
         domain_list = ["전체"] + sorted(list(domains))
         self.domain_combo['values'] = domain_list
@@ -499,8 +564,8 @@ class AdvancedResultsViewer:
         max_cols = 8
         
         for tag in sorted(self.tags):
-            # 태그 사용 빈도 계산
-            tag_count = sum(1 for item in self.crawled_data if tag in item.get('tags', []))
+            # 태그 사용 빈도 (extract_initial_tags에서 집계)
+            tag_count = self.tag_counts.get(tag, 0)
             
             # 태그 버튼 생성
             is_selected = tag in self.selected_tags
@@ -527,19 +592,17 @@ class AdvancedResultsViewer:
     def update_stats(self):
         """통계 정보 업데이트"""
         total = len(self.crawled_data)
-        filtered = len(self.filtered_data)
+        filtered = self.filtered_count
         
         if filtered == total:
             stats_text = f"총 {total}개 항목"
         else:
             stats_text = f"{filtered}개 항목 (전체 {total}개 중)"
+        if filtered > len(self.filtered_data):
+            stats_text += f" | 표시 {len(self.filtered_data)}개"
         
-        # 가격 정보가 있는 항목들의 통계
-        prices = []
-        for item in self.filtered_data:
-            price = self.extract_price(item.get('price', ''))
-            if price:
-                prices.append(price)
+        # 가격 정보가 있는 항목들의 통계 (필터에 맞는 전체 항목 기준)
+        prices = self.filtered_prices
         
         if prices:
             avg_price = sum(prices) // len(prices)
@@ -574,23 +637,19 @@ class AdvancedResultsViewer:
         """사용자 정의 태그 추가"""
         dialog = CustomTagDialog(self.parent_frame, self.filtered_data)
         if dialog.result:
-            # 선택된 항목들에 태그 추가
+            # 선택된 항목들에 태그 추가 (저장소 레코드는 바꾸지 않고 항목 키로 기억)
             for item in dialog.selected_items:
-                if 'tags' not in item:
-                    item['tags'] = []
-                if dialog.result not in item['tags']:
-                    item['tags'].append(dialog.result)
-                    self.tags.add(dialog.result)
-            self.refresh_display()
+                tags = self.custom_tags.setdefault(self.item_key(item), [])
+                if dialog.result not in tags:
+                    tags.append(dialog.result)
+            self.tags.add(dialog.result)
+            self.extract_initial_tags()
+            self.apply_filters()
     
     def auto_tag_all(self):
-        """모든 항목에 자동 태그 적용"""
-        for item in self.crawled_data:
-            auto_tags = self.generate_auto_tags(item)
-            existing_tags = item.get('tags', [])
-            item['tags'] = list(set(existing_tags + auto_tags))
-            self.tags.update(item['tags'])
-        self.refresh_display()
+        """모든 항목에 자동 태그 적용 (항목을 읽을 때 붙이므로 전체 태그를 다시 집계)"""
+        self.extract_initial_tags()
+        self.apply_filters()
         messagebox.showinfo("완료", "자동 태깅이 완료되었습니다!")
     
     def save_tags(self):
@@ -602,25 +661,27 @@ class AdvancedResultsViewer:
         )
         
         if filename:
-            tag_data = {
-                'tags': list(self.tags),
-                'tagged_items': self.crawled_data
-            }
+            # 전체 항목을 한 줄씩 기록 ({'tags': [...], 'tagged_items': [...]})
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(tag_data, f, ensure_ascii=False, indent=2, default=str)
+                f.write('{"tags": ' + json.dumps(sorted(self.tags), ensure_ascii=False) + ',\n"tagged_items": [')
+                for index, item in enumerate(self.iter_items()):
+                    f.write(',\n' if index else '\n')
+                    f.write(json.dumps(item, ensure_ascii=False, default=str))
+                f.write('\n]}\n')
             messagebox.showinfo("완료", f"태그 정보가 저장되었습니다:\n{filename}")
     
     def show_statistics(self):
         """상세 통계 창 표시"""
-        stats_window = StatisticsWindow(self.parent_frame, self.crawled_data, self.filtered_data)
+        stats_window = StatisticsWindow(self.parent_frame, len(self.crawled_data), self.iter_filtered())
     
     def setup_price_monitoring(self):
         """가격 모니터링 설정"""
         monitor_window = PriceMonitoringWindow(self.parent_frame, self.filtered_data)
     
     def export_selected(self):
-        """선택된 결과 내보내기"""
-        export_window = ExportWindow(self.parent_frame, self.filtered_data)
+        """선택된 결과 내보내기 (화면에 그린 항목이 아니라 필터에 맞는 전체 항목)"""
+        export_window = ExportWindow(self.parent_frame, self.crawled_data,
+                                     predicate=self.matches, prepare=self.tagged_item)
     
     def open_selected_links(self):
         """선택된 링크들 외부 브라우저에서 열기"""
@@ -759,14 +820,14 @@ class CustomTagDialog:
 class StatisticsWindow:
     """통계 창"""
     
-    def __init__(self, parent, all_data, filtered_data):
+    def __init__(self, parent, total, filtered_items):
         self.window = tk.Toplevel(parent)
         self.window.title("📊 크롤링 통계")
         self.window.geometry("600x500")
         
-        self.setup_ui(all_data, filtered_data)
+        self.setup_ui(total, filtered_items)
     
-    def setup_ui(self, all_data, filtered_data):
+    def setup_ui(self, total, filtered_items):
         """UI 설정"""
         notebook = ttk.Notebook(self.window)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -780,7 +841,7 @@ class StatisticsWindow:
         stats_text.configure(yscrollcommand=stats_scrollbar.set)
         
         # 통계 계산
-        basic_stats = self.calculate_basic_stats(all_data, filtered_data)
+        basic_stats = self.calculate_basic_stats(total, filtered_items)
         stats_text.insert(tk.END, basic_stats)
         stats_text.config(state=tk.DISABLED)
         
@@ -795,24 +856,37 @@ class StatisticsWindow:
         tag_frame = ttk.Frame(notebook)
         notebook.add(tag_frame, text="태그 분석")
     
-    def calculate_basic_stats(self, all_data, filtered_data):
-        """기본 통계 계산"""
+    def calculate_basic_stats(self, total, filtered_items):
+        """기본 통계 계산 (filtered_items는 한 번만 이어 읽음)"""
         stats = []
-        
-        stats.append("=== 기본 정보 ===")
-        stats.append(f"전체 항목 수: {len(all_data)}개")
-        stats.append(f"필터된 항목 수: {len(filtered_data)}개")
-        stats.append(f"필터 적용률: {len(filtered_data)/len(all_data)*100:.1f}%")
-        stats.append("")
-        
-        # 가격 분석
+        filtered = 0
         prices = []
-        for item in filtered_data:
+        domains = {}
+        tags = {}
+        
+        for item in filtered_items:
+            filtered += 1
+            
             price_str = item.get('price', '')
             if price_str:
                 price_match = re.search(r'\d+', str(price_str).replace(',', ''))
                 if price_match:
                     prices.append(int(price_match.group()))
+            
+            if item.get('url'):
+                domain = urlparse(item['url']).netloc
+                domains[domain] = domains.get(domain, 0) + 1
+            
+            for tag in item.get('tags', []):
+                tags[tag] = tags.get(tag, 0) + 1
+        
+        stats.append("=== 기본 정보 ===")
+        stats.append(f"전체 항목 수: {total}개")
+        stats.append(f"필터된 항목 수: {filtered}개")
+        stats.append(f"필터 적용률: {filtered/total*100 if total else 0:.1f}%")
+        stats.append("")
+        
+        # 가격 분석
         
         if prices:
             stats.append("=== 가격 분석 ===")
@@ -824,12 +898,6 @@ class StatisticsWindow:
             stats.append("")
         
         # 도메인 분석
-        domains = {}
-        for item in filtered_data:
-            if item.get('url'):
-                domain = urlparse(item['url']).netloc
-                domains[domain] = domains.get(domain, 0) + 1
-        
         if domains:
             stats.append("=== 도메인 분석 ===")
             for domain, count in sorted(domains.items(), key=lambda x: x[1], reverse=True)[:10]:
@@ -837,11 +905,6 @@ class StatisticsWindow:
             stats.append("")
         
         # 태그 분석
-        tags = {}
-        for item in filtered_data:
-            for tag in item.get('tags', []):
-                tags[tag] = tags.get(tag, 0) + 1
-        
         if tags:
             stats.append("=== 태그 분석 ===")
             for tag, count in sorted(tags.items(), key=lambda x: x[1], reverse=True)[:15]:
@@ -942,24 +1005,37 @@ class PriceMonitoringWindow:
 class ExportWindow:
     """내보내기 창"""
     
-    def __init__(self, parent, data):
+    def __init__(self, parent, records, predicate=None, prepare=None):
+        """records: 결과 저장소(또는 목록), predicate: 내보낼 항목 조건, prepare: 레코드 -> 항목 변환"""
         self.window = tk.Toplevel(parent)
         self.window.title("📤 데이터 내보내기")
-        self.window.geometry("400x300")
+        self.window.geometry("400x480")
         
-        self.data = data
+        self.records = records
+        self.predicate = predicate
+        self.prepare = prepare
         self.setup_ui()
     
+    def iter_rows(self):
+        """내보낼 항목을 저장소에서 이어 읽습니다."""
+        for record in self.records:
+            item = self.prepare(record) if self.prepare else record
+            if self.predicate is None or self.predicate(item):
+                yield item
+    
     def setup_ui(self):
         """UI 설정"""
         # 내보내기 옵션
         options_frame = ttk.LabelFrame(self.window, text="내보내기 옵션")
         options_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        self.format_var = tk.StringVar(value="excel")
-        ttk.Radiobutton(options_frame, text="Excel 파일 (.xlsx)", variable=self.format_var, value="excel").pack(anchor="w")
-        ttk.Radiobutton(options_frame, text="CSV 파일 (.csv)", variable=self.format_var, value="csv").pack(anchor="w")
-        ttk.Radiobutton(options_frame, text="JSON 파일 (.json)", variable=self.format_var, value="json").pack(anchor="w")
+        # 형식 값은 확장자 (pyarrow/zstandard가 없으면 해당 형식 비활성화)
+        self.format_var = tk.StringVar(value=".xlsx")
+        for extension, (label, available) in EXPORT_FORMATS.items():
+            if extension == '.ndjson':
+                continue  # .jsonl과 같은 형식
+            ttk.Radiobutton(options_frame, text=f"{label} ({extension})", variable=self.format_var, value=extension,
+                            state="normal" if available else "disabled").pack(anchor="w")
         
         # 포함할 필드 선택
         fields_frame = ttk.LabelFrame(self.window, text="포함할 필드")
@@ -988,46 +1064,18 @@ class ExportWindow:
             messagebox.showwarning("경고", "내보낼 필드를 선택해주세요.")
             return
         
-        format_type = self.format_var.get()
-        
-        if format_type == "excel":
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".xlsx",
-                filetypes=[("Excel files", "*.xlsx")],
-                title="Excel 파일로 저장"
-            )
-        elif format_type == "csv":
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv")],
-                title="CSV 파일로 저장"
-            )
-        else:
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".json",
-                filetypes=[("JSON files", "*.json")],
-                title="JSON 파일로 저장"
-            )
+        extension = self.format_var.get()
+        label = EXPORT_FORMATS[extension][0]
+        filename = filedialog.asksaveasfilename(
+            defaultextension=extension,
+            filetypes=[(label, f"*{extension}")],
+            title=f"{label}로 저장"
+        )
         
         if filename:
             try:
-                # 데이터 필터링
-                filtered_data = []
-                for item in self.data:
-                    filtered_item = {field: item.get(field, '') for field in selected_fields}
-                    if 'tags' in filtered_item and isinstance(filtered_item['tags'], list):
-                        filtered_item['tags'] = ', '.join(filtered_item['tags'])
-                    filtered_data.append(filtered_item)
-                
-                if format_type == "excel":
-                    df = pd.DataFrame(filtered_data)
-                    df.to_excel(filename, index=False)
-                elif format_type == "csv":
-                    df = pd.DataFrame(filtered_data)
-                    df.to_csv(filename, index=False, encoding='utf-8-sig')
-                else:
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(filtered_data, f, ensure_ascii=False, indent=2)
+                # 선택한 필드만 청크 단위로 기록
+                export_records(self.iter_rows(), filename, fields=selected_fields)
                 
                 messagebox.showinfo("완료", f"데이터가 성공적으로 내보내졌습니다:\n{filename}")
                 self.window.destroy()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 Playwright 크롤링 엔진
+playwright.async_api로 이벤트 루프 하나에서 여러 탭을 동시에 진행합니다.
+크롤링은 브라우저 서비스(browser_service)의 상시 이벤트 루프와 Chromium에서 새 컨텍스트로 실행하므로
+크롤링마다 브라우저를 띄우지 않고, 요청 제한/재시도 대기는 await로 처리하여 다른 크롤링을 막지 않습니다.
+동기 API는 스레드 하나가 페이지 하나의 로딩을 기다리지만, 비동기 엔진은 기다리는 동안
+다른 페이지를 진행하므로 프로세스 하나로 수십 개의 JS 렌더링 페이지를 동시에 불러올 수 있습니다.
+동시 페이지 수는 작업자(탭) 수와 호스트별 동시 요청 수(max_per_host)로 제한하고, 중지 요청은
+should_continue 확인과 작업 취소(cancel)로 처리합니다. HTML 파싱은 CPU 작업이므로 스레드 풀에서,
+결과 전달(화면 큐, 체크포인트 저장)은 전달 스레드 하나에서 실행하여 이벤트 루프를 막지 않습니다.
+"""
+
+import asyncio
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from browser_service import PlaywrightBrowserService, get_shared_browser_service
+from page_extractor import extract_page, parse_html
+from readiness import wait_until_ready_async
+from retry_policy import HttpStatusError, RetryPolicy
+from site_profiles import PLAYWRIGHT_PROFILES, BULK_EXTRACT_SCRIPT, script_spec, build_records, profile_key_for_url
+
+# playwright는 크롤링을 시작할 때 불러옵니다 (프로그램 시작 시간 단축)
+ASYNC_PLAYWRIGHT_AVAILABLE = importlib.util.find_spec('playwright') is not None
+
+DEFAULT_CONCURRENCY = 24   # 동시에 진행하는 페이지(탭) 수
+MAX_CONCURRENCY = 64
+
+
+class PageOutcome:
+    """비동기 엔진이 처리한 페이지 하나의 결과"""
+
+    def __init__(self, page_no, url):
+        self.page_no = page_no
+        self.url = url
+        self.records = []        # 사이트 프로필 항목 (build_records 결과)
+        self.page_result = None  # 일반 페이지의 PageResult
+        self.response = None     # requests 모드의 HTTP 응답
+        self.error = None
+        self.attempts = 0
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class CompletionTracker:
+    """완료 순서가 뒤섞인 페이지에서 '앞 페이지가 모두 끝난 지점'을 추적합니다.
+
+    체크포인트의 completed_pages에는 이 지점을 기록하므로, 재시작하면
+    중간에 끝나지 않은 페이지부터 다시 크롤링합니다.
+    """
+
+    def __init__(self, start_page):
+        self.next_page = start_page  # 아직 끝나지 않은 가장 앞 페이지
+        self.count = 0
+        self._done = set()
+
+    def mark(self, page_no):
+        """페이지 완료를 기록하고 연속으로 완료된 마지막 페이지 번호를 반환합니다."""
+        self.count += 1
+        self._done.add(page_no)
+        while self.next_page in self._done:
+            self._done.discard(self.next_page)
+            self.next_page += 1
+        return self.next_page - 1
+
+
+class AsyncPlaywrightEngine:
+    """이벤트 루프 하나에서 여러 탭으로 페이지를 동시에 크롤링합니다.
+
+    run()은 브라우저 서비스의 이벤트 루프에 크롤링을 넘기고 끝날 때까지 기다립니다. (호출한 스레드는 대기만 함)
+    on_page(outcome)는 페이지가 끝날 때마다(완료 순서대로) 전달 스레드에서 하나씩 호출됩니다.
+    (on_page가 디스크 기록이나 UI 큐 대기로 느려도 다른 탭은 계속 진행)
+    max_per_host: 한 호스트에 동시에 보내는 페이지 요청 수 (None이면 작업자 수)
+    """
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, rate_limiter=None,
+                 retry_policy=None, blocker=None, should_continue=None, parse_options=None,
+                 extract_options=None, record_options=None, page_timeout=30, max_per_host=None):
+        self.concurrency = min(max(1, int(concurrency)), MAX_CONCURRENCY)
+        self.max_per_host = max(1, int(max_per_host)) if max_per_host else self.concurrency
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.blocker = blocker
+        self.should_continue = should_continue
+        self.parse_options = parse_options or {}
+        self.extract_options = extract_options or {}
+        self.record_options = record_options or {}
+        self.page_timeout = page_timeout
+
+        self._loop = None
+        self._tasks = []
+        self._host_slots = {}  # 호스트 -> asyncio.Semaphore
+        self._cancelled = False
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        """중지 요청이 없으면 True"""
+        if self._cancelled:
+            return False
+        return self.should_continue is None or self.should_continue()
+
+    def cancel(self):
+        """진행 중인 페이지 작업을 취소합니다. (어느 스레드에서나 호출 가능)"""
+        with self._lock:
+            self._cancelled = True
+            loop = self._loop
+
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._cancel_tasks)
+            except RuntimeError:
+                pass  # 이벤트 루프가 이미 종료됨
+
+    def _cancel_tasks(self):
+        for task in self._tasks:
+            task.cancel()
+
+    def run(self, pages, on_page, service=None):
+        """pages: (페이지 번호, URL) 목록. 끝낸 페이지 수를 반환합니다."""
+        service = service or get_shared_browser_service()
+        return service.call(self.crawl, pages, on_page)
+
+    async def crawl(self, browser, pages, on_page):
+        """브라우저에 새 컨텍스트를 만들고 작업자(탭)들이 페이지 큐를 나눠 처리합니다."""
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+
+        queue = asyncio.Queue()
+        for item in pages:
+            queue.put_nowait(item)
+        if queue.empty() or not self.running:
+            return 0
+
+        context = await PlaywrightBrowserService.new_context(browser)
+        try:
+            if self.blocker is not None:
+                await self.blocker.install_playwright_async(context)
+
+            results = await self.run_workers(context, queue, on_page)
+        finally:
+            with self._lock:
+                self._loop = None
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"[DEBUG] 비동기 작업자 오류: {result}")
+        return sum(result for result in results if isinstance(result, int))
+
+    async def run_workers(self, context, queue, on_page):
+        """작업자(탭)들을 실행하고 각 작업자의 결과(처리한 페이지 수 또는 예외) 목록을 반환합니다."""
+        workers = min(self.concurrency, queue.qsize())
+        print(f"[DEBUG] 비동기 Playwright: 페이지 {queue.qsize()}개, 동시 탭 {workers}개, "
+              f"호스트별 동시 요청 {self.max_per_host}개")
+        self._host_slots = {}
+        # 완료 순서대로 하나씩 전달하도록 스레드 하나 사용
+        delivery = ThreadPoolExecutor(max_workers=1, thread_name_prefix="async-delivery")
+        try:
+            self._tasks = [asyncio.ensure_future(self.worker(context, queue, on_page, delivery))
+                           for _ in range(workers)]
+            # 중지 시 취소된 작업자는 CancelledError를 결과로 반환
+            return await asyncio.gather(*self._tasks, return_exceptions=True)
+        finally:
+            self._tasks = []
+            delivery.shutdown(wait=False)
+
+    async def worker(self, context, queue, on_page, delivery=None):
+        """탭 하나로 큐가 빌 때까지 페이지를 처리합니다."""
+        loop = asyncio.get_running_loop()
+        tab = await context.new_page()
+        done = 0
+        try:
+            while self.running:
+                try:
+                    page_no, page_url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+
+                outcome = await self.crawl_page(tab, page_no, page_url)
+                if not self.running:
+                    break  # 중지 후 끝난 페이지는 반영하지 않음 (재시작 시 다시 크롤링)
+
+                # 전달이 끝날 때까지 이 탭만 기다림 (이벤트 루프의 다른 탭은 계속 진행)
+                await loop.run_in_executor(delivery, on_page, outcome)
+                done += 1
+        finally:
+            try:
+                await tab.close()
+            except Exception:
+                pass
+        return done
+
+    async def crawl_page(self, tab, page_no, page_url):
+        """재시도 정책에 따라 페이지를 불러와 추출합니다."""
+        outcome = PageOutcome(page_no, page_url)
+        policy = self.retry_policy
+
+        for attempt in range(policy.max_retries):
+            outcome.attempts = attempt + 1
+            # 호스트별 동시 요청 수 안에서 요청 (재시도 대기 중에는 자리를 비움)
+            async with self.host_slot(page_url):
+                await self.wait_for_rate_limit(page_url)
+                if not self.running:
+                    break
+
+                try:
+                    response = await tab.goto(page_url, wait_until='domcontentloaded',
+                                              timeout=self.page_timeout * 1000)
+                    if response is not None and response.status >= 400:
+                        raise HttpStatusError(response.status, page_url, response.headers)
+
+                    await self.extract(tab, page_no, outcome)
+                    outcome.error = None
+                    return outcome
+
+                except Exception as e:
+                    outcome.error = e
+                    print(f"[DEBUG] 비동기 페이지 {page_no} 오류 (시도 {attempt+1}/{policy.max_retries}): {str(e)[:80]}")
+
+            if not self.running or not policy.should_retry(outcome.error, attempt):
+                break
+
+            delay = policy.next_delay(attempt, outcome.error)
+            if policy.retry_after(outcome.error) is not None and self.rate_limiter is not None:
+                # 서버가 지정한 대기 시간은 도메인 전체에 적용 (다음 예약이 대기)
+                self.rate_limiter.defer(page_url, delay)
+            else:
+                await asyncio.sleep(delay)
+
+        return outcome
+
+    def host_slot(self, page_url):
+        """페이지 호스트의 동시 요청 세마포어"""
+        host = urlparse(page_url).netloc.lower()
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        return slot
+
+    async def wait_for_rate_limit(self, page_url):
+        """도메인 요청 제한기의 순번을 예약하고 이벤트 루프를 막지 않고 기다립니다."""
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.reserve(page_url)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+    async def extract(self, tab, page_no, outcome):
+        """준비 조건까지 기다린 뒤 사이트 프로필 또는 일반 페이지 추출을 수행합니다."""
+        profile = PLAYWRIGHT_PROFILES.get(profile_key_for_url(outcome.url))
+        await wait_until_ready_async(tab, profile)
+
+        if profile is not None:
+            items = await tab.evaluate(BULK_EXTRACT_SCRIPT, script_spec(profile))
+            outcome.records = build_records(profile, items or [], tab.url, page_no, **self.record_options)
+        else:
+            content = await tab.content()
+            loop = asyncio.get_running_loop()
+            outcome.page_result = await loop.run_in_executor(None, self.parse_page, tab.url, content)
+
+    def parse_page(self, url, content):
+        """HTML을 파싱해 PageResult를 만듭니다. (스레드 풀에서 실행)"""
+        soup = parse_html(content, **self.parse_options)
+        return extract_page(url, soup, **self.extract_options)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Playwright 브라우저 서비스
+전용 스레드 하나가 asyncio 이벤트 루프를 계속 실행하고, 그 루프에서 playwright.async_api로
+Chromium을 띄워 둡니다. 크롤링 작업은 코루틴으로 이 루프에 넘겨 실행하며, 크롤링마다
+새 컨텍스트(쿠키/저장소 분리)를 만들고 브라우저 실행 비용은 한 번만 냅니다.
+작업은 루프에서 함께 진행되므로 한 크롤링이 페이지 로딩이나 요청 제한/재시도 대기(await)
+중이어도 다른 크롤링은 계속 진행됩니다. (작업 안에서 time.sleep 같은 블로킹 호출 금지)
+"""
+
+import asyncio
+import atexit
+import threading
+
+from http_session import DEFAULT_USER_AGENT
+
+# 자동화 감지 방지 스크립트 (모든 컨텍스트에 적용)
+HIDE_WEBDRIVER_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+    });
+"""
+
+LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled'
+]
+
+
+class PlaywrightBrowserService:
+    """전용 이벤트 루프 스레드에서 Chromium을 유지하는 Playwright 서비스"""
+
+    def __init__(self, headless=True, launch_args=None):
+        self.headless = headless
+        self.launch_args = launch_args or LAUNCH_ARGS
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._launch_lock = None  # 루프에서 만드는 asyncio.Lock (브라우저 중복 실행 방지)
+        self._playwright = None
+        self._browser = None
+
+    def _ensure_loop(self):
+        """이벤트 루프 스레드를 (처음 사용하거나 종료된 경우) 시작하고 루프를 반환합니다."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._run, args=(self._loop,),
+                                                name="playwright-owner", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    @staticmethod
+    def _run(loop):
+        """이벤트 루프 실행 (Playwright 소유 스레드)"""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _run_job(self, fn, args, kwargs):
+        browser = await self._ensure_browser()
+        return await fn(browser, *args, **kwargs)
+
+    async def _ensure_browser(self):
+        """브라우저를 처음 사용할 때 실행하고, 연결이 끊겼으면 다시 실행합니다."""
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+
+            if self._playwright is None:
+                from playwright.async_api import async_playwright
+                self._playwright = await async_playwright().start()
+
+            print("[DEBUG] Playwright Chromium 실행")
+            self._browser = await self._playwright.chromium.launch(headless=self.headless, args=self.launch_args)
+            return self._browser
+
+    async def _shutdown(self):
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    def submit(self, fn, *args, **kwargs):
+        """코루틴 함수 fn(browser, *args, **kwargs)를 서비스 루프에서 실행하고 Future를 반환합니다."""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._run_job(fn, args, kwargs), loop)
+
+    def call(self, fn, *args, **kwargs):
+        """submit 후 결과를 기다립니다. (서비스 루프 스레드에서 호출 금지)"""
+        return self.submit(fn, *args, **kwargs).result()
+
+    @staticmethod
+    async def new_context(browser, **options):
+        """크롤링용 새 컨텍스트를 만듭니다. (서비스 루프에서 호출)"""
+        options.setdefault('user_agent', DEFAULT_USER_AGENT)
+        options.setdefault('viewport', {'width': 1920, 'height': 1080})
+        context = await browser.new_context(**options)
+        await context.add_init_script(HIDE_WEBDRIVER_SCRIPT)
+        return context
+
+    def close(self):
+        """브라우저와 이벤트 루프 스레드를 종료합니다."""
+        with self._lock:
+            thread, loop = self._thread, self._loop
+            self._thread = self._loop = None
+            self._launch_lock = None
+        if thread is None or not thread.is_alive():
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=10)
+        except Exception as e:
+            print(f"[DEBUG] Playwright 종료 오류: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=10)
+
+
+_shared_service = None
+_shared_service_lock = threading.Lock()
+
+
+def get_shared_browser_service():
+    """앱 전체가 함께 사용하는 브라우저 서비스를 반환합니다."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = PlaywrightBrowserService()
+            atexit.register(_shared_service.close)
+        return _shared_service
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+추가 전용 체크포인트 저널
+체크포인트마다 전체 결과를 다시 pickle하지 않고, 지난 체크포인트 이후 새로 수집한
+레코드와 진행 상황만 JSON 한 줄로 파일 끝에 덧붙입니다.
+한 줄에 레코드와 진행 상황을 함께 기록하므로, 쓰는 도중 중단되어 마지막 줄이 잘려도
+그 줄만 버리면 직전 체크포인트까지는 그대로 복구됩니다.
+줄이 많이 쌓이면 전체 스냅샷으로 압축(임시 파일 작성 후 교체)합니다.
+스냅샷은 머리 줄 다음에 레코드를 SNAPSHOT_CHUNK개씩 나눈 줄로 기록하므로,
+결과가 많아도 한 줄(문자열)을 통째로 만들지 않고 저장소에서 이어 읽으며 씁니다.
+
+줄 형식:
+    {"reset": true,  "records": [], "state": {...}}            - 스냅샷 머리 (이전 줄 무시)
+    {"snapshot": true, "records": [레코드 최대 SNAPSHOT_CHUNK개]} - 스냅샷 레코드
+    {"reset": false, "records": [새 레코드],   "state": {...}}   - 증분
+state에는 crawled_data를 제외한 체크포인트 항목(task_progress, current_task 등)이 들어갑니다.
+
+새 레코드는 마지막으로 기록한 위치(커서) 뒤에서 읽습니다. 결과 저장소는 records_after(커서)로
+SQLite id 기준 조회를 하므로, 증분 체크포인트 비용이 전체 행 수가 아니라 새 레코드 수에 비례합니다.
+(일반 목록의 커서는 인덱스)
+"""
+
+import json
+import os
+import pickle
+import threading
+import time
+from datetime import datetime
+
+from crawl_record import CrawlRecord
+
+DEFAULT_FSYNC_INTERVAL = 5.0   # fsync 최소 간격 (초, 0이면 매번)
+DEFAULT_COMPACT_AFTER = 200    # 증분 줄이 이만큼 쌓이면 스냅샷으로 압축
+SNAPSHOT_CHUNK = 1000          # 스냅샷 한 줄에 담는 레코드 수
+
+_DATETIME_KEY = '__datetime__'
+
+
+def _encode(obj):
+    """JSON으로 표현할 수 없는 값 변환 (datetime은 복원 가능하게 표시)"""
+    if isinstance(obj, CrawlRecord):
+        return obj.to_dict(with_crawl_time=True)
+    if isinstance(obj, datetime):
+        return {_DATETIME_KEY: obj.isoformat()}
+    return str(obj)
+
+
+def _decode(obj):
+    if len(obj) == 1 and _DATETIME_KEY in obj:
+        return datetime.fromisoformat(obj[_DATETIME_KEY])
+    return obj
+
+
+def _dumps(entry):
+    return json.dumps(entry, ensure_ascii=False, default=_encode) + '\n'
+
+
+def _records_after(records, cursor, limit=None):
+    """커서 뒤의 레코드 목록과 새 커서 (결과 저장소는 records_after, 목록은 인덱스 슬라이스)"""
+    if hasattr(records, 'records_after'):
+        return records.records_after(cursor, limit)
+    stop = len(records) if limit is None else min(len(records), cursor + limit)
+    return records[cursor:stop], max(cursor, stop)
+
+
+class CheckpointJournal:
+    """체크포인트 하나를 JSON Lines 저널 파일로 저장/복구합니다.
+
+    append(checkpoint_data)의 crawled_data는 크롤링 동안 뒤에만 추가되는 목록(또는 결과 저장소)이라고
+    가정합니다. 다른 목록이 오거나, 저장소의 generation이 바뀌었거나, 길이가 줄면(새 크롤링)
+    스냅샷을 새로 씁니다.
+    """
+
+    def __init__(self, path, fsync_interval=DEFAULT_FSYNC_INTERVAL, compact_after=DEFAULT_COMPACT_AFTER):
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.compact_after = compact_after
+
+        self._records = None     # 마지막으로 기록한 crawled_data 목록
+        self._generation = None  # 그 목록의 generation (결과 저장소를 비운 횟수)
+        self._cursor = 0         # 그중 저널에 기록한 마지막 위치 (저장소 id 또는 목록 인덱스)
+        self._deltas = 0         # 마지막 스냅샷 이후 증분 줄 수
+        self._last_fsync = 0.0
+        self._lock = threading.Lock()
+
+    def append(self, checkpoint_data):
+        """지난 체크포인트 이후의 레코드와 현재 진행 상황을 덧붙입니다."""
+        records = checkpoint_data.get('crawled_data')
+        if records is None:
+            records = []
+        state = {key: value for key, value in checkpoint_data.items() if key != 'crawled_data'}
+
+        with self._lock:
+            # 목록이 줄었으면 새 크롤링 (저장소는 generation으로 판단)
+            shrunk = not hasattr(records, 'records_after') and len(records) < self._cursor
+            continues = (records is self._records and getattr(records, 'generation', None) == self._generation
+                         and not shrunk and os.path.exists(self.path))
+            if not continues or self._deltas >= self.compact_after:
+                self._write_snapshot(records, state)
+                return
+
+            new_records, cursor = _records_after(records, self._cursor)
+            entry = {'reset': False, 'records': new_records, 'state': state}
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(_dumps(entry))
+                self._sync(f)
+
+            self._cursor = cursor
+            self._deltas += 1
+
+    def compact(self, checkpoint_data=None):
+        """저널을 스냅샷 한 줄로 다시 씁니다. checkpoint_data가 없으면 파일 내용을 압축합니다."""
+        if checkpoint_data is None:
+            checkpoint_data = self.load()
+            if checkpoint_data is None:
+                return
+
+        records = checkpoint_data.get('crawled_data') or []
+        state = {key: value for key, value in checkpoint_data.items() if key != 'crawled_data'}
+        with self._lock:
+            self._write_snapshot(records, state)
+
+    def load(self):
+        """저널을 처음부터 재생해 체크포인트 데이터를 반환합니다. 파일이 없으면 None"""
+        if not os.path.exists(self.path):
+            return None
+
+        records = []
+        state = None
+        deltas = 0
+        damaged = False
+        with open(self.path, encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line, object_hook=_decode)
+                except ValueError:
+                    # 쓰는 도중 중단된 마지막 줄은 버림
+                    print(f"[DEBUG] 체크포인트 저널 {line_no}번째 줄 손상 - 이후 내용 무시")
+                    damaged = True
+                    break
+
+                if entry.get('snapshot'):
+                    records.extend(entry.get('records', []))
+                    continue
+                if entry.get('reset'):
+                    records = []
+                    deltas = 0
+                else:
+                    deltas += 1
+                records.extend(entry.get('records', []))
+                state = entry.get('state')
+
+        if state is None:
+            return None
+
+        # 복구한 목록에 이어서 기록하도록 상태 맞춤 (손상된 줄이 있으면 다음 기록은 스냅샷)
+        with self._lock:
+            self._records = None if damaged else records
+            self._generation = None
+            self._cursor = len(records)
+            self._deltas = deltas
+
+        checkpoint_data = dict(state)
+        checkpoint_data['crawled_data'] = records
+        return checkpoint_data
+
+    def remove(self):
+        """저널 파일을 삭제합니다."""
+        with self._lock:
+            self._records = None
+            self._cursor = 0
+            self._deltas = 0
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _write_snapshot(self, records, state):
+        """전체 레코드를 임시 파일에 쓰고 교체합니다. (중단되어도 기존 파일 유지)
+        레코드는 커서로 SNAPSHOT_CHUNK개씩 이어 읽어 한 줄씩 기록합니다. (결과 저장소는 id 기준 조회)
+        """
+        count = len(records)
+        cursor = written = 0
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(_dumps({'reset': True, 'records': [], 'state': state}))
+            # 시작 시점의 레코드 수까지만 (쓰는 동안 추가된 레코드는 다음 증분에 기록)
+            while written < count:
+                chunk, cursor = _records_after(records, cursor, min(SNAPSHOT_CHUNK, count - written))
+                if not chunk:
+                    break
+                f.write(_dumps({'snapshot': True, 'records': chunk}))
+                written += len(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+        self._records = records
+        self._generation = getattr(records, 'generation', None)
+        self._cursor = cursor
+        self._deltas = 0
+        self._last_fsync = time.monotonic()
+
+    def _sync(self, f):
+        """fsync 간격이 지났으면 디스크에 기록합니다."""
+        f.flush()
+        now = time.monotonic()
+        if now - self._last_fsync >= self.fsync_interval:
+            os.fsync(f.fileno())
+            self._last_fsync = now
+
+
+_journals = {}
+_journals_lock = threading.Lock()
+
+
+def get_journal(path, **options):
+    """경로별 저널 인스턴스를 반환합니다. (마지막 기록 위치를 크롤링 동안 유지)"""
+    key = os.path.abspath(path)
+    with _journals_lock:
+        journal = _journals.get(key)
+        if journal is None:
+            journal = _journals[key] = CheckpointJournal(path, **options)
+        return journal
+
+
+def is_pickle_checkpoint(path):
+    """이전 버전의 pickle 체크포인트인지 확인합니다. (pickle 프로토콜 2 이상은 0x80으로 시작)"""
+    with open(path, 'rb') as f:
+        return f.read(1) == b'\x80'
+
+
+def write_checkpoint(path, checkpoint_data):
+    """체크포인트를 저널에 덧붙입니다."""
+    get_journal(path).append(checkpoint_data)
+
+
+def read_checkpoint(path):
+    """체크포인트를 읽습니다. 이전 pickle 형식도 읽을 수 있습니다. 파일이 없으면 None"""
+    if not os.path.exists(path):
+        return None
+    if is_pickle_checkpoint(path):
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    return get_journal(path).load()
+
+
+def remove_checkpoint(path):
+    """체크포인트 파일을 삭제합니다."""
+    get_journal(path).remove()
@@ -0,0 +1,647 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI 독립 크롤링 엔진
+Tk 변수 대신 일반 설정 객체(CrawlConfig)를 받아 크롤링하고, 결과는 콜백이나
+이터레이터로 전달합니다. GUI(main.py)와 헤드리스 CLI(crawler_cli.py)가 함께 사용하며,
+진행 상황은 GUI 체크포인트와 같은 task_progress 형식으로 기록합니다.
+"""
+
+import queue
+import re
+import threading
+from datetime import datetime
+
+from http_session import HttpSessionManager
+from rate_limiter import shared_rate_limiter
+from retry_policy import RetryPolicy
+from response_cache import get_shared_cache
+from page_extractor import extract_page, link_display_text, parse_html, page_strainer
+from readiness import wait_until_ready, wait_selenium
+from resource_blocking import RequestBlocker, resolve_profile
+from site_profiles import SELENIUM_PROFILES, SELENIUM_BULK_EXTRACT_SCRIPT, SITE_TYPE_KEYS, script_spec, build_records
+from async_engine import PageOutcome, CompletionTracker
+from checkpoint_journal import write_checkpoint, read_checkpoint, remove_checkpoint
+from crawl_record import CrawlRecord
+
+BROWSER_MODES = ["requests", "selenium", "playwright", "playwright-async"]
+
+
+class CrawlConfig:
+    """크롤링 설정 (GUI의 Tk 변수 값을 옮겨 담거나 CLI 인자로 만듭니다)"""
+
+    DEFAULTS = {
+        'browser_mode': 'requests',
+        'max_pages': 1,
+        'crawl_delay': 1.0,
+        'workers': 1,
+        'html_parser': 'auto',
+        'resource_blocking': 'auto',
+        'site_type': '일반',
+        'extract_links': True,
+        'extract_images': True,
+        'extract_text': True,
+        'extract_title': True,
+        'extract_price': True,
+        'max_retries': 3,
+        'max_requests_per_host': 2,
+        'rate_burst': 1,
+        'use_response_cache': True,
+        'http_pool_size': 10,
+        'http_per_host': False,
+        'http_keep_alive': True,
+        'async_concurrency': 24,
+        'driver_pool_size': 1,
+    }
+
+    def __init__(self, url, **options):
+        unknown = set(options) - set(self.DEFAULTS)
+        if unknown:
+            raise TypeError(f"알 수 없는 크롤링 설정: {', '.join(sorted(unknown))}")
+
+        self.url = url
+        for name, default in self.DEFAULTS.items():
+            setattr(self, name, options.get(name, default))
+
+    @classmethod
+    def from_task(cls, task, **options):
+        """체크포인트의 current_task 딕셔너리로 설정을 만듭니다."""
+        values = {name: task[name] for name in cls.DEFAULTS if name in task}
+        values.update(options)
+        return cls(task['url'], **values)
+
+    def to_task(self):
+        """current_task 딕셔너리 형식으로 변환합니다."""
+        task = {'url': self.url}
+        task.update((name, getattr(self, name)) for name in self.DEFAULTS)
+        return task
+
+    def extract_options(self):
+        """extract_page 인자"""
+        return {
+            'extract_links': self.extract_links,
+            'extract_images': self.extract_images,
+            'extract_text': self.extract_text
+        }
+
+    def parse_options(self):
+        """parse_html 인자 (추출 옵션에 맞춘 부분 파싱 포함)"""
+        return {'parser': self.html_parser, 'parse_only': page_strainer(**self.extract_options())}
+
+    def record_options(self):
+        """사이트 프로필 build_records 인자"""
+        return {
+            'extract_title': self.extract_title,
+            'extract_price': self.extract_price,
+            'extract_images': self.extract_images
+        }
+
+
+def generate_page_url(base_url, page):
+    """페이지 번호에 따른 URL을 생성합니다."""
+    if page == 1:
+        return base_url
+
+    # 일반적인 페이지네이션 패턴들
+    if "?" in base_url:
+        return f"{base_url}&page={page}"
+    else:
+        return f"{base_url}?page={page}"
+
+
+def page_records(url, page_result):
+    """PageResult를 테이블/crawled_data용 레코드 목록으로 변환합니다."""
+    # 페이지 정보
+    records = [CrawlRecord(type='페이지', title=page_result.title, url=url, description='웹페이지 기본 정보')]
+
+    # 링크 정보 (최대 50개)
+    for i, (text, full_url) in enumerate(page_result.links):
+        records.append(CrawlRecord(type='링크', title=link_display_text(text), url=full_url,
+                                   description=f'링크 #{i+1}'))
+
+    # 이미지 정보 (최대 30개)
+    for i, (alt, full_url) in enumerate(page_result.images):
+        records.append(CrawlRecord(type='이미지', title=alt[:100], url=full_url,
+                                   description=f'이미지 #{i+1}'))
+
+    return records
+
+
+def new_progress(config, start_page=1):
+    """task_progress 형식의 진행 상황"""
+    return {
+        'total_pages': config.max_pages,
+        'completed_pages': start_page - 1,
+        'failed_pages': [],
+        'current_url': config.url,
+        'settings': config.to_task()
+    }
+
+
+def wait_before_retry(policy, rate_limiter, page_url, attempt, error, should_continue=None):
+    """재시도 정책에 따라 대기합니다. 재시도하지 않아야 하면 False를 반환합니다."""
+    if (should_continue is not None and not should_continue()) or not policy.should_retry(error, attempt):
+        return False
+
+    delay = policy.next_delay(attempt, error)
+    print(f"[DEBUG] {delay:.1f}초 후 재시도")
+
+    if policy.retry_after(error) is not None:
+        # 서버가 지정한 대기 시간은 도메인 전체에 적용 (다른 작업자도 함께 대기)
+        rate_limiter.defer(page_url, delay)
+    else:
+        policy.sleep(delay, should_continue=should_continue)
+    return True
+
+
+def retry_status_message(policy, label, page, attempt, error):
+    """재시도/포기 상태 메시지"""
+    err = str(error)
+    if policy.is_retryable(error) and attempt + 1 < policy.max_retries:
+        return f"{label} {page} 오류, 재시도 {attempt+1}/{policy.max_retries}: {err[:30]}"
+    return f"{label} {page} 실패 (재시도 안 함): {err[:30]}"
+
+
+class CrawlEngine:
+    """설정 객체로 동작하는 크롤링 엔진
+
+    콜백 (모두 작업 스레드에서 호출):
+        on_page(outcome)      - 성공한 페이지 (PageOutcome, records에 결과 레코드)
+        on_status(message)    - 재시도/오류 상태 메시지
+        on_checkpoint(engine) - 체크포인트를 저장할 시점 (engine.current_page, engine.progress 참고)
+    """
+
+    def __init__(self, config, on_page=None, on_status=None, on_checkpoint=None, should_continue=None,
+                 progress=None, rate_limiter=None, retry_policy=None, response_cache=None):
+        self.config = config
+        self.on_page = on_page
+        self.on_status = on_status
+        self.on_checkpoint = on_checkpoint
+        self.should_continue = should_continue
+        self.progress = progress if progress is not None else new_progress(config)
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=config.max_retries)
+        if config.use_response_cache:
+            self.response_cache = response_cache or get_shared_cache()
+        else:
+            self.response_cache = None
+
+        self.parse_options = config.parse_options()
+        self.extract_options = config.extract_options()
+        self.current_page = 1
+
+        self.http_sessions = None
+        self.host_semaphores = {}
+        self.host_request_lock = threading.Lock()
+        self._async_engine = None
+        self._stopped = False
+
+    @property
+    def running(self):
+        """중지 요청이 없으면 True"""
+        if self._stopped:
+            return False
+        return self.should_continue is None or self.should_continue()
+
+    def stop(self):
+        """크롤링을 중지합니다. (어느 스레드에서나 호출 가능)"""
+        self._stopped = True
+        if self._async_engine is not None:
+            self._async_engine.cancel()
+
+    def run(self, start_page=1):
+        """설정한 모드로 크롤링하고 진행 상황(task_progress 형식)을 반환합니다."""
+        config = self.config
+        self.current_page = start_page
+        self.rate_limiter.configure_delay(config.url, config.crawl_delay, config.rate_burst)
+
+        if config.browser_mode == "requests":
+            self.crawl_requests(start_page)
+        elif config.browser_mode == "selenium":
+            self.crawl_selenium(start_page)
+        elif config.browser_mode == "playwright":
+            self.crawl_playwright(start_page)
+        elif config.browser_mode == "playwright-async":
+            self.crawl_playwright_async(start_page)
+        else:
+            raise ValueError(f"지원하지 않는 브라우저 모드: {config.browser_mode}")
+        return self.progress
+
+    def iter_pages(self, start_page=1):
+        """크롤링을 백그라운드 스레드에서 실행하고 성공한 페이지(PageOutcome)를 차례로 반환합니다."""
+        results = queue.Queue()
+        done = object()
+        errors = []
+
+        def worker():
+            try:
+                self.run(start_page)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                results.put(done)
+
+        previous = self.on_page
+        self.on_page = results.put
+        thread = threading.Thread(target=worker, name="crawl-engine", daemon=True)
+        thread.start()
+        try:
+            while True:
+                outcome = results.get()
+                if outcome is done:
+                    break
+                yield outcome
+        finally:
+            # 소비를 중단하면 크롤링도 중지
+            self.stop()
+            self.on_page = previous
+
+        if errors:
+            raise errors[0]
+
+    # 결과/상태 전달
+    def deliver(self, outcome):
+        if self.on_page is not None and self.running:
+            self.on_page(outcome)
+
+    def report(self, label, page, attempt, error):
+        message = retry_status_message(self.retry_policy, label, page, attempt, error)
+        print(f"[DEBUG] {message}")
+        if self.on_status is not None:
+            self.on_status(message)
+
+    def checkpoint(self):
+        if self.on_checkpoint is not None:
+            self.on_checkpoint(self)
+
+    def wait_before_retry(self, page_url, attempt, error):
+        return wait_before_retry(self.retry_policy, self.rate_limiter, page_url, attempt, error,
+                                 should_continue=lambda: self.running)
+
+    def create_request_blocker(self):
+        config = self.config
+        profile = resolve_profile(config.resource_blocking, config.site_type, config.extract_images)
+        return RequestBlocker(profile, config.url)
+
+    # requests 모드
+    def crawl_requests(self, start_page):
+        """정적 페이지 크롤링 (작업자가 2 이상이면 스레드 풀로 동시 요청)"""
+        config = self.config
+        workers = max(1, int(config.workers))
+        print(f"[DEBUG] 페이지 범위: {start_page} ~ {config.max_pages}, 동시 요청: {workers}")
+
+        # 크롤링 동안 재사용할 HTTP 세션 (커넥션 풀 + 공통 헤더)
+        self.http_sessions = HttpSessionManager(
+            pool_size=max(config.http_pool_size, workers),
+            per_host=config.http_per_host,
+            keep_alive=config.http_keep_alive
+        )
+        try:
+            if workers > 1:
+                self.crawl_pages_concurrently(start_page, config.max_pages, workers)
+            else:
+                self.crawl_pages_sequentially(start_page, config.max_pages)
+        finally:
+            self.http_sessions.close()
+            self.http_sessions = None
+
+    def crawl_pages_sequentially(self, start_page, max_pages):
+        """페이지를 한 번에 하나씩 순서대로 크롤링합니다."""
+        for page in range(start_page, max_pages + 1):
+            if not self.running:
+                print(f"[DEBUG] 크롤링 중지됨 (페이지 {page})")
+                break
+
+            print(f"[DEBUG] 페이지 {page} 크롤링 시작")
+            self.current_page = page
+            self.progress['completed_pages'] = page - 1
+
+            # 체크포인트 저장 (5페이지마다)
+            if page % 5 == 0:
+                self.checkpoint()
+
+            # 요청 간격은 fetch_page에서 도메인별 요청 제한기로 조절
+            page_url = generate_page_url(self.config.url, page)
+            self.deliver_page_result(page, page_url, self.fetch_page(page_url, page))
+
+    def crawl_pages_concurrently(self, start_page, max_pages, workers):
+        """스레드 풀로 여러 페이지를 동시에 가져오고 결과는 페이지 순서대로 반영합니다."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        base_url = self.config.url
+        futures = {}
+        next_submit = start_page
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawl-page") as executor:
+            try:
+                for page in range(start_page, max_pages + 1):
+                    # 진행 중인 요청 수를 제한하면서 다음 페이지들을 미리 요청
+                    while (next_submit <= max_pages and next_submit < page + workers * 2
+                           and self.running):
+                        futures[next_submit] = executor.submit(
+                            self.fetch_page_politely, generate_page_url(base_url, next_submit), next_submit)
+                        next_submit += 1
+
+                    if page not in futures:
+                        print(f"[DEBUG] 크롤링 중지됨 (페이지 {page})")
+                        break
+
+                    self.current_page = page
+
+                    # 체크포인트 저장 (5페이지마다)
+                    if page % 5 == 0:
+                        self.checkpoint()
+
+                    # 페이지 순서대로 결과 반영
+                    result = futures.pop(page).result()
+                    self.deliver_page_result(page, generate_page_url(base_url, page), result)
+
+                    if self.running:
+                        self.progress['completed_pages'] = page
+            finally:
+                # 중지된 경우 아직 시작하지 않은 요청 취소
+                for future in futures.values():
+                    future.cancel()
+
+    def fetch_page_politely(self, page_url, page):
+        """호스트별 동시 요청 수를 지키며 페이지를 가져옵니다."""
+        from urllib.parse import urlparse
+
+        host = urlparse(page_url).netloc.lower()
+        with self.host_request_lock:
+            if host not in self.host_semaphores:
+                self.host_semaphores[host] = threading.Semaphore(self.config.max_requests_per_host)
+            semaphore = self.host_semaphores[host]
+
+        with semaphore:
+            if not self.running:
+                return None
+            return self.fetch_page(page_url, page)
+
+    def fetch_page(self, page_url, page):
+        """페이지를 요청하고 파싱/추출합니다. 성공하면 PageOutcome, 실패하면 None을 반환합니다."""
+        policy = self.retry_policy
+        for retry in range(policy.max_retries):
+            if not self.running:
+                return None
+
+            # 도메인 요청 예산이 소진된 경우에만 대기
+            self.rate_limiter.acquire(page_url, should_continue=lambda: self.running)
+            if not self.running:
+                return None
+
+            try:
+                print(f"[DEBUG] 요청 URL: {page_url} (시도 {retry+1}/{policy.max_retries})")
+
+                # HTTP 요청 수행 (풀링된 세션 재사용, 캐시가 있으면 조건부 요청)
+                if self.response_cache is not None:
+                    response = self.response_cache.fetch(self.http_sessions, page_url)
+                else:
+                    response = self.http_sessions.get(page_url)
+                print(f"[DEBUG] HTTP 응답 수신: status_code={response.status_code}, encoding={response.encoding}, "
+                      f"캐시 재사용={getattr(response, 'not_modified', False)}")
+
+                response.raise_for_status()
+
+                # 한글 인코딩 처리
+                if response.encoding == 'ISO-8859-1':
+                    response.encoding = response.apparent_encoding
+                elif not response.encoding:
+                    response.encoding = 'utf-8'
+
+                # 파싱과 추출은 작업 스레드에서 끝내고 트리는 바로 버림
+                soup = parse_html(response.text, **self.parse_options)
+                outcome = PageOutcome(page, page_url)
+                outcome.attempts = retry + 1
+                outcome.response = response
+                outcome.page_result = extract_page(page_url, soup, **self.extract_options)
+                outcome.records = page_records(page_url, outcome.page_result)
+                print(f"[DEBUG] 파싱/추출 완료 (페이지 {page})")
+                return outcome
+
+            except Exception as e:
+                print(f"[DEBUG] 크롤링 오류 (시도 {retry+1}): {str(e)}")
+                self.report("페이지", page, retry, e)
+                if not self.wait_before_retry(page_url, retry, e):
+                    break
+
+        return None
+
+    def deliver_page_result(self, page, page_url, outcome):
+        """가져온 페이지 결과를 전달하고 진행 상황을 기록합니다."""
+        if outcome is None:
+            if self.running:
+                print(f"[DEBUG] 페이지 {page} 크롤링 실패 - 실패 목록에 추가")
+                self.progress['failed_pages'].append(page)
+            return
+
+        self.deliver(outcome)
+        print(f"[DEBUG] 페이지 {page} 크롤링 성공")
+
+    # 브라우저 모드 (사이트 프로필 일괄 추출 + 일반 페이지 파싱)
+    def crawl_pages_with(self, start_page, label, load_page):
+        """브라우저 모드 공통 페이지 루프 (load_page(page_url, page) -> PageOutcome)"""
+        for page in range(start_page, self.config.max_pages + 1):
+            if not self.running:
+                print(f"[DEBUG] {label} 크롤링 중지됨 (페이지 {page})")
+                break
+
+            self.current_page = page
+            self.progress['completed_pages'] = page - 1
+
+            # 체크포인트 저장 (3페이지마다)
+            if page % 3 == 0:
+                self.checkpoint()
+
+            page_url = generate_page_url(self.config.url, page)
+            outcome = None
+            for retry in range(self.retry_policy.max_retries):
+                self.rate_limiter.acquire(page_url, should_continue=lambda: self.running)
+                if not self.running:
+                    break
+                try:
+                    outcome = load_page(page_url, page)
+                    outcome.attempts = retry + 1
+                    break
+                except Exception as e:
+                    print(f"[DEBUG] {label} 오류 (시도 {retry+1}): {str(e)}")
+                    self.report(f"{label} 페이지", page, retry, e)
+                    if not self.wait_before_retry(page_url, retry, e):
+                        break
+
+            self.deliver_page_result(page, page_url, outcome)
+
+    def general_outcome(self, page, page_url, html):
+        """일반 페이지 HTML을 파싱해 PageOutcome을 만듭니다."""
+        outcome = PageOutcome(page, page_url)
+        soup = parse_html(html, **self.parse_options)
+        outcome.page_result = extract_page(page_url, soup, **self.extract_options)
+        outcome.records = page_records(page_url, outcome.page_result)
+        return outcome
+
+    def crawl_selenium(self, start_page):
+        """드라이버 풀의 Selenium 드라이버로 크롤링합니다."""
+        from driver_pool import get_shared_driver_pool
+
+        profile = SELENIUM_PROFILES.get(SITE_TYPE_KEYS.get(self.config.site_type))
+        pool = get_shared_driver_pool(self.config.driver_pool_size)
+        lease = pool.acquire(timeout=120)
+        driver = lease.driver
+
+        try:
+            try:
+                self.create_request_blocker().install_selenium(driver)
+            except Exception as e:
+                print(f"[DEBUG] Selenium 리소스 차단 설정 실패: {e}")
+
+            def load_page(page_url, page):
+                driver.get(page_url)
+                wait_until_ready(wait_selenium, driver, profile)
+                lease.record_page()
+
+                if profile is None:
+                    return self.general_outcome(page, driver.current_url, driver.page_source)
+
+                outcome = PageOutcome(page, page_url)
+                items = driver.execute_script(SELENIUM_BULK_EXTRACT_SCRIPT, script_spec(profile))
+                outcome.records = build_records(profile, items or [], driver.current_url, page,
+                                                **self.config.record_options())
+                return outcome
+
+            self.crawl_pages_with(start_page, "Selenium", load_page)
+        finally:
+            pool.release(lease)
+
+    def crawl_playwright(self, start_page):
+        """상시 실행 브라우저 서비스의 새 컨텍스트에서 작업자 수만큼의 탭으로 크롤링합니다.
+
+        브라우저 서비스는 이벤트 루프에서 async API로 동작하므로 탭 하나여도 비동기 엔진으로 진행하며,
+        요청 제한/재시도 대기가 서비스 루프를 막지 않아 다른 크롤링이 함께 진행됩니다.
+        """
+        workers = max(1, int(self.config.workers))
+        print(f"[DEBUG] Playwright 탭 {workers}개 - 브라우저 서비스에서 비동기 엔진으로 진행")
+        self.crawl_playwright_async(start_page, concurrency=workers)
+
+    def crawl_playwright_async(self, start_page, concurrency=None):
+        """비동기 Playwright 엔진으로 여러 페이지를 동시에 크롤링합니다. (concurrency: 동시 탭 수)"""
+        from async_engine import AsyncPlaywrightEngine
+
+        config = self.config
+        blocker = self.create_request_blocker()
+        engine = AsyncPlaywrightEngine(
+            concurrency=concurrency or config.async_concurrency,
+            max_per_host=config.max_requests_per_host,
+            rate_limiter=self.rate_limiter,
+            retry_policy=self.retry_policy,
+            blocker=blocker,
+            should_continue=self.should_continue,
+            parse_options=self.parse_options,
+            extract_options=self.extract_options,
+            record_options=config.record_options()
+        )
+        tracker = CompletionTracker(start_page)
+
+        def on_page(outcome):
+            if outcome.ok:
+                if outcome.page_result is not None:
+                    outcome.records = page_records(outcome.url, outcome.page_result)
+                self.deliver(outcome)
+            else:
+                self.report("비동기 페이지", outcome.page_no, outcome.attempts - 1, outcome.error)
+                self.progress['failed_pages'].append(outcome.page_no)
+
+            # 앞 페이지가 모두 끝난 지점까지만 완료로 기록 (재시작 시 그 다음 페이지부터)
+            completed = tracker.mark(outcome.page_no)
+            self.current_page = completed + 1
+            self.progress['completed_pages'] = completed
+
+            # 체크포인트 저장 (3페이지마다)
+            if tracker.count % 3 == 0:
+                self.checkpoint()
+
+        self._async_engine = engine
+        if self._stopped:
+            engine.cancel()
+        try:
+            pages = [(page, generate_page_url(config.url, page)) for page in range(start_page, config.max_pages + 1)]
+            done = engine.run(pages, on_page)
+            print(f"[DEBUG] 비동기 Playwright 완료: {done}페이지, 리소스 차단 ({blocker.profile['name']}): "
+                  f"차단 {blocker.blocked}건, 허용 {blocker.allowed}건")
+        finally:
+            self._async_engine = None
+
+
+# 모니터링 페이지의 가격 패턴
+PRICE_TEXT_PATTERN = re.compile(r'[\d,]+원|[\$][\d,]+|\$[\d,.]+')
+
+
+def extract_number(text):
+    """텍스트에서 숫자를 추출합니다."""
+    try:
+        # 숫자와 콤마만 추출
+        numbers = re.findall(r'[\d,]+', text.replace(',', ''))
+        if numbers:
+            return float(numbers[0])
+    except Exception:
+        pass
+    return None
+
+
+class PageMonitor:
+    """페이지의 키워드 등장과 가격 변동을 확인하는 모니터 (알림 탭과 CLI monitor 공통)"""
+
+    def __init__(self, sessions=None, keywords=None, threshold=10.0, parser=None,
+                 rate_limiter=None, response_cache=None, history_size=100):
+        self.sessions = sessions or HttpSessionManager(pool_size=2)
+        self.keywords = list(keywords or [])
+        self.threshold = threshold
+        self.parser = parser
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.response_cache = response_cache or get_shared_cache()
+        self.history_size = history_size
+        self.history = []
+
+    def check(self, url, should_continue=None):
+        """페이지를 확인하고 알림 메시지 목록을 반환합니다. (변경 없음(304)이면 빈 목록)"""
+        # 간단한 크롤링으로 현재 데이터 확인 (공유 요청 제한기 사용)
+        self.rate_limiter.acquire(url, should_continue=should_continue)
+        response = self.response_cache.fetch(self.sessions, url)
+
+        # 304: 지난 확인 이후 변경이 없으므로 파싱/알림 검사 생략
+        if response.not_modified:
+            print(f"[DEBUG] 모니터링 페이지 변경 없음 (304): {url}")
+            return []
+
+        soup = parse_html(response.content, self.parser)
+
+        # 가격 정보 추출 (간단한 패턴)
+        price_elements = soup.find_all(string=PRICE_TEXT_PATTERN)
+        current_prices = [extract_number(price.strip()) for price in price_elements[:3]]
+
+        page_text = soup.get_text().lower()
+        keywords_found = [kw for kw in self.keywords if kw.lower() in page_text]
+
+        # 키워드 알림 체크
+        alert_messages = [f"키워드 '{keyword}'가 발견되었습니다!" for keyword in keywords_found]
+
+        # 가격 변동 체크 (직전 확인과 비교)
+        if price_elements and self.history:
+            prev_data = self.history[-1]
+            for i, current_price in enumerate(current_prices):
+                if current_price and i < len(prev_data.get('prices', [])):
+                    prev_price = prev_data['prices'][i]
+                    if prev_price and current_price:
+                        change_percent = abs((current_price - prev_price) / prev_price * 100)
+                        if change_percent >= self.threshold:
+                            alert_messages.append(f"가격 변동 감지: {change_percent:.1f}% 변화")
+
+        # 현재 데이터 저장 (최근 history_size개만 유지)
+        self.history.append({
+            'timestamp': datetime.now(),
+            'url': url,
+            'prices': current_prices,
+            'keywords_found': keywords_found
+        })
+        del self.history[:-self.history_size]
+
+        return alert_messages
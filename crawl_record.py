@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 결과 레코드
+항목마다 dict를 만드는 대신 __slots__ 객체 하나에 필드를 담습니다.
+타입/도메인 문자열은 intern하여 모든 레코드가 같은 문자열 객체를 공유하고,
+가격은 숫자로 미리 파싱하며(price_value), 수집 시각(crawl_time, epoch 초)을 함께 보관합니다.
+
+읽기 전용 Mapping 인터페이스(record['title'], record.get('price'), 'url' in record, items())와
+항목 설정(record['title'] = ...)을 지원하므로 기존 dict 레코드를 쓰던 코드를 그대로 사용할 수 있습니다.
+값이 없는(None) 필드는 키가 없는 것으로 취급합니다.
+내보내기/뷰어/JSON 저장에는 to_dict() 또는 records_to_dicts()로 일반 dict로 변환합니다.
+"""
+
+import sys
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from urllib.parse import urlparse
+
+from page_extractor import parse_price_text
+
+# dict로 변환할 때의 키 순서
+FIELDS = ('type', 'title', 'price', 'url', 'image_url', 'description', 'tags')
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class CrawlRecord(Mapping):
+    """크롤링 결과 항목 하나"""
+
+    __slots__ = FIELDS + ('price_value', 'domain', 'crawl_time', 'extra')
+
+    def __init__(self, type=None, title=None, price=None, url=None, image_url=None, description=None,
+                 tags=None, crawl_time=None, **extra):
+        self.title = title
+        self.image_url = image_url
+        self.description = description
+        self.tags = tags
+        self.extra = None  # FIELDS 밖의 키 (드물게 사용)
+        self['type'] = type
+        self['price'] = price
+        self['url'] = url
+        self['crawl_time'] = crawl_time
+        for key, value in extra.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data):
+        """dict 레코드(이전 체크포인트, JSON 등)를 변환합니다."""
+        if isinstance(data, cls):
+            return data
+        return cls(**data)
+
+    def __setitem__(self, key, value):
+        if key == 'type':
+            self.type = _intern(value)
+        elif key == 'url':
+            self.url = value
+            self.domain = _intern(urlparse(value).netloc.lower()) if value else ''
+        elif key == 'price':
+            self.price = value
+            self.price_value = parse_price_text(str(value)) if value is not None else None
+        elif key == 'crawl_time':
+            if isinstance(value, datetime):
+                value = value.timestamp()
+            self.crawl_time = time.time() if value is None else float(value)
+        elif key in FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __getitem__(self, key):
+        if key in FIELDS:
+            value = getattr(self, key)
+        elif self.extra is not None and key in self.extra:
+            value = self.extra[key]
+        else:
+            value = None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        for key in FIELDS:
+            if getattr(self, key) is not None:
+                yield key
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"CrawlRecord({dict(self)!r})"
+
+    @property
+    def crawl_datetime(self):
+        return datetime.fromtimestamp(self.crawl_time)
+
+    def to_dict(self, with_crawl_time=False):
+        """일반 dict로 변환합니다. (with_crawl_time=True이면 'crawl_time'에 datetime 포함)"""
+        data = dict(self)
+        if with_crawl_time:
+            data['crawl_time'] = self.crawl_datetime
+        return data
+
+
+def as_record(data):
+    """dict 또는 CrawlRecord를 CrawlRecord로 변환합니다."""
+    return CrawlRecord.from_dict(data)
+
+
+def record_to_dict(record, with_crawl_time=False):
+    """CrawlRecord 또는 dict를 일반 dict로 변환합니다."""
+    if isinstance(record, CrawlRecord):
+        return record.to_dict(with_crawl_time)
+    return dict(record)
+
+
+def records_to_dicts(records, with_crawl_time=False):
+    """내보내기/뷰어용 dict 목록 (저장소는 일정 개수씩 이어 읽음)"""
+    return [record_to_dict(record, with_crawl_time) for record in records]
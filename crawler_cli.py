@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+헤드리스 크롤러 CLI
+디스플레이 없는 서버에서 tk.Tk()를 만들지 않고 크롤링, 예약 크롤링, 모니터링을 실행합니다.
+크롤링 로직은 GUI와 같은 crawl_engine(CrawlEngine/PageMonitor)을 사용합니다.
+
+사용 예:
+    python main.py crawl https://example.com --pages 5 --workers 4 -o result.jsonl
+    python main.py schedule https://example.com --daily 09:00 --output-dir results
+    python main.py monitor https://example.com --keyword 할인 --interval 300
+    python main.py monitor --items monitoring_list.json --once
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import signal
+import sys
+import time
+from datetime import datetime
+
+from crawl_engine import (BROWSER_MODES, CrawlConfig, CrawlEngine, PageMonitor, read_checkpoint, write_checkpoint,
+                          remove_checkpoint)
+from price_alerts import price_alert_messages, monitoring_items_to_json, monitoring_items_from_json
+from crawl_record import as_record, record_to_dict
+from exporters import EXPORT_FORMATS, export_records
+from page_extractor import PARSER_CHOICES
+from resource_blocking import PROFILE_CHOICES
+
+OUTPUT_FORMATS = tuple(EXPORT_FORMATS)
+WEEKDAYS = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+
+
+def add_crawl_arguments(parser):
+    """crawl/schedule 공통 크롤링 옵션"""
+    parser.add_argument('url', help="크롤링할 URL")
+    parser.add_argument('--mode', choices=BROWSER_MODES, default='requests', help="브라우저 모드")
+    parser.add_argument('--pages', type=int, default=1, help="페이지 수")
+    parser.add_argument('--delay', type=float, default=1.0, help="같은 도메인 요청 간격(초)")
+    parser.add_argument('--workers', type=int, default=1, help="requests 모드 동시 요청 수 (1이면 순차)")
+    parser.add_argument('--concurrency', type=int, default=24, help="playwright-async 모드 동시 페이지 수")
+    parser.add_argument('--parser', choices=PARSER_CHOICES, default='auto', help="HTML 파서")
+    parser.add_argument('--blocking', choices=PROFILE_CHOICES, default='auto', help="브라우저 리소스 차단 프로필")
+    parser.add_argument('--site-type', default='일반', choices=['일반', '네이버 쇼핑', '인스타그램', '부동산'],
+                        help="Selenium 모드 사이트 종류")
+    for name, label in [('links', "링크"), ('images', "이미지"), ('text', "텍스트"), ('title', "제목"), ('price', "가격")]:
+        parser.add_argument(f'--no-{name}', dest=f'extract_{name}', action='store_false', help=f"{label} 추출 안 함")
+    parser.add_argument('--no-cache', dest='use_response_cache', action='store_false', help="응답 캐시 사용 안 함")
+
+
+def config_from_args(args):
+    """명령줄 인자로 CrawlConfig를 만듭니다."""
+    url = args.url
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+
+    return CrawlConfig(
+        url,
+        browser_mode=args.mode,
+        max_pages=max(1, args.pages),
+        crawl_delay=args.delay,
+        workers=min(max(args.workers, 1), 16),
+        async_concurrency=args.concurrency,
+        html_parser=args.parser,
+        resource_blocking=args.blocking,
+        site_type=args.site_type,
+        extract_links=args.extract_links,
+        extract_images=args.extract_images,
+        extract_text=args.extract_text,
+        extract_title=args.extract_title,
+        extract_price=args.extract_price,
+        use_response_cache=args.use_response_cache
+    )
+
+
+def write_records(records, path):
+    """결과 레코드를 확장자(.json/.jsonl/.csv/.csv.gz/.parquet/.xlsx 등)에 맞춰 청크 단위로 저장합니다."""
+    export_records(records, path)
+
+
+def run_crawl(config, output=None, checkpoint=None, resume=False, stream=None):
+    """크롤링 한 번을 실행하고 (레코드 목록, 진행 상황)을 반환합니다.
+
+    output이 없으면 레코드를 stream(기본 stdout)에 JSON Lines로 바로 출력합니다.
+    """
+    stream = stream or sys.stdout
+    records = []
+    current_task = dict(config.to_task(), started_at=datetime.now(), scheduled=False)
+    start_page = 1
+    progress = None
+
+    # 체크포인트에서 이어서 실행 (GUI 체크포인트와 같은 형식)
+    if resume and checkpoint:
+        data = read_checkpoint(checkpoint)
+        if data:
+            start_page = data.get('current_page', 1)
+            records = [as_record(record) for record in data.get('crawled_data', [])]
+            progress = data['task_progress']
+            current_task = data.get('current_task') or current_task
+            print(f"[DEBUG] 체크포인트에서 재시작: 페이지 {start_page}, 기존 {len(records)}개", file=sys.stderr)
+
+    def on_page(outcome):
+        records.extend(outcome.records)
+        if output is None:
+            for record in outcome.records:
+                stream.write(json.dumps(record_to_dict(record), ensure_ascii=False, default=str) + '\n')
+            stream.flush()
+
+    def on_checkpoint(engine):
+        if checkpoint:
+            write_checkpoint(checkpoint, {
+                'task_progress': engine.progress,
+                'current_task': current_task,
+                'crawled_data': records,
+                'timestamp': datetime.now(),
+                'current_page': engine.current_page,
+                'retry_count': 0
+            })
+
+    engine = CrawlEngine(
+        config,
+        on_page=on_page,
+        on_status=lambda message: print(message, file=sys.stderr),
+        on_checkpoint=on_checkpoint,
+        progress=progress
+    )
+
+    # Ctrl+C / SIGTERM: 현재 페이지를 마치고 중지 (체크포인트는 남김)
+    def handle_stop(signum, frame):
+        print("중지 요청됨 - 진행 중인 페이지를 정리합니다.", file=sys.stderr)
+        engine.stop()
+
+    previous_handlers = {}
+    try:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            previous_handlers[signum] = signal.signal(signum, handle_stop)
+    except ValueError:
+        pass  # 메인 스레드가 아니면 (예약 작업) 신호 처리 생략
+
+    try:
+        engine.run(start_page)
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
+    if output:
+        write_records(records, output)
+
+    # 정상 완료 시 체크포인트 정리, 중지된 경우는 남겨서 --resume 가능
+    if engine.running and checkpoint:
+        remove_checkpoint(checkpoint)
+    elif not engine.running:
+        on_checkpoint(engine)
+
+    failed = engine.progress['failed_pages']
+    print(f"크롤링 완료 - 총 {len(records)}개 데이터 수집" + (f" (실패: {len(failed)}페이지)" if failed else ""),
+          file=sys.stderr)
+    return records, engine.progress
+
+
+def command_crawl(args):
+    config = config_from_args(args)
+    _, progress = run_crawl(config, output=args.output, checkpoint=args.checkpoint, resume=args.resume,
+                            stream=args.stdout)
+    return 1 if progress['failed_pages'] else 0
+
+
+def command_schedule(args):
+    """APScheduler로 예약 크롤링을 실행합니다. (Ctrl+C로 종료)"""
+    from apscheduler.schedulers.blocking import BlockingScheduler
+    from apscheduler.triggers.cron import CronTrigger
+    from apscheduler.triggers.interval import IntervalTrigger
+
+    config = config_from_args(args)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    if args.every:
+        trigger = IntervalTrigger(minutes=args.every)
+    else:
+        hour, minute = (int(part) for part in args.at.split(':'))
+        if args.weekly:
+            trigger = CronTrigger(day_of_week=WEEKDAYS.index(args.weekly), hour=hour, minute=minute)
+        elif args.monthly:
+            trigger = CronTrigger(day=args.monthly, hour=hour, minute=minute)
+        else:
+            trigger = CronTrigger(hour=hour, minute=minute)
+
+    def scheduled_crawl():
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = os.path.join(args.output_dir, f"scheduled_crawling_{timestamp}{args.format}")
+        try:
+            run_crawl(config, output=output)
+            print(f"예약 크롤링 결과 저장: {output}", file=sys.stderr)
+        except Exception as e:
+            print(f"예약 크롤링 오류: {e}", file=sys.stderr)
+
+    scheduler = BlockingScheduler()
+    job = scheduler.add_job(scheduled_crawl, trigger=trigger, id="cli_scheduled_crawl", max_instances=1)
+    print(f"예약 크롤링 등록: {config.url} ({trigger})", file=sys.stderr)
+    if args.run_now:
+        scheduled_crawl()
+
+    try:
+        scheduler.start()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        if scheduler.running:
+            scheduler.shutdown(wait=False)
+    return 0
+
+
+def check_price_items(items, monitor, threshold, should_continue=None):
+    """가격 모니터링 목록(GUI 저장 형식)의 활성 항목 가격을 확인하고 알림 메시지를 반환합니다."""
+    from page_extractor import extract_price_from_html
+
+    alerts = []
+    for item in items:
+        if should_continue is not None and not should_continue():
+            break
+        url = item.get('url')
+        if not url or item.get('status', 'active') != 'active':
+            continue
+
+        try:
+            monitor.rate_limiter.acquire(url, should_continue=should_continue)
+            response = monitor.response_cache.fetch(monitor.sessions, url, timeout=10)
+            response.raise_for_status()
+
+            # 304: 페이지가 바뀌지 않았으면 직전 가격을 그대로 기록
+            if response.not_modified and item.get('price_history'):
+                price = item['price_history'][-1]['price']
+            else:
+                price = extract_price_from_html(response.text, item.get('price_selector'), monitor.parser)
+            if not price:
+                continue
+
+            item.setdefault('price_history', []).append({'price': price, 'timestamp': datetime.now(), 'url': url})
+            item['current_price'] = f"{price:,}원"
+            item['last_check'] = datetime.now()
+            alerts.extend(f"[{item.get('name', url)}] {message}"
+                          for message in price_alert_messages(item, price, threshold))
+        except Exception as e:
+            print(f"가격 체크 오류 ({item.get('name', 'Unknown')}): {e}", file=sys.stderr)
+            item['last_check'] = datetime.now()
+            item['status'] = 'error'
+    return alerts
+
+
+def command_monitor(args):
+    """페이지 키워드/가격 변동 또는 가격 모니터링 목록을 주기적으로 확인합니다."""
+    if not args.url and not args.items:
+        print("URL 또는 --items 중 하나가 필요합니다.", file=sys.stderr)
+        return 2
+
+    monitor = PageMonitor(keywords=args.keyword, threshold=args.threshold, parser=args.parser)
+    state = {'running': True}
+
+    def handle_stop(signum, frame):
+        state['running'] = False
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, handle_stop)
+
+    items = None
+    if args.items:
+        with open(args.items, 'r', encoding='utf-8') as f:
+            items = monitoring_items_from_json(json.load(f))
+
+    while state['running']:
+        try:
+            alerts = []
+            if args.url:
+                alerts.extend(monitor.check(args.url, should_continue=lambda: state['running']))
+            if items is not None:
+                alerts.extend(check_price_items(items, monitor, args.threshold,
+                                                should_continue=lambda: state['running']))
+                with open(args.items, 'w', encoding='utf-8') as f:
+                    json.dump(monitoring_items_to_json(items), f, ensure_ascii=False, indent=2)
+
+            now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            for message in alerts:
+                print(f"[{now}] 알림: {message}", file=args.stdout, flush=True)
+        except Exception as e:
+            print(f"모니터링 오류: {e}", file=sys.stderr)
+
+        if args.once:
+            break
+
+        # 중지 요청을 확인하면서 다음 확인까지 대기
+        deadline = time.monotonic() + args.interval
+        while state['running'] and time.monotonic() < deadline:
+            time.sleep(min(1.0, deadline - time.monotonic()))
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="crawler", description="헤드리스 웹 크롤러 (GUI 없이 실행)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    crawl = commands.add_parser('crawl', help="크롤링 실행")
+    add_crawl_arguments(crawl)
+    crawl.add_argument('-o', '--output', help=f"결과 파일 ({', '.join(OUTPUT_FORMATS)}), 없으면 stdout에 JSON Lines")
+    crawl.add_argument('--checkpoint', help="체크포인트 파일 (중지 시 남김)")
+    crawl.add_argument('--resume', action='store_true', help="체크포인트에서 이어서 실행")
+    crawl.set_defaults(func=command_crawl)
+
+    schedule = commands.add_parser('schedule', help="예약 크롤링 (Ctrl+C로 종료)")
+    add_crawl_arguments(schedule)
+    when = schedule.add_mutually_exclusive_group(required=True)
+    when.add_argument('--daily', dest='at', metavar='HH:MM', help="매일 지정 시각")
+    when.add_argument('--every', type=int, metavar='MINUTES', help="지정 간격(분)마다")
+    schedule.add_argument('--weekly', choices=WEEKDAYS, help="--daily 시각을 매주 이 요일에만")
+    schedule.add_argument('--monthly', type=int, metavar='DAY', help="--daily 시각을 매월 이 날짜에만")
+    schedule.add_argument('--output-dir', default='scheduled_results', help="결과 저장 폴더")
+    schedule.add_argument('--format', choices=OUTPUT_FORMATS, default='.xlsx', help="결과 파일 형식")
+    schedule.add_argument('--run-now', action='store_true', help="등록 직후 한 번 실행")
+    schedule.set_defaults(func=command_schedule)
+
+    monitor = commands.add_parser('monitor', help="키워드/가격 변동 모니터링")
+    monitor.add_argument('url', nargs='?', help="키워드/가격 변동을 확인할 페이지")
+    monitor.add_argument('--keyword', action='append', default=[], help="알림 키워드 (여러 번 지정 가능)")
+    monitor.add_argument('--threshold', type=float, default=10.0, help="가격 변동 알림 기준(%%)")
+    monitor.add_argument('--items', help="가격 모니터링 목록 JSON (GUI에서 저장한 형식, 확인 결과를 다시 저장)")
+    monitor.add_argument('--interval', type=int, default=300, help="확인 간격(초)")
+    monitor.add_argument('--parser', choices=PARSER_CHOICES, default='auto', help="HTML 파서")
+    monitor.add_argument('--once', action='store_true', help="한 번만 확인하고 종료")
+    monitor.set_defaults(func=command_monitor)
+
+    return parser
+
+
+def run_cli(argv=None):
+    """CLI 진입점. 종료 코드를 반환합니다."""
+    args = build_parser().parse_args(argv)
+
+    # 결과(JSON Lines/알림)만 stdout에 쓰고 엔진의 [DEBUG] 출력은 stderr로
+    args.stdout = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(run_cli())
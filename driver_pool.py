@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Selenium WebDriver 풀
+헤드리스 Chrome을 미리 띄워 두고 크롤링/스케줄 작업이 빌려 쓰도록 합니다.
+드라이버 바이너리 경로는 한 번만 확인하고, 상태 확인에 실패하거나
+일정 페이지 수/JS 메모리 증가를 넘긴 드라이버는 새로 교체합니다.
+"""
+
+import atexit
+import threading
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from http_session import DEFAULT_USER_AGENT
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path():
+    """ChromeDriver 경로를 확인합니다. (프로세스당 한 번만 다운로드/조회)"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
+def default_chrome_options():
+    """크롤링용 헤드리스 Chrome 옵션"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")  # 백그라운드 실행
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument(f"--user-agent={DEFAULT_USER_AGENT}")
+    return chrome_options
+
+
+def create_chrome_driver():
+    """새 헤드리스 Chrome 드라이버를 생성합니다."""
+    service = Service(resolve_driver_path())
+    driver = webdriver.Chrome(service=service, options=default_chrome_options())
+    driver.set_page_load_timeout(30)
+
+    # 자동화 감지 방지
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+class DriverLease:
+    """풀에서 빌린 드라이버와 사용 기록"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.time()
+        self.pages = 0
+        self.baseline_heap = None
+        self.discard = False
+
+    def record_page(self):
+        """드라이버로 페이지 하나를 처리했음을 기록합니다."""
+        self.pages += 1
+
+
+class SeleniumDriverPool:
+    """재사용 가능한 Selenium 드라이버 풀"""
+
+    def __init__(self, size=1, max_pages=200, max_heap_growth_mb=300, driver_factory=None):
+        self.size = max(1, int(size))
+        self.max_pages = max_pages                    # 이 페이지 수를 넘으면 교체
+        self.max_heap_growth_mb = max_heap_growth_mb  # JS 힙이 이만큼 늘어나면 교체
+        self.driver_factory = driver_factory or create_chrome_driver
+
+        self._idle = []
+        self._leased = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout=None):
+        """드라이버를 빌립니다. 모두 사용 중이면 반납될 때까지 기다립니다."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        lease = None
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("드라이버 풀이 종료되었습니다.")
+
+                # 대기 중인 드라이버를 꺼내거나 새로 만들 자리를 예약
+                if self._idle:
+                    lease = self._idle.pop()
+                    self._leased += 1
+                    break
+                if self._leased < self.size:
+                    self._leased += 1
+                    break
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("사용 가능한 드라이버가 없습니다.")
+                self._condition.wait(remaining)
+
+        # 상태 확인(WebDriver 왕복)은 잠금 밖에서 - 응답이 느려도 다른 스레드의 반납/대여를 막지 않음
+        if lease is not None:
+            if self.is_healthy(lease):
+                return lease
+            print("[DEBUG] 응답 없는 드라이버 교체")
+            self._quit(lease)  # 예약한 자리에 새 드라이버 생성
+
+        # 브라우저 실행은 잠금 밖에서 (수 초 소요)
+        try:
+            lease = DriverLease(self.driver_factory())
+        except Exception:
+            with self._condition:
+                self._leased -= 1
+                self._condition.notify()
+            raise
+
+        lease.baseline_heap = self.js_heap_size(lease)
+        return lease
+
+    def release(self, lease):
+        """드라이버를 반납합니다. 교체 대상이면 종료하고, 아니면 상태를 초기화해 보관합니다."""
+        keep = not lease.discard and not self.needs_recycle(lease) and self.reset(lease)
+
+        with self._condition:
+            self._leased -= 1
+            if keep and not self._closed:
+                self._idle.append(lease)
+                lease = None
+            self._condition.notify()
+
+        if lease is not None:
+            self._quit(lease)
+
+    def is_healthy(self, lease):
+        """드라이버가 응답하는지 확인합니다."""
+        try:
+            lease.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def js_heap_size(self, lease):
+        """현재 JS 힙 사용량(바이트)을 반환합니다. (지원하지 않으면 None)"""
+        try:
+            return lease.driver.execute_script(
+                "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null"
+            )
+        except Exception:
+            return None
+
+    def needs_recycle(self, lease):
+        """페이지 수 또는 메모리 증가 기준으로 교체가 필요한지 판단합니다."""
+        if self.max_pages and lease.pages >= self.max_pages:
+            print(f"[DEBUG] 드라이버 교체 (처리 페이지 {lease.pages}개)")
+            return True
+
+        if self.max_heap_growth_mb and lease.baseline_heap:
+            heap = self.js_heap_size(lease)
+            if heap and (heap - lease.baseline_heap) / (1024 * 1024) > self.max_heap_growth_mb:
+                print(f"[DEBUG] 드라이버 교체 (JS 힙 {heap / (1024 * 1024):.0f}MB)")
+                return True
+        return False
+
+    def reset(self, lease):
+        """다음 작업을 위해 쿠키와 페이지를 초기화합니다."""
+        try:
+            lease.driver.delete_all_cookies()
+            lease.driver.get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, lease):
+        try:
+            lease.driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """대기 중인 드라이버를 모두 종료합니다. 사용 중인 드라이버는 반납 시 종료됩니다."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+
+        for lease in idle:
+            self._quit(lease)
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_shared_driver_pool(size=1):
+    """크롤링과 스케줄 작업이 함께 사용하는 드라이버 풀을 반환합니다."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = SeleniumDriverPool(size=size)
+            atexit.register(_shared_pool.close)
+        return _shared_pool
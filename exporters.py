@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+결과 내보내기
+모든 형식을 결과 저장소에서 일정 개수(chunk_size)씩 읽어 파일에 바로 기록하므로,
+수십만~수백만 행도 일정한 메모리로 저장할 수 있습니다.
+
+- Excel (.xlsx): openpyxl 쓰기 전용(write-only) 워크시트
+- CSV (.csv, .csv.gz, .csv.zst): csv 모듈, gzip 또는 zstd(zstandard 설치 시) 압축
+- JSON Lines (.jsonl, .ndjson, .jsonl.gz): 레코드당 한 줄
+- JSON (.json): 레코드당 한 줄인 배열 (들여쓰기 없음)
+- Parquet (.parquet): pyarrow 설치 시, 청크마다 행 그룹 하나
+
+fields로 내보낼 필드를 고를 수 있으며, 지정하지 않으면 레코드 필드(crawl_record.FIELDS) 전체에
+앞부분 표본(sample_size행)에 나온 추가 키를 덧붙여 열을 정합니다.
+(표본 뒤에 처음 나온 추가 키만 저장하지 않습니다)
+"""
+
+import gzip
+import importlib.util
+import io
+import json
+from itertools import chain, islice
+
+from crawl_record import FIELDS, record_to_dict
+from text_clean import clean_text, truncate_text
+
+SHEET_NAME = 'CrawlingResults'  # 시트명은 영문 (일부 Excel 버전 호환성)
+SAMPLE_SIZE = 1000              # 열 구성/너비 계산에 사용할 앞부분 행 수
+MAX_CELL_LENGTH = 32000         # Excel 셀 길이 제한 (32767자)
+CHUNK_SIZE = 5000               # 한 번에 기록할 행 수 (Parquet 행 그룹 크기)
+
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+ZSTD_AVAILABLE = importlib.util.find_spec('zstandard') is not None
+
+# 확장자: (설명, 사용 가능 여부) - 긴 확장자를 먼저 검사
+EXPORT_FORMATS = {
+    '.xlsx': ('Excel 파일', True),
+    '.csv': ('CSV 파일', True),
+    '.csv.gz': ('CSV 파일 (gzip 압축)', True),
+    '.csv.zst': ('CSV 파일 (zstd 압축)', ZSTD_AVAILABLE),
+    '.jsonl': ('JSON Lines 파일', True),
+    '.ndjson': ('JSON Lines 파일', True),
+    '.jsonl.gz': ('JSON Lines 파일 (gzip 압축)', True),
+    '.json': ('JSON 파일', True),
+    '.parquet': ('Parquet 파일', PARQUET_AVAILABLE),
+}
+
+# 헤더에 표시할 열 이름
+COLUMN_LABELS = {
+    'type': '타입',
+    'title': '제목/텍스트',
+    'price': '가격',
+    'url': 'URL',
+    'image_url': '이미지 URL',
+    'description': '설명',
+    'tags': '태그'
+}
+
+def clean_cell_value(value):
+    """셀 값 정리 (유니코드 정규화, 제어문자 제거, 공백 정리, 길이 제한)"""
+    if isinstance(value, (list, tuple, set)):
+        value = ', '.join(str(item) for item in value)
+    if not isinstance(value, str):
+        return value
+
+    return truncate_text(clean_text(value), MAX_CELL_LENGTH)
+
+
+def display_width(value):
+    """화면 표시 폭 (한글 등 비ASCII 문자는 2칸)"""
+    if value is None:
+        return 0
+    return sum(2 if ord(char) > 127 else 1 for char in str(value))
+
+
+def sample_columns(rows):
+    """열 순서: 레코드 필드 전체(FIELDS) + 표본 행에 나온 추가 키 (처음 나온 순서)"""
+    columns = list(FIELDS)
+    for row in rows:
+        for key in row:
+            if key not in columns:
+                columns.append(key)
+    return columns
+
+
+def export_format(path):
+    """파일 경로의 내보내기 형식(확장자)을 반환합니다. 지원하지 않으면 None"""
+    lower = path.lower()
+    for extension in sorted(EXPORT_FORMATS, key=len, reverse=True):
+        if lower.endswith(extension):
+            return extension
+    return None
+
+
+def available_formats():
+    """현재 환경에서 사용할 수 있는 내보내기 형식 목록"""
+    return [extension for extension, (_, available) in EXPORT_FORMATS.items() if available]
+
+
+def iter_chunks(rows, chunk_size=CHUNK_SIZE):
+    """반복 가능 객체를 chunk_size개씩 목록으로 나눕니다."""
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def project(row, fields):
+    """dict 레코드에서 fields만 골라 순서대로 담은 dict (없는 필드는 None)"""
+    return {field: row.get(field) for field in fields}
+
+
+def text_value(value):
+    """CSV/Parquet 셀 문자열 (목록은 쉼표로 연결, None은 그대로)"""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple, set)):
+        return ', '.join(str(item) for item in value)
+    return str(value)
+
+
+def _dict_rows(records, fields, sample_size):
+    """(열 목록, dict 행 반복자) - fields가 없으면 FIELDS + 앞부분 표본의 추가 키"""
+    rows = (record_to_dict(record) for record in records)
+    if fields is not None:
+        return list(fields), rows
+    sample = list(islice(rows, sample_size))
+    return sample_columns(sample), chain(sample, rows)
+
+
+def _open_text(path, compression=None, encoding='utf-8'):
+    """압축 방식에 맞는 텍스트 쓰기 파일을 엽니다. (compression: None, 'gzip', 'zstd')"""
+    if compression == 'gzip':
+        return gzip.open(path, 'wt', encoding=encoding, newline='', compresslevel=6)
+    if compression == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstd 압축에는 zstandard 패키지가 필요합니다. (pip install zstandard)")
+        import zstandard
+        raw = open(path, 'wb')
+        writer = zstandard.ZstdCompressor(level=3).stream_writer(raw)
+        return io.TextIOWrapper(writer, encoding=encoding, newline='')
+    return open(path, 'w', encoding=encoding, newline='')
+
+
+def write_csv(records, path, fields=None, compression=None, chunk_size=CHUNK_SIZE, sample_size=SAMPLE_SIZE):
+    """레코드를 CSV로 청크 단위 저장하고 기록한 행 수를 반환합니다.
+    엑셀에서 한글이 깨지지 않도록 BOM(utf-8-sig)을 포함합니다.
+    """
+    import csv
+
+    columns, rows = _dict_rows(records, fields, sample_size)
+    count = 0
+    with _open_text(path, compression, encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for chunk in iter_chunks(rows, chunk_size):
+            writer.writerows([['' if row.get(key) is None else text_value(row.get(key)) for key in columns]
+                              for row in chunk])
+            count += len(chunk)
+    return count
+
+
+def write_ndjson(records, path, fields=None, compression=None, chunk_size=CHUNK_SIZE):
+    """레코드를 JSON Lines(레코드당 한 줄)로 청크 단위 저장하고 기록한 행 수를 반환합니다."""
+    rows = (record_to_dict(record) for record in records)
+    if fields is not None:
+        rows = (project(row, fields) for row in rows)
+
+    count = 0
+    with _open_text(path, compression) as f:
+        for chunk in iter_chunks(rows, chunk_size):
+            f.write(''.join(json.dumps(row, ensure_ascii=False, default=str) + '\n' for row in chunk))
+            count += len(chunk)
+    return count
+
+
+def write_json(records, path, fields=None, chunk_size=CHUNK_SIZE):
+    """레코드를 JSON 배열(레코드당 한 줄, 들여쓰기 없음)로 청크 단위 저장하고 기록한 행 수를 반환합니다."""
+    rows = (record_to_dict(record) for record in records)
+    if fields is not None:
+        rows = (project(row, fields) for row in rows)
+
+    count = 0
+    with _open_text(path) as f:
+        f.write('[')
+        for chunk in iter_chunks(rows, chunk_size):
+            lines = (json.dumps(row, ensure_ascii=False, default=str) for row in chunk)
+            f.write((',' if count else '') + '\n' + ',\n'.join(lines))
+            count += len(chunk)
+        f.write('\n]\n')
+    return count
+
+
+def write_parquet(records, path, fields=None, chunk_size=CHUNK_SIZE, sample_size=SAMPLE_SIZE):
+    """레코드를 Parquet로 저장하고 기록한 행 수를 반환합니다. (pyarrow 필요)
+    모든 열은 문자열(목록은 쉼표로 연결)이며, chunk_size행마다 행 그룹 하나를 기록합니다.
+    """
+    if not PARQUET_AVAILABLE:
+        raise RuntimeError("Parquet 내보내기에는 pyarrow 패키지가 필요합니다. (pip install pyarrow)")
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns, rows = _dict_rows(records, fields, sample_size)
+    schema = pa.schema([(key, pa.string()) for key in columns])
+    count = 0
+    with pq.ParquetWriter(path, schema, compression='zstd') as writer:
+        for chunk in iter_chunks(rows, chunk_size):
+            data = {key: [text_value(row.get(key)) for row in chunk] for key in columns}
+            writer.write_table(pa.Table.from_pydict(data, schema=schema))
+            count += len(chunk)
+    return count
+
+
+def export_records(records, path, fields=None, labels=False):
+    """파일 확장자에 맞는 형식으로 레코드를 저장하고 기록한 행 수를 반환합니다.
+
+    fields: 내보낼 필드 목록 (없으면 전체)
+    labels: Excel 헤더에 한글 열 이름 사용
+    """
+    extension = export_format(path)
+    if extension is None:
+        raise ValueError(f"지원하지 않는 출력 형식: {path} ({', '.join(EXPORT_FORMATS)})")
+
+    if extension == '.xlsx':
+        return write_excel(records, path, columns=fields, labels=labels)
+    if extension.startswith('.csv'):
+        compression = {'.csv.gz': 'gzip', '.csv.zst': 'zstd'}.get(extension)
+        return write_csv(records, path, fields, compression)
+    if extension in ('.jsonl', '.ndjson', '.jsonl.gz'):
+        return write_ndjson(records, path, fields, 'gzip' if extension.endswith('.gz') else None)
+    if extension == '.json':
+        return write_json(records, path, fields)
+    return write_parquet(records, path, fields)
+
+
+def write_excel(records, path, sheet_name=SHEET_NAME, sample_size=SAMPLE_SIZE, columns=None, labels=True):
+    """레코드를 xlsx 파일로 스트리밍 저장하고 기록한 행 수를 반환합니다.
+
+    records: CrawlRecord/dict 반복 가능 객체 (결과 저장소 포함)
+    columns: 열 키 목록 (없으면 FIELDS + 표본의 추가 키)
+    labels: True이면 헤더에 COLUMN_LABELS의 한글 이름 사용
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment
+    from openpyxl.utils import get_column_letter
+
+    rows = (record_to_dict(record) for record in records)
+    sample = list(islice(rows, sample_size))
+    if columns is None:
+        columns = sample_columns(sample)
+    headers = [COLUMN_LABELS.get(key, key) if labels else key for key in columns]
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(sheet_name)
+
+    # 열 너비는 표본으로 계산 (최소 8, 최대 60) - 행을 쓰기 전에 지정해야 함
+    for index, key in enumerate(columns, 1):
+        widths = [display_width(headers[index - 1])]
+        widths.extend(display_width(clean_cell_value(row.get(key))) for row in sample)
+        worksheet.column_dimensions[get_column_letter(index)].width = min(max(max(widths) * 0.8, 8), 60)
+
+    # 헤더 행 스타일
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    header_alignment = Alignment(horizontal="center", vertical="center")
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(worksheet, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_alignment
+        header_cells.append(cell)
+    worksheet.append(header_cells)
+
+    count = 0
+    for row in sample:
+        worksheet.append([clean_cell_value(row.get(key)) for key in columns])
+        count += 1
+    for row in rows:
+        worksheet.append([clean_cell_value(row.get(key)) for key in columns])
+        count += 1
+
+    workbook.save(path)
+    return count
@@ -1,56 +1,41 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
-import requests
-from bs4 import BeautifulSoup
+import sys
 import threading
-from urllib.parse import urljoin, urlparse
-import pandas as pd
+import importlib.util
 from datetime import datetime, timedelta
 import os
 import time
 import re
-import unicodedata
-import json
-import pickle
 import smtplib
 import email.mime.text
 import email.mime.multipart
 MimeText = email.mime.text.MIMEText
 MimeMultipart = email.mime.multipart.MIMEMultipart
-import schedule
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 
-# 선택적 import (없어도 프로그램 실행 가능)
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.font_manager as fm
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    import seaborn as sns
-    CHART_AVAILABLE = True
-except ImportError:
-    CHART_AVAILABLE = False
+from http_session import HttpSessionManager
+from resource_blocking import PROFILE_CHOICES
+from rate_limiter import shared_rate_limiter
+from retry_policy import RetryPolicy
+from response_cache import get_shared_cache
+from result_store import create_result_store
+from exporters import EXPORT_FORMATS, available_formats, export_records, write_excel
+from ui_bridge import UiUpdateQueue, TreeviewBatchSink
+from async_engine import ASYNC_PLAYWRIGHT_AVAILABLE
+from crawl_engine import (CrawlConfig, CrawlEngine, PageMonitor, generate_page_url, page_records, extract_number,
+                          write_checkpoint, read_checkpoint, remove_checkpoint)
+from page_extractor import link_display_text, page_strainer, resolve_parser, PARSER_CHOICES
 
-try:
-    from plyer import notification
-    NOTIFICATION_AVAILABLE = True
-except ImportError:
-    NOTIFICATION_AVAILABLE = False
+# 선택적 패키지 (없어도 프로그램 실행 가능)
+# pandas, matplotlib, selenium, playwright, apscheduler, plyer는 시작 시간을 줄이기 위해
+# 처음 사용할 때 불러오고, 여기서는 설치 여부만 확인합니다.
+def module_available(*names):
+    """모듈을 import하지 않고 설치 여부만 확인합니다."""
+    return all(importlib.util.find_spec(name) is not None for name in names)
 
-# Playwright 관련 import (선택적)
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+CHART_AVAILABLE = module_available('matplotlib', 'seaborn')
+NOTIFICATION_AVAILABLE = module_available('plyer')
+PLAYWRIGHT_AVAILABLE = module_available('playwright')
 
 class WebCrawlerApp:
     def __init__(self, root):
@@ -109,8 +94,10 @@ class WebCrawlerApp:
         browser_modes = ["requests", "selenium"]
         if PLAYWRIGHT_AVAILABLE:
             browser_modes.append("playwright")
+        if ASYNC_PLAYWRIGHT_AVAILABLE:
+            browser_modes.append("playwright-async")
         
-        browser_combo = ttk.Combobox(advanced_frame, textvariable=self.browser_mode, values=browser_modes, width=12)
+        browser_combo = ttk.Combobox(advanced_frame, textvariable=self.browser_mode, values=browser_modes, width=16)
         browser_combo.grid(row=0, column=1, sticky=tk.W, padx=(5, 10))
         
         # 페이지 수
@@ -123,6 +110,17 @@ class WebCrawlerApp:
         self.crawl_delay = tk.StringVar(value="1")
         ttk.Entry(advanced_frame, textvariable=self.crawl_delay, width=5).grid(row=0, column=5, sticky=tk.W, padx=(5, 10))
         
+        # 동시 요청 수 (requests 모드는 작업자 수, Playwright 모드는 탭 수, 1이면 순차 크롤링)
+        ttk.Label(advanced_frame, text="동시 요청:").grid(row=0, column=6, sticky=tk.W)
+        self.concurrent_workers = tk.StringVar(value="1")
+        ttk.Entry(advanced_frame, textvariable=self.concurrent_workers, width=5).grid(row=0, column=7, sticky=tk.W, padx=(5, 10))
+        
+        # HTML 파서 (auto: lxml이 있으면 lxml)
+        ttk.Label(advanced_frame, text="파서:").grid(row=0, column=8, sticky=tk.W)
+        self.html_parser = tk.StringVar(value="auto")
+        ttk.Combobox(advanced_frame, textvariable=self.html_parser, values=PARSER_CHOICES, 
+                     width=10, state='readonly').grid(row=0, column=9, sticky=tk.W, padx=(5, 10))
+        
         # 사이트별 설정
         site_frame = ttk.Frame(options_frame)
         site_frame.grid(row=2, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=(5, 0))
@@ -133,6 +131,12 @@ class WebCrawlerApp:
                                 values=["일반", "네이버 쇼핑", "인스타그램", "부동산"], width=12)
         site_combo.grid(row=0, column=1, sticky=tk.W, padx=(5, 10))
         
+        # 브라우저 모드 리소스 차단 (auto: 사이트 종류별 기본 프로필)
+        ttk.Label(site_frame, text="리소스 차단:").grid(row=0, column=2, sticky=tk.W)
+        self.resource_blocking = tk.StringVar(value="auto")
+        ttk.Combobox(site_frame, textvariable=self.resource_blocking, values=PROFILE_CHOICES, 
+                     width=14, state='readonly').grid(row=0, column=3, sticky=tk.W, padx=(5, 10))
+        
         # 추출할 데이터 선택
         data_frame = ttk.Frame(options_frame)
         data_frame.grid(row=3, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=(5, 0))
@@ -206,15 +210,17 @@ class WebCrawlerApp:
         self.table_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.table_frame, text="결과 테이블")
         
-        # 테이블 뷰 생성
+        # 테이블 뷰 생성 (화면에 유지할 최대 행 수, 전체 데이터는 결과 저장소에 보관)
+        self.max_table_rows = 5000
         self.create_table_view()
         
         # 스마트 뷰 탭 (고급 기능)
         self.smart_view_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.smart_view_frame, text="🎯 스마트 뷰")
         
-        # 스마트 뷰어는 나중에 초기화
+        # 스마트 뷰어는 나중에 초기화 (탭이 보이지 않는 동안의 갱신은 탭을 열 때 반영)
         self.smart_viewer = None
+        self.smart_view_pending = False
         
         # 사이트 추천 탭
         self.recommend_frame = ttk.Frame(self.notebook)
@@ -233,17 +239,24 @@ class WebCrawlerApp:
         # 알림 설정 탭
         self.alert_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.alert_frame, text="알림 설정")
-        self.setup_alert_tab()
         
         # 데이터 분석 탭
         self.analysis_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.analysis_frame, text="데이터 분석")
-        self.setup_analysis_tab()
         
         # 스케줄링 탭
         self.schedule_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.schedule_frame, text="스케줄링")
-        self.setup_schedule_tab()
+        
+        # 처음 열 때 구성하는 탭 (탭 프레임 이름 -> 구성 메서드)
+        self.lazy_tabs = {
+            str(self.recommend_frame): self.load_static_content,
+            str(self.tech_frame): self.load_static_content,
+            str(self.alert_frame): self.setup_alert_tab,
+            str(self.analysis_frame): self.setup_analysis_tab,
+            str(self.schedule_frame): self.setup_schedule_tab
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         
         # 상태 표시줄
         self.status_var = tk.StringVar(value="준비")
@@ -269,15 +282,50 @@ class WebCrawlerApp:
         
         # 크롤링 상태 및 데이터 저장용 변수
         self.is_crawling = False
-        self.crawled_data = []
-        self.driver = None
-        self.playwright = None
-        self.browser = None
-        self.page = None
+        # 결과 저장소 (crawled_data로도 접근, 크롤링 스레드에서 추가하면 일정 개수씩 묶어 기록)
+        # 프로세스별 임시 파일을 사용하며 창을 닫을 때 닫고 삭제함
+        self.result_store_backend = "sqlite"
+        self.result_store = create_result_store(self.result_store_backend)
+        self.crawled_data = []  # 같은 PID로 남은 이전 파일이 있으면 비움
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.driver_pool_size = 1  # 동시에 유지할 헤드리스 Chrome 수
+        self.crawl_engine = None     # 모든 브라우저 모드가 사용하는 UI 독립 엔진
+        self.crawl_config = None     # 크롤링 시작 시 Tk 변수 값을 옮겨 담은 CrawlConfig
+        self.async_concurrency = 24  # 비동기 Playwright 모드의 동시 페이지(탭) 수
         self.current_page = 1
         self.retry_count = 0
         self.max_retries = 3
         
+        # 재시도 정책 (오류 분류 + 지수 백오프 + Retry-After, 모든 엔진 공통)
+        self.retry_policy = RetryPolicy(max_retries=self.max_retries)
+        
+        # HTTP 세션 풀 설정 (엔진이 크롤링마다 새로 생성, 크롤링 종료 시 정리)
+        self.http_pool_size = 10
+        self.http_per_host = False
+        self.http_keep_alive = True
+        
+        # 동시 크롤링 시 호스트별 동시 요청 수 제한
+        self.max_requests_per_host = 2
+        
+        # 도메인별 요청 속도 제한 (모든 엔진과 가격 모니터가 공유하는 토큰 버킷)
+        self.rate_limiter = shared_rate_limiter
+        self.rate_burst = 1
+        
+        # 알림 모니터링용 세션 (모니터링 주기 동안 재사용)
+        self.monitor_sessions = HttpSessionManager(pool_size=2)
+        
+        # HTML 파싱/추출 설정 (크롤링 시작 시 갱신, 작업 스레드는 이 사본만 사용)
+        self.parse_options = {'parser': None, 'parse_only': None}
+        self.extract_options = {'extract_links': True, 'extract_images': True, 'extract_text': True}
+        
+        # 작업 스레드 → 메인 스레드 표시 배치 큐 (추출/렌더링은 작업 스레드에서)
+        self.ui_queue = UiUpdateQueue(self.root)
+        self.ui_queue.start()
+        
+        # 디스크 응답 캐시 (ETag/Last-Modified 조건부 재검증)
+        self.use_response_cache = True
+        self.response_cache = get_shared_cache()
+        
         # 알림 및 분석 관련 변수
         self.alert_settings = {
             'email_enabled': False,
@@ -285,16 +333,21 @@ class WebCrawlerApp:
             'price_threshold': 0,
             'keywords': []
         }
-        self.historical_data = []
+        # 키워드/가격 변동 모니터 (확인 기록은 historical_data로 공유)
+        self.page_monitor = PageMonitor(sessions=self.monitor_sessions, response_cache=self.response_cache)
+        self.historical_data = self.page_monitor.history
         self.monitoring_active = False
         
-        # 스케줄링 관련 변수
-        self.scheduler = BackgroundScheduler()
-        self.scheduler.start()
+        # 스케줄링 관련 변수 (스케줄러 스레드는 첫 스케줄을 추가할 때 시작)
+        self.scheduler = None
         self.scheduled_jobs = []
         
         # 중단점 재시작 관련 변수
-        self.checkpoint_file = "crawling_checkpoint.pkl"
+        self.checkpoint_file = "crawling_checkpoint.jsonl"      # 추가 전용 저널 (checkpoint_journal.py)
+        self.legacy_checkpoint_file = "crawling_checkpoint.pkl"  # 이전 버전의 pickle 체크포인트
+        # 크롤링/체크포인트 저장이 사용하므로 스케줄링 탭을 열기 전에도 있어야 함 (탭은 위젯만 연결)
+        self.auto_save = tk.BooleanVar(value=True)
+        self.checkpoint_status = tk.StringVar(value="체크포인트 없음")
         self.current_task = None
         self.task_progress = {
             'total_pages': 0,
@@ -303,9 +356,53 @@ class WebCrawlerApp:
             'current_url': '',
             'settings': {}
         }
+    
+    def on_tab_changed(self, event=None):
+        """탭을 처음 열 때 내용을 구성하고, 미뤄 둔 스마트 뷰 갱신을 반영합니다."""
+        selected = self.notebook.select()
+        self.ensure_tab(selected)
         
-        # 탭 내용 초기화
-        self.load_static_content()
+        if selected == str(self.smart_view_frame) and self.smart_view_pending:
+            self.update_smart_view()
+    
+    def ensure_tab(self, frame):
+        """아직 구성하지 않은 탭이면 구성합니다. (메인 스레드에서 호출)"""
+        builder = self.lazy_tabs.pop(str(frame), None)
+        if builder is None:
+            return
+        
+        # 같은 메서드로 구성하는 다른 탭도 완료 처리 (사이트 추천/기술스택 가이드)
+        for key in [key for key, other in self.lazy_tabs.items() if other == builder]:
+            del self.lazy_tabs[key]
+        builder()
+    
+    @property
+    def crawled_data(self):
+        """크롤링 결과 저장소 (목록처럼 append/extend/len/반복 가능)"""
+        return self.result_store
+    
+    @crawled_data.setter
+    def crawled_data(self, records):
+        """저장소 내용을 주어진 레코드로 바꿉니다. (빈 목록이면 초기화)"""
+        if records is self.result_store:
+            return
+        self.result_store.clear()
+        self.result_store.extend(records)
+    
+    def on_closing(self):
+        """창을 닫을 때 진행 중인 크롤링을 멈추고 결과 저장소를 닫습니다."""
+        if self.is_crawling:
+            self.stop_crawling()
+        self.result_store.close()
+        self.root.destroy()
+    
+    def get_scheduler(self):
+        """스케줄러를 반환합니다. 처음 호출할 때 생성하고 스레드를 시작합니다."""
+        if self.scheduler is None:
+            from apscheduler.schedulers.background import BackgroundScheduler
+            self.scheduler = BackgroundScheduler()
+            self.scheduler.start()
+        return self.scheduler
     
     def setup_alert_tab(self):
         """알림 설정 탭을 구성합니다."""
@@ -514,8 +611,7 @@ class WebCrawlerApp:
         recovery_frame = ttk.LabelFrame(scrollable_frame, text="복구 기능", padding="10")
         recovery_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(0, 10), padx=10)
         
-        # 체크포인트 상태
-        self.checkpoint_status = tk.StringVar(value="체크포인트 없음")
+        # 체크포인트 상태 (변수는 __init__에서 생성)
         ttk.Label(recovery_frame, textvariable=self.checkpoint_status).grid(row=0, column=0, columnspan=2, pady=5)
         
         # 복구 버튼
@@ -525,8 +621,7 @@ class WebCrawlerApp:
         ttk.Button(recovery_control, text="마지막 작업 복구", command=self.restore_last_task).grid(row=0, column=0, padx=(0, 5))
         ttk.Button(recovery_control, text="체크포인트 삭제", command=self.clear_checkpoint).grid(row=0, column=1, padx=(5, 0))
         
-        # 자동 저장 설정
-        self.auto_save = tk.BooleanVar(value=True)
+        # 자동 저장 설정 (변수는 __init__에서 생성)
         ttk.Checkbutton(recovery_frame, text="자동 체크포인트 저장", 
                        variable=self.auto_save).grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=5)
         
@@ -705,41 +800,19 @@ class WebCrawlerApp:
         # 그리드 가중치 설정
         table_container.columnconfigure(0, weight=1)
         table_container.rowconfigure(0, weight=1)
+        
+        # 결과 행은 묶음으로 반영 (100ms 또는 500행마다, 최근 max_table_rows행만 화면에 유지)
+        self.table_sink = TreeviewBatchSink(self.root, self.tree, flush_interval=100,
+                                            batch_size=500, max_live_rows=self.max_table_rows)
     
     def stop_crawling(self):
         """크롤링을 중지합니다."""
         self.is_crawling = False
         self.status_var.set("크롤링 중지됨")
         
-        # Selenium 드라이버 정리
-        if self.driver:
-            try:
-                self.driver.quit()
-            except:
-                pass
-            self.driver = None
-        
-        # Playwright 정리
-        if self.page:
-            try:
-                self.page.close()
-            except:
-                pass
-            self.page = None
-        
-        if self.browser:
-            try:
-                self.browser.close()
-            except:
-                pass
-            self.browser = None
-        
-        if self.playwright:
-            try:
-                self.playwright.stop()
-            except:
-                pass
-            self.playwright = None
+        # 진행 중인 페이지 작업을 취소 (드라이버/브라우저/세션은 작업 스레드가 정리)
+        if self.crawl_engine is not None:
+            self.crawl_engine.stop()
     
     def start_crawling(self, scheduled=False):
         """백그라운드에서 크롤링을 시작합니다."""
@@ -769,6 +842,8 @@ class WebCrawlerApp:
         print(f"  - 브라우저 모드: {browser_mode}")
         print(f"  - 최대 페이지: {max_pages}")
         print(f"  - 크롤링 간격: {crawl_delay}초")
+        print(f"  - 동시 요청: {self.get_concurrent_workers()}")
+        print(f"  - HTML 파서: {resolve_parser(self.html_parser.get())}")
         print(f"  - 사이트 타입: {site_type}")
         
         self.current_task = {
@@ -776,6 +851,9 @@ class WebCrawlerApp:
             'browser_mode': browser_mode,
             'max_pages': max_pages,
             'crawl_delay': crawl_delay,
+            'workers': self.get_concurrent_workers(),
+            'html_parser': self.html_parser.get(),
+            'resource_blocking': self.resource_blocking.get(),
             'site_type': site_type,
             'started_at': datetime.now(),
             'scheduled': scheduled
@@ -816,16 +894,15 @@ class WebCrawlerApp:
             print(f"[DEBUG] 초기 체크포인트 저장 중...")
             self.save_checkpoint()
         
+        # 파서/추출 설정은 작업 스레드에서 Tk 변수를 읽지 않도록 미리 고정
+        self.parse_options = self.build_parse_options()
+        self.extract_options = self.extraction_options()
+        self.crawl_config = self.build_crawl_config(url)
+        
         # 백그라운드 스레드에서 크롤링 실행
         print(f"[DEBUG] 백그라운드 스레드 시작 - 모드: {browser_mode}")
         
-        if browser_mode == "selenium":
-            thread = threading.Thread(target=self.crawl_with_selenium_checkpoint, args=(url, scheduled))
-        elif browser_mode == "playwright":
-            thread = threading.Thread(target=self.crawl_with_playwright_checkpoint, args=(url, scheduled))
-        else:
-            thread = threading.Thread(target=self.crawl_website_checkpoint, args=(url, scheduled))
-        
+        thread = threading.Thread(target=self.crawl_website_checkpoint, args=(url, scheduled))
         thread.daemon = True
         thread.start()
         print(f"[DEBUG] 백그라운드 스레드 시작됨")
@@ -837,9 +914,8 @@ class WebCrawlerApp:
         self.images_text.delete(1.0, tk.END)
         self.content_text.delete(1.0, tk.END)
         
-        # 테이블 초기화
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # 테이블 초기화 (반영 대기 중인 행 포함)
+        self.table_sink.clear()
     
     def load_static_content(self):
         """정적인 탭 내용을 로드합니다."""
@@ -1028,186 +1104,112 @@ class WebCrawlerApp:
         self.recommend_text.config(state='disabled')
         self.tech_text.config(state='disabled')
     
-    def crawl_website(self, url):
-        """requests를 사용한 크롤링을 수행합니다."""
-        try:
-            max_pages = int(self.max_pages.get()) if self.max_pages.get().isdigit() else 1
-            delay = float(self.crawl_delay.get()) if self.crawl_delay.get().replace('.', '').isdigit() else 1
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            for page in range(1, max_pages + 1):
-                if not self.is_crawling:
-                    break
-                
-                self.current_page = page
-                self.root.after(0, lambda p=page: self.status_var.set(f"페이지 {p}/{max_pages} 크롤링 중..."))
-                
-                # 페이지별 URL 생성
-                page_url = self.generate_page_url(url, page)
-                
-                # 재시도 로직
-                success = False
-                for retry in range(self.max_retries):
-                    try:
-                        response = requests.get(page_url, headers=headers, timeout=10)
-                        response.raise_for_status()
-                        
-                        # 한글 인코딩 처리 개선
-                        if response.encoding == 'ISO-8859-1':
-                            # 잘못된 인코딩일 가능성이 높음
-                            response.encoding = response.apparent_encoding
-                        elif not response.encoding:
-                            # 인코딩이 감지되지 않은 경우
-                            response.encoding = 'utf-8'
-                        
-                        # 한글 사이트의 경우 추가 체크
-                        if 'charset=' in response.headers.get('content-type', '').lower():
-                            charset = response.headers.get('content-type', '').lower()
-                            if 'euc-kr' in charset:
-                                response.encoding = 'euc-kr'
-                            elif 'utf-8' in charset:
-                                response.encoding = 'utf-8'
-                        else:
-                            # apparent_encoding으로 자동 감지
-                            response.encoding = response.apparent_encoding or 'utf-8'
-                        
-                        # BeautifulSoup으로 파싱
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        # 결과 업데이트 (메인 스레드에서 실행)
-                        self.root.after(0, self.update_results, page_url, response, soup)
-                        
-                        success = True
-                        break
-                        
-                    except requests.exceptions.RequestException as e:
-                        self.root.after(0, lambda r=retry+1: self.status_var.set(f"요청 실패, 재시도 {r}/{self.max_retries}"))
-                        time.sleep(2)
-                    except Exception as e:
-                        self.root.after(0, lambda r=retry+1, err=str(e): self.status_var.set(f"오류 발생, 재시도 {r}/{self.max_retries}: {err[:50]}"))
-                        time.sleep(2)
-                
-                if not success:
-                    self.root.after(0, lambda p=page: self.status_var.set(f"페이지 {p} 크롤링 실패"))
-                
-                # 크롤링 간격
-                if page < max_pages and self.is_crawling:
-                    time.sleep(delay)
-            
-            self.root.after(0, self.finalize_crawling)
-            
-        except Exception as e:
-            self.root.after(0, self.show_error, f"크롤링 오류: {str(e)}")
-    
-    def update_results(self, url, response, soup):
-        """크롤링 결과를 UI에 업데이트합니다."""
-        try:
-            # 페이지 정보 - 한글 처리 개선
-            title = soup.find('title')
-            title_text = title.get_text(strip=True) if title else "제목 없음"
-            
-            # 제목 텍스트 정리
-            if title_text:
-                import unicodedata
-                title_text = unicodedata.normalize('NFC', title_text)
-                title_text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', title_text)
-                title_text = re.sub(r'\s+', ' ', title_text).strip()
-            
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            description = meta_desc.get('content', '설명 없음') if meta_desc else "설명 없음"
-            
-            # 설명 텍스트 정리
-            if description and description != '설명 없음':
-                description = unicodedata.normalize('NFC', description)
-                description = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', description)
-                description = re.sub(r'\s+', ' ', description).strip()
-            
-            info = f"제목: {title_text}\n"
-            info += f"URL: {url}\n"
+    def build_page_display(self, url, response, page_result, records=None):
+        """PageResult를 텍스트 탭 문자열과 테이블 행으로 만듭니다. (작업 스레드에서 실행)"""
+        options = self.extract_options
+        display = {
+            'title': page_result.title,
+            'links': '',
+            'images': '',
+            'content': '',
+            'records': records if records is not None else self.page_records(url, page_result)
+        }
+        
+        info = f"제목: {page_result.title}\n"
+        info += f"URL: {url}\n"
+        if response is not None:  # 브라우저 모드는 HTTP 응답 정보 없음
             info += f"상태 코드: {response.status_code}\n"
             info += f"콘텐츠 타입: {response.headers.get('content-type', '알 수 없음')}\n"
             info += f"콘텐츠 크기: {len(response.content)} bytes\n"
-            info += f"설명: {description}\n"
-            
-            self.info_text.insert(tk.END, info)
-            
-            # 링크 추출
-            if self.extract_links.get():
-                links = soup.find_all('a', href=True)
-                self.links_text.insert(tk.END, f"총 {len(links)}개의 링크를 발견했습니다:\n\n")
-                
-                for i, link in enumerate(links[:50], 1):  # 최대 50개만 표시
-                    href = link['href']
-                    text = link.get_text(strip=True)
-                    
-                    # 링크 텍스트 정리
-                    if text:
-                        text = unicodedata.normalize('NFC', text)
-                        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
-                        text = re.sub(r'\s+', ' ', text).strip()
-                        # 너무 긴 텍스트는 제한
-                        if len(text) > 100:
-                            text = text[:100] + "..."
-                    else:
-                        text = "(텍스트 없음)"
-                    
-                    full_url = urljoin(url, href)
-                    self.links_text.insert(tk.END, f"{i}. {text}\n   URL: {full_url}\n\n")
-                
-                if len(links) > 50:
-                    self.links_text.insert(tk.END, f"... 그 외 {len(links) - 50}개 링크가 더 있습니다.")
-            
-            # 이미지 추출
-            if self.extract_images.get():
-                images = soup.find_all('img', src=True)
-                self.images_text.insert(tk.END, f"총 {len(images)}개의 이미지를 발견했습니다:\n\n")
-                
-                for i, img in enumerate(images[:30], 1):  # 최대 30개만 표시
-                    src = img['src']
-                    alt = img.get('alt', '대체 텍스트 없음')
-                    full_url = urljoin(url, src)
-                    self.images_text.insert(tk.END, f"{i}. {alt}\n   URL: {full_url}\n\n")
-                
-                if len(images) > 30:
-                    self.images_text.insert(tk.END, f"... 그 외 {len(images) - 30}개 이미지가 더 있습니다.")
-            
-            # 텍스트 내용 추출
-            if self.extract_text.get():
-                # 스크립트와 스타일 태그 제거
-                for script in soup(["script", "style"]):
-                    script.decompose()
-                
-                text = soup.get_text()
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                text = ' '.join(chunk for chunk in chunks if chunk)
-                
-                # 한글 텍스트 정리
-                import unicodedata
-                # 유니코드 정규화 (한글 호환성 문자 처리)
-                text = unicodedata.normalize('NFC', text)
-                # 제어 문자 제거
-                text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
-                # 연속된 공백 정리
-                text = re.sub(r'\s+', ' ', text).strip()
-                
-                # 텍스트 길이 제한
-                if len(text) > 5000:
-                    text = text[:5000] + "\n\n... (텍스트가 너무 길어 일부만 표시됩니다)"
-                
-                self.content_text.insert(tk.END, text)
+        info += f"설명: {page_result.description}\n"
+        display['info'] = info
+        
+        # 링크 목록
+        if options['extract_links']:
+            lines = [f"총 {page_result.link_count}개의 링크를 발견했습니다:\n\n"]
+            for i, (text, full_url) in enumerate(page_result.links, 1):
+                lines.append(f"{i}. {link_display_text(text)}\n   URL: {full_url}\n\n")
+            if page_result.link_count > len(page_result.links):
+                lines.append(f"... 그 외 {page_result.link_count - len(page_result.links)}개 링크가 더 있습니다.")
+            display['links'] = ''.join(lines)
+        
+        # 이미지 목록
+        if options['extract_images']:
+            lines = [f"총 {page_result.image_count}개의 이미지를 발견했습니다:\n\n"]
+            for i, (alt, full_url) in enumerate(page_result.images, 1):
+                lines.append(f"{i}. {alt}\n   URL: {full_url}\n\n")
+            if page_result.image_count > len(page_result.images):
+                lines.append(f"... 그 외 {page_result.image_count - len(page_result.images)}개 이미지가 더 있습니다.")
+            display['images'] = ''.join(lines)
+        
+        # 텍스트 내용 (길이 제한)
+        if options['extract_text']:
+            text = page_result.text
+            if len(text) > 5000:
+                text = text[:5000] + "\n\n... (텍스트가 너무 길어 일부만 표시됩니다)"
+            display['content'] = text
+        
+        return display
+    
+    def show_page_display(self, display):
+        """만들어진 표시 배치를 위젯에 반영합니다. (메인 스레드 전용)"""
+        try:
+            self.info_text.insert(tk.END, display['info'])
+            if display['links']:
+                self.links_text.insert(tk.END, display['links'])
+            if display['images']:
+                self.images_text.insert(tk.END, display['images'])
+            if display['content']:
+                self.content_text.insert(tk.END, display['content'])
             
-            # 테이블에 데이터 추가
-            self.populate_table(url, soup)
+            # 테이블에 데이터 추가 (저장소에는 작업 스레드에서 이미 추가됨)
+            self.show_records(display['records'])
             
-            self.status_var.set(f"크롤링 완료 - {title_text}")
+            self.status_var.set(f"크롤링 완료 - {display['title']}")
             
         except Exception as e:
             self.show_error(f"결과 처리 오류: {str(e)}")
     
+    def extraction_options(self):
+        """현재 추출 옵션을 extract_page 인자로 반환합니다."""
+        return {
+            'extract_links': self.extract_links.get(),
+            'extract_images': self.extract_images.get(),
+            'extract_text': self.extract_text.get()
+        }
+    
+    def build_crawl_config(self, url):
+        """현재 화면 설정을 UI 독립 엔진용 CrawlConfig로 옮겨 담습니다. (메인 스레드)"""
+        return CrawlConfig(
+            url,
+            browser_mode=self.browser_mode.get(),
+            max_pages=int(self.max_pages.get()) if self.max_pages.get().isdigit() else 1,
+            crawl_delay=self.get_crawl_delay(),
+            workers=self.get_concurrent_workers(),
+            html_parser=self.html_parser.get(),
+            resource_blocking=self.resource_blocking.get(),
+            site_type=self.site_type.get(),
+            extract_title=self.extract_title.get(),
+            extract_price=self.extract_price.get(),
+            max_retries=self.max_retries,
+            max_requests_per_host=self.max_requests_per_host,
+            rate_burst=self.rate_burst,
+            use_response_cache=self.use_response_cache,
+            http_pool_size=self.http_pool_size,
+            http_per_host=self.http_per_host,
+            http_keep_alive=self.http_keep_alive,
+            async_concurrency=self.async_concurrency,
+            driver_pool_size=self.driver_pool_size,
+            **self.extraction_options()
+        )
+    
+    def build_parse_options(self):
+        """선택한 파서와 추출 옵션에 맞는 SoupStrainer를 parse_html 인자로 반환합니다."""
+        return {
+            'parser': self.html_parser.get(),
+            'parse_only': page_strainer(**self.extraction_options())
+        }
+    
     def show_error(self, error_message):
         """오류 메시지를 표시합니다."""
         self.progress.stop()
@@ -1217,78 +1219,26 @@ class WebCrawlerApp:
         self.status_var.set("오류 발생")
         messagebox.showerror("크롤링 오류", error_message)
     
-    def populate_table(self, url, soup):
-        """테이블에 크롤링 결과를 추가합니다."""
+    def populate_table(self, url, page_result):
+        """크롤링 결과(PageResult)를 crawled_data와 테이블에 추가합니다."""
+        records = self.page_records(url, page_result)
+        self.crawled_data.extend(records)
+        self.show_records(records)
+    
+    def page_records(self, url, page_result):
+        """PageResult를 테이블/crawled_data용 레코드 목록으로 변환합니다."""
+        return page_records(url, page_result)
+    
+    def show_records(self, records):
+        """레코드를 테이블에 표시합니다. (메인 스레드 전용, crawled_data 추가는 호출한 쪽에서)"""
         try:
-            # 페이지 기본 정보
-            title = soup.find('title')
-            title_text = title.get_text(strip=True) if title else "제목 없음"
-            
-            # 페이지 정보 추가
-            page_data = {
-                'type': '페이지',
-                'title': title_text,
-                'url': url,
-                'description': '웹페이지 기본 정보'
-            }
-            self.tree.insert('', 'end', values=(page_data['type'], page_data['title'], 
-                                              page_data['url'], page_data['description']))
-            self.crawled_data.append(page_data)
-            
-            # 링크 정보 추가
-            if self.extract_links.get():
-                links = soup.find_all('a', href=True)
-                for i, link in enumerate(links[:50]):  # 최대 50개
-                    href = link['href']
-                    text = link.get_text(strip=True)
-                    
-                    # 링크 텍스트 정리
-                    if text:
-                        import unicodedata
-                        text = unicodedata.normalize('NFC', text)
-                        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
-                        text = re.sub(r'\s+', ' ', text).strip()
-                        # 길이 제한
-                        if len(text) > 100:
-                            text = text[:100] + "..."
-                    else:
-                        text = '(텍스트 없음)'
-                    
-                    full_url = urljoin(url, href)
-                    
-                    link_data = {
-                        'type': '링크',
-                        'title': text,
-                        'url': full_url,
-                        'description': f'링크 #{i+1}'
-                    }
-                    self.tree.insert('', 'end', values=(link_data['type'], link_data['title'], 
-                                                      link_data['url'], link_data['description']))
-                    self.crawled_data.append(link_data)
-            
-            # 이미지 정보 추가
-            if self.extract_images.get():
-                images = soup.find_all('img', src=True)
-                for i, img in enumerate(images[:30]):  # 최대 30개
-                    src = img['src']
-                    alt = img.get('alt', '대체 텍스트 없음')[:100]
-                    full_url = urljoin(url, src)
-                    
-                    img_data = {
-                        'type': '이미지',
-                        'title': alt,
-                        'url': full_url,
-                        'description': f'이미지 #{i+1}'
-                    }
-                    self.tree.insert('', 'end', values=(img_data['type'], img_data['title'], 
-                                                      img_data['url'], img_data['description']))
-                    self.crawled_data.append(img_data)
+            self.table_sink.add_many(records)
                     
         except Exception as e:
             print(f"테이블 채우기 오류: {str(e)}")
     
     def export_to_excel(self):
-        """크롤링 결과를 엑셀 파일로 저장합니다."""
+        """크롤링 결과를 엑셀 파일(또는 선택한 확장자의 CSV/JSON Lines/Parquet)로 저장합니다."""
         if not self.crawled_data:
             messagebox.showwarning("경고", "저장할 데이터가 없습니다.")
             return
@@ -1300,7 +1250,8 @@ class WebCrawlerApp:
             
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".xlsx",
-                filetypes=[("Excel 파일", "*.xlsx"), ("모든 파일", "*.*")],
+                filetypes=[(EXPORT_FORMATS[extension][0], f"*{extension}") for extension in available_formats()]
+                          + [("모든 파일", "*.*")],
                 initialvalue=default_filename,
                 title="크롤링 결과 저장"
             )
@@ -1311,85 +1262,8 @@ class WebCrawlerApp:
             # 한글 경로 처리를 위한 정규화
             file_path = os.path.normpath(file_path)
             
-            # DataFrame 생성 - 한글 데이터 처리 개선
-            processed_data = []
-            for item in self.crawled_data:
-                processed_item = {}
-                for key, value in item.items():
-                    # 텍스트 데이터 정리 및 인코딩 처리
-                    if isinstance(value, str):
-                        # 유니코드 정규화
-                        value = unicodedata.normalize('NFC', value)
-                        # 특수문자 및 제어문자 제거
-                        value = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', value)
-                        # 연속된 공백 정리
-                        value = re.sub(r'\s+', ' ', value).strip()
-                        # Excel 셀 길이 제한 (32767자)
-                        if len(value) > 32000:
-                            value = value[:32000] + "..."
-                    processed_item[key] = value
-                processed_data.append(processed_item)
-            
-            df = pd.DataFrame(processed_data)
-            df.columns = ['타입', '제목/텍스트', 'URL', '설명']
-            
-            # 엑셀 파일로 저장 - 한글 지원 강화
-            with pd.ExcelWriter(
-                file_path, 
-                engine='openpyxl'
-            ) as writer:
-                # 시트명을 영문으로 변경 (일부 Excel 버전 호환성)
-                sheet_name = 'CrawlingResults'
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-                
-                # 워크시트 가져오기 및 서식 설정
-                worksheet = writer.sheets[sheet_name]
-                
-                # 스타일 import를 try-except로 감싸서 오류 방지
-                try:
-                    from openpyxl.styles import Font, PatternFill, Alignment
-                    header_font = Font(bold=True, color="FFFFFF")
-                    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                    
-                    # 헤더 행 스타일 적용
-                    for cell in worksheet[1]:
-                        cell.font = header_font
-                        cell.fill = header_fill
-                        cell.alignment = Alignment(horizontal="center", vertical="center")
-                except ImportError:
-                    # 스타일 라이브러리를 불러올 수 없는 경우 무시
-                    pass
-                
-                # 컬럼 너비 자동 조정 - 한글 텍스트 고려
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if cell.value:
-                                # 한글 텍스트의 실제 표시 길이 계산
-                                text = str(cell.value)
-                                # 한글은 2배, 영문은 1배로 계산
-                                display_length = sum(2 if ord(char) > 127 else 1 for char in text)
-                                if display_length > max_length:
-                                    max_length = display_length
-                        except:
-                            pass
-                    
-                    # 최소 8, 최대 60으로 제한
-                    adjusted_width = min(max(max_length * 0.8, 8), 60)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-                # 행 높이 자동 조정
-                for row in worksheet.iter_rows():
-                    max_lines = 1
-                    for cell in row:
-                        if cell.value and isinstance(cell.value, str):
-                            lines = cell.value.count('\n') + 1
-                            max_lines = max(max_lines, lines)
-                    if max_lines > 1:
-                        worksheet.row_dimensions[row[0].row].height = max_lines * 15
+            # 결과 저장소를 일정 개수씩 읽어 파일에 바로 기록 (형식은 확장자로 결정)
+            row_count = export_records(self.crawled_data, file_path, labels=True)
             
             # 저장 완료 메시지 - 파일 크기 정보 추가
             file_size = os.path.getsize(file_path)
@@ -1405,7 +1279,7 @@ class WebCrawlerApp:
                 f"파일: {os.path.basename(file_path)}\n"
                 f"위치: {os.path.dirname(file_path)}\n"
                 f"크기: {size_str}\n"
-                f"데이터 수: {len(self.crawled_data)}개"
+                f"데이터 수: {row_count}개"
             )
             
         except UnicodeEncodeError as e:
@@ -1426,549 +1300,10 @@ class WebCrawlerApp:
                 f"2. 다른 폴더에 저장해보세요\n"
                 f"3. 프로그램을 관리자 권한으로 실행해보세요")
     
-    def setup_selenium_driver(self):
-        """Selenium WebDriver를 설정합니다."""
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")  # 백그라운드 실행
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            
-            # User-Agent 설정
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-            
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # 자동화 감지 방지
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            return True
-        except Exception as e:
-            self.root.after(0, self.show_error, f"Selenium 설정 오류: {str(e)}")
-            return False
-    
-    def setup_playwright_browser(self):
-        """Playwright 브라우저를 설정합니다."""
-        try:
-            if not PLAYWRIGHT_AVAILABLE:
-                self.root.after(0, self.show_error, "Playwright가 설치되지 않았습니다. pip install playwright 후 playwright install을 실행하세요.")
-                return False
-            
-            self.playwright = sync_playwright().start()
-            
-            # 브라우저 선택 (Chromium 기본)
-            self.browser = self.playwright.chromium.launch(
-                headless=True,  # 백그라운드 실행
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled'
-                ]
-            )
-            
-            # 컨텍스트 생성 (시크릿 모드와 유사)
-            context = self.browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                viewport={'width': 1920, 'height': 1080}
-            )
-            
-            # 페이지 생성
-            self.page = context.new_page()
-            
-            # 자동화 감지 방지
-            self.page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-            """)
-            
-            return True
-        except Exception as e:
-            self.root.after(0, self.show_error, f"Playwright 설정 오류: {str(e)}")
-            return False
-    
-    def crawl_with_selenium(self, url):
-        """Selenium을 사용한 크롤링을 수행합니다."""
-        if not self.setup_selenium_driver():
-            return
-        
-        try:
-            max_pages = int(self.max_pages.get()) if self.max_pages.get().isdigit() else 1
-            delay = float(self.crawl_delay.get()) if self.crawl_delay.get().replace('.', '').isdigit() else 1
-            
-            for page in range(1, max_pages + 1):
-                if not self.is_crawling:
-                    break
-                
-                self.current_page = page
-                self.root.after(0, lambda p=page: self.status_var.set(f"페이지 {p}/{max_pages} 크롤링 중..."))
-                
-                # 페이지별 URL 생성
-                page_url = self.generate_page_url(url, page)
-                
-                # 재시도 로직
-                success = False
-                for retry in range(self.max_retries):
-                    try:
-                        self.driver.get(page_url)
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.TAG_NAME, "body"))
-                        )
-                        
-                        # 사이트별 특화 크롤링
-                        if self.site_type.get() == "네이버 쇼핑":
-                            self.crawl_naver_shopping()
-                        elif self.site_type.get() == "인스타그램":
-                            self.crawl_instagram()
-                        elif self.site_type.get() == "부동산":
-                            self.crawl_real_estate()
-                        else:
-                            self.crawl_general_selenium()
-                        
-                        success = True
-                        break
-                        
-                    except TimeoutException:
-                        self.root.after(0, lambda r=retry+1: self.status_var.set(f"페이지 로딩 실패, 재시도 {r}/{self.max_retries}"))
-                        time.sleep(2)
-                    except Exception as e:
-                        self.root.after(0, lambda r=retry+1, err=str(e): self.status_var.set(f"오류 발생, 재시도 {r}/{self.max_retries}: {err[:50]}"))
-                        time.sleep(2)
-                
-                if not success:
-                    self.root.after(0, lambda p=page: self.status_var.set(f"페이지 {p} 크롤링 실패"))
-                
-                # 크롤링 간격
-                if page < max_pages and self.is_crawling:
-                    time.sleep(delay)
-            
-            self.root.after(0, self.finalize_crawling)
-            
-        except Exception as e:
-            self.root.after(0, self.show_error, f"Selenium 크롤링 오류: {str(e)}")
-        finally:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                except:
-                    pass
-                self.driver = None
-    
     def generate_page_url(self, base_url, page):
         """페이지 번호에 따른 URL을 생성합니다."""
-        if page == 1:
-            return base_url
-        
-        # 일반적인 페이지네이션 패턴들
-        if "?" in base_url:
-            return f"{base_url}&page={page}"
-        else:
-            return f"{base_url}?page={page}"
+        return generate_page_url(base_url, page)
     
-    def crawl_naver_shopping(self):
-        """네이버 쇼핑 크롤링"""
-        try:
-            # 상품 목록 요소 대기
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".basicList_list__2YY7H, .product_list, .list_basis"))
-            )
-            
-            # 상품 요소들 찾기
-            products = self.driver.find_elements(By.CSS_SELECTOR, ".basicList_item__1MBN3, .product_item, .item")
-            
-            for product in products:
-                if not self.is_crawling:
-                    break
-                
-                try:
-                    data = {'type': '네이버쇼핑'}
-                    
-                    # 제목 추출
-                    if self.extract_title.get():
-                        title_elem = product.find_element(By.CSS_SELECTOR, ".basicList_title__3P9Q7, .product_title, .item_title")
-                        data['title'] = title_elem.text.strip()
-                    
-                    # 가격 추출
-                    if self.extract_price.get():
-                        price_elem = product.find_element(By.CSS_SELECTOR, ".price_num__2WUXn, .product_price, .item_price")
-                        data['price'] = price_elem.text.strip()
-                    
-                    # 링크 추출
-                    link_elem = product.find_element(By.CSS_SELECTOR, "a")
-                    data['url'] = link_elem.get_attribute('href')
-                    
-                    # 이미지 추출
-                    if self.extract_images.get():
-                        img_elem = product.find_element(By.CSS_SELECTOR, "img")
-                        data['image_url'] = img_elem.get_attribute('src')
-                    
-                    data['description'] = f"네이버쇼핑 상품 (페이지 {self.current_page})"
-                    
-                    self.crawled_data.append(data)
-                    self.root.after(0, self.add_to_table, data)
-                    
-                except NoSuchElementException:
-                    continue
-                    
-        except TimeoutException:
-            self.root.after(0, lambda: self.status_var.set("네이버 쇼핑 요소를 찾을 수 없습니다"))
-    
-    def crawl_instagram(self):
-        """인스타그램 크롤링 (제한적)"""
-        try:
-            # 인스타그램은 로그인이 필요하므로 기본적인 메타데이터만 추출
-            posts = self.driver.find_elements(By.CSS_SELECTOR, "article, ._aagu, .v1Nh3")
-            
-            for i, post in enumerate(posts[:10]):  # 최대 10개만
-                if not self.is_crawling:
-                    break
-                
-                try:
-                    data = {'type': '인스타그램'}
-                    
-                    # 기본 정보
-                    data['title'] = f"Instagram Post {i+1}"
-                    data['url'] = self.driver.current_url
-                    data['description'] = f"인스타그램 게시물 (페이지 {self.current_page})"
-                    
-                    # 이미지 추출 시도
-                    if self.extract_images.get():
-                        try:
-                            img_elem = post.find_element(By.CSS_SELECTOR, "img")
-                            data['image_url'] = img_elem.get_attribute('src')
-                        except:
-                            pass
-                    
-                    self.crawled_data.append(data)
-                    self.root.after(0, self.add_to_table, data)
-                    
-                except:
-                    continue
-                    
-        except Exception as e:
-            self.root.after(0, lambda err=str(e): self.status_var.set(f"인스타그램 크롤링 제한: {err[:50]}"))
-    
-    def crawl_real_estate(self):
-        """부동산 사이트 크롤링"""
-        try:
-            # 부동산 매물 요소들 찾기
-            properties = self.driver.find_elements(By.CSS_SELECTOR, ".item, .list-item, .property-item, .estate-item")
-            
-            for prop in properties:
-                if not self.is_crawling:
-                    break
-                
-                try:
-                    data = {'type': '부동산'}
-                    
-                    # 제목 (주소/매물명)
-                    if self.extract_title.get():
-                        title_selectors = [".item-title", ".property-title", ".title", "h3", "h4"]
-                        for selector in title_selectors:
-                            try:
-                                title_elem = prop.find_element(By.CSS_SELECTOR, selector)
-                                data['title'] = title_elem.text.strip()
-                                break
-                            except:
-                                continue
-                    
-                    # 가격 추출
-                    if self.extract_price.get():
-                        price_selectors = [".price", ".cost", ".amount", ".fee"]
-                        for selector in price_selectors:
-                            try:
-                                price_elem = prop.find_element(By.CSS_SELECTOR, selector)
-                                data['price'] = price_elem.text.strip()
-                                break
-                            except:
-                                continue
-                    
-                    # 링크 추출
-                    try:
-                        link_elem = prop.find_element(By.CSS_SELECTOR, "a")
-                        data['url'] = link_elem.get_attribute('href')
-                    except:
-                        data['url'] = self.driver.current_url
-                    
-                    data['description'] = f"부동산 매물 (페이지 {self.current_page})"
-                    
-                    self.crawled_data.append(data)
-                    self.root.after(0, self.add_to_table, data)
-                    
-                except:
-                    continue
-                    
-        except Exception as e:
-            self.root.after(0, lambda err=str(e): self.status_var.set(f"부동산 크롤링 오류: {err[:50]}"))
-    
-    def crawl_general_selenium(self):
-        """일반적인 Selenium 크롤링"""
-        try:
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            
-            # 기존 populate_table 메서드 활용
-            self.root.after(0, self.populate_table, self.driver.current_url, soup)
-            
-        except Exception as e:
-            self.root.after(0, lambda err=str(e): self.status_var.set(f"일반 크롤링 오류: {err[:50]}"))
-    
-    def add_to_table(self, data):
-        """테이블에 개별 데이터를 추가합니다."""
-        try:
-            self.tree.insert('', 'end', values=(
-                data.get('type', ''),
-                data.get('title', '')[:100],
-                data.get('url', ''),
-                data.get('description', '')
-            ))
-        except Exception as e:
-            print(f"테이블 추가 오류: {str(e)}")
-    
-    def finalize_crawling(self):
-        """크롤링 완료 처리"""
-        self.progress.stop()
-        self.crawl_button.config(state='normal')
-        self.stop_button.config(state='disabled')
-        self.export_button.config(state='normal')
-        self.is_crawling = False
-        self.status_var.set(f"크롤링 완료 - 총 {len(self.crawled_data)}개 데이터 수집")
-
-    def crawl_with_playwright(self, url):
-        """Playwright를 사용한 크롤링을 수행합니다."""
-        try:
-            if not self.setup_playwright_browser():
-                return
-            
-            max_pages = int(self.max_pages.get()) if self.max_pages.get().isdigit() else 1
-            delay = float(self.crawl_delay.get()) if self.crawl_delay.get().replace('.', '').isdigit() else 1
-            
-            for page in range(1, max_pages + 1):
-                if not self.is_crawling:
-                    break
-                
-                self.current_page = page
-                self.root.after(0, lambda p=page: self.status_var.set(f"페이지 {p}/{max_pages} Playwright 크롤링 중..."))
-                
-                page_url = self.generate_page_url(url, page)
-                
-                success = False
-                for retry in range(self.max_retries):
-                    try:
-                        # 페이지 로드
-                        self.page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-                        
-                        # 네트워크 요청 완료까지 대기
-                        self.page.wait_for_load_state('networkidle', timeout=10000)
-                        
-                        # 추가 대기 (JavaScript 실행 완료)
-                        self.page.wait_for_timeout(2000)
-                        
-                        # 사이트별 특화 크롤링
-                        domain = urlparse(page_url).netloc.lower()
-                        if 'shopping.naver.com' in domain:
-                            self.crawl_naver_shopping_playwright()
-                        elif 'instagram.com' in domain:
-                            self.crawl_instagram_playwright()
-                        elif any(keyword in domain for keyword in ['zigbang', 'dabang', '부동산']):
-                            self.crawl_real_estate_playwright()
-                        else:
-                            self.crawl_general_playwright()
-                        
-                        success = True
-                        break
-                        
-                    except Exception as e:
-                        self.root.after(0, lambda r=retry+1, err=str(e): self.status_var.set(f"Playwright 오류, 재시도 {r}/{self.max_retries}: {err[:30]}"))
-                        time.sleep(2)
-                
-                if not success:
-                    self.root.after(0, lambda p=page: self.status_var.set(f"페이지 {p} Playwright 크롤링 실패"))
-                
-                if page < max_pages and self.is_crawling:
-                    time.sleep(delay)
-            
-            self.root.after(0, self.finalize_crawling)
-            
-        except Exception as e:
-            self.root.after(0, self.show_error, f"Playwright 크롤링 오류: {str(e)}")
-        finally:
-            # Playwright 정리
-            if self.page:
-                try:
-                    self.page.close()
-                except:
-                    pass
-                self.page = None
-            
-            if self.browser:
-                try:
-                    self.browser.close()
-                except:
-                    pass
-                self.browser = None
-            
-            if self.playwright:
-                try:
-                    self.playwright.stop()
-                except:
-                    pass
-                self.playwright = None
-    
-    def crawl_general_playwright(self):
-        """일반적인 Playwright 크롤링"""
-        try:
-            # 페이지 소스 가져오기
-            content = self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # 기존 populate_table 메서드 활용
-            self.root.after(0, self.populate_table, self.page.url, soup)
-            
-        except Exception as e:
-            self.root.after(0, lambda err=str(e): self.status_var.set(f"일반 Playwright 크롤링 오류: {err[:50]}"))
-    
-    def crawl_naver_shopping_playwright(self):
-        """네이버 쇼핑 Playwright 크롤링"""
-        try:
-            # 상품 목록 대기
-            self.page.wait_for_selector('.basicList_list_basis__uNBZx, .product_list, .goods_list', timeout=10000)
-            
-            # 상품 요소들 가져오기
-            products = self.page.query_selector_all('.basicList_item__FxDgW, .product_item, .goods_item')
-            
-            for i, product in enumerate(products[:20]):  # 최대 20개
-                if not self.is_crawling:
-                    break
-                
-                try:
-                    data = {'type': '네이버쇼핑'}
-                    
-                    # 상품명
-                    if self.extract_title.get():
-                        title_elem = product.query_selector('.basicList_title__3P9Q7, .product_title, .goods_name')
-                        if title_elem:
-                            data['title'] = title_elem.text_content().strip()
-                        else:
-                            data['title'] = f"상품 {i+1}"
-                    
-                    # 가격
-                    if self.extract_price.get():
-                        price_elem = product.query_selector('.price_num__2WUXn, .product_price, .price')
-                        if price_elem:
-                            data['price'] = price_elem.text_content().strip()
-                    
-                    # 상품 링크
-                    link_elem = product.query_selector('a')
-                    if link_elem:
-                        data['url'] = link_elem.get_attribute('href')
-                        if data['url'] and not data['url'].startswith('http'):
-                            data['url'] = 'https://shopping.naver.com' + data['url']
-                    else:
-                        data['url'] = self.page.url
-                    
-                    # 설명
-                    data['description'] = f"네이버 쇼핑 상품 (페이지 {self.current_page})"
-                    
-                    self.crawled_data.append(data)
-                    self.root.after(0, self.add_to_table, data)
-                    
-                except Exception:
-                    continue
-                    
-        except Exception as e:
-            self.root.after(0, lambda err=str(e): self.status_var.set(f"네이버 쇼핑 Playwright 크롤링 오류: {err[:50]}"))
-    
-    def crawl_instagram_playwright(self):
-        """인스타그램 Playwright 크롤링"""
-        try:
-            # 게시물 요소들 대기
-            self.page.wait_for_selector('article, ._aagu', timeout=10000)
-            
-            posts = self.page.query_selector_all('article, ._aagu')
-            
-            for i, post in enumerate(posts[:10]):  # 최대 10개
-                if not self.is_crawling:
-                    break
-                
-                try:
-                    data = {'type': '인스타그램'}
-                    data['title'] = f"Instagram Post {i+1}"
-                    data['url'] = self.page.url
-                    data['description'] = f"인스타그램 게시물 (페이지 {self.current_page})"
-                    
-                    # 이미지 URL 추출
-                    if self.extract_images.get():
-                        img_elem = post.query_selector('img')
-                        if img_elem:
-                            data['image_url'] = img_elem.get_attribute('src')
-                    
-                    self.crawled_data.append(data)
-                    self.root.after(0, self.add_to_table, data)
-                    
-                except Exception:
-                    continue
-                    
-        except Exception as e:
-            self.root.after(0, lambda err=str(e): self.status_var.set(f"인스타그램 Playwright 크롤링 오류: {err[:50]}"))
-    
-    def crawl_real_estate_playwright(self):
-        """부동산 사이트 Playwright 크롤링"""
-        try:
-            # 매물 목록 대기
-            self.page.wait_for_selector('.item, .property, .list-item', timeout=10000)
-            
-            properties = self.page.query_selector_all('.item, .property, .list-item')
-            
-            for i, prop in enumerate(properties[:15]):  # 최대 15개
-                if not self.is_crawling:
-                    break
-                
-                try:
-                    data = {'type': '부동산'}
-                    
-                    # 제목 (주소/매물명)
-                    if self.extract_title.get():
-                        title_elem = prop.query_selector('.item-title, .property-title, .title, h3, h4')
-                        if title_elem:
-                            data['title'] = title_elem.text_content().strip()
-                        else:
-                            data['title'] = f"매물 {i+1}"
-                    
-                    # 가격
-                    if self.extract_price.get():
-                        price_elem = prop.query_selector('.price, .item-price, .property-price')
-                        if price_elem:
-                            data['price'] = price_elem.text_content().strip()
-                    
-                    # 매물 링크
-                    link_elem = prop.query_selector('a')
-                    if link_elem:
-                        data['url'] = link_elem.get_attribute('href')
-                        if data['url'] and not data['url'].startswith('http'):
-                            base_url = f"{self.page.url.split('/')[0]}//{self.page.url.split('/')[2]}"
-                            data['url'] = base_url + data['url']
-                    else:
-                        data['url'] = self.page.url
-                    
-                    # 설명
-                    data['description'] = f"부동산 매물 (페이지 {self.current_page})"
-                    
-                    self.crawled_data.append(data)
-                    self.root.after(0, self.add_to_table, data)
-                    
-                except Exception:
-                    continue
-                    
-        except Exception as e:
-            self.root.after(0, lambda err=str(e): self.status_var.set(f"부동산 Playwright 크롤링 오류: {err[:50]}"))
-
-    # 알림 관련 메서드들
     def add_keyword(self):
         """키워드를 추가합니다."""
         keyword = self.keyword_entry.get().strip()
@@ -2014,53 +1349,13 @@ class WebCrawlerApp:
     def check_for_alerts(self, url):
         """알림 조건을 체크합니다."""
         try:
-            # 간단한 크롤링으로 현재 데이터 확인
-            response = requests.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 가격 정보 추출 (간단한 패턴)
-            price_elements = soup.find_all(text=re.compile(r'[\d,]+원|[\$][\d,]+|\$[\d,.]+'))
-            
-            # 키워드 체크
-            keywords = list(self.keyword_listbox.get(0, tk.END))
-            page_text = soup.get_text().lower()
-            
-            alert_messages = []
-            
-            # 키워드 알림 체크
-            for keyword in keywords:
-                if keyword.lower() in page_text:
-                    alert_messages.append(f"키워드 '{keyword}'가 발견되었습니다!")
-            
-            # 가격 변동 체크 (기본적인 구현)
-            if price_elements and self.historical_data:
-                current_prices = [self.extract_number(price.strip()) for price in price_elements[:3]]
-                
-                # 이전 데이터와 비교
-                if len(self.historical_data) > 0:
-                    prev_data = self.historical_data[-1]
-                    threshold = float(self.price_threshold.get() or 10)
-                    
-                    for i, current_price in enumerate(current_prices):
-                        if current_price and i < len(prev_data.get('prices', [])):
-                            prev_price = prev_data['prices'][i]
-                            if prev_price and current_price:
-                                change_percent = abs((current_price - prev_price) / prev_price * 100)
-                                if change_percent >= threshold:
-                                    alert_messages.append(f"가격 변동 감지: {change_percent:.1f}% 변화")
-            
-            # 현재 데이터 저장
-            current_data = {
-                'timestamp': datetime.now(),
-                'url': url,
-                'prices': [self.extract_number(price.strip()) for price in price_elements[:3]],
-                'keywords_found': [kw for kw in keywords if kw.lower() in page_text]
-            }
-            self.historical_data.append(current_data)
+            # 키워드/임계값은 화면 설정을 반영하고 확인은 UI 독립 모니터가 수행
+            monitor = self.page_monitor
+            monitor.keywords = list(self.keyword_listbox.get(0, tk.END))
+            monitor.threshold = float(self.price_threshold.get() or 10)
+            monitor.parser = self.parse_options['parser']
             
-            # 데이터 제한 (최근 100개만 유지)
-            if len(self.historical_data) > 100:
-                self.historical_data = self.historical_data[-100:]
+            alert_messages = monitor.check(url, should_continue=lambda: self.monitoring_active)
             
             # 알림 발송
             if alert_messages:
@@ -2071,14 +1366,7 @@ class WebCrawlerApp:
     
     def extract_number(self, text):
         """텍스트에서 숫자를 추출합니다."""
-        try:
-            # 숫자와 콤마만 추출
-            numbers = re.findall(r'[\d,]+', text.replace(',', ''))
-            if numbers:
-                return float(numbers[0])
-        except:
-            pass
-        return None
+        return extract_number(text)
     
     def send_alerts(self, messages, url):
         """알림을 발송합니다."""
@@ -2088,6 +1376,7 @@ class WebCrawlerApp:
         # 데스크탑 알림
         if self.notification_enabled.get() and NOTIFICATION_AVAILABLE:
             try:
+                from plyer import notification
                 notification.notify(
                     title=alert_title,
                     message=alert_text,
@@ -2168,6 +1457,9 @@ URL: {url}
             for widget in self.chart_frame.winfo_children():
                 widget.destroy()
             
+            import matplotlib.pyplot as plt
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            
             # matplotlib 한글 폰트 설정
             plt.rcParams['font.family'] = ['AppleGothic'] if os.name == 'posix' else ['Malgun Gothic']
             plt.rcParams['axes.unicode_minus'] = False
@@ -2214,6 +1506,7 @@ URL: {url}
         
         # x축 날짜 포맷 설정
         import matplotlib.dates as mdates
+        import matplotlib.pyplot as plt
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d %H:%M'))
         plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
     
@@ -2221,7 +1514,7 @@ URL: {url}
         """키워드 빈도 차트를 생성합니다."""
         keyword_counts = {}
         
-        # 크롤링 데이터에서 키워드 빈도 계산
+        # 크롤링 데이터에서 키워드 빈도 계산 (저장소에서 일정 개수씩 이어 읽음)
         for data in self.crawled_data:
             title = data.get('title', '').lower()
             description = data.get('description', '').lower()
@@ -2244,16 +1537,12 @@ URL: {url}
         ax.set_title('키워드 빈도')
         ax.set_xlabel('키워드')
         ax.set_ylabel('빈도')
+        import matplotlib.pyplot as plt
         plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
     
     def create_site_statistics_chart(self, ax):
         """사이트별 통계 차트를 생성합니다."""
-        site_counts = {}
-        
-        for data in self.crawled_data:
-            url = data.get('url', '')
-            domain = urlparse(url).netloc
-            site_counts[domain] = site_counts.get(domain, 0) + 1
+        site_counts = self.crawled_data.count_by('domain')
         
         if not site_counts:
             ax.text(0.5, 0.5, '사이트 데이터가 없습니다', ha='center', va='center', transform=ax.transAxes)
@@ -2289,15 +1578,15 @@ URL: {url}
             messagebox.showwarning("경고", "분석할 데이터가 없습니다.")
             return
         
+        # 키워드 목록은 알림 탭에 있음
+        self.ensure_tab(self.alert_frame)
+        
         # 통계 계산
         total_items = len(self.crawled_data)
         total_monitoring = len(self.historical_data)
         
         # 사이트별 통계
-        site_stats = {}
-        for data in self.crawled_data:
-            site_type = data.get('type', '기타')
-            site_stats[site_type] = site_stats.get(site_type, 0) + 1
+        site_stats = {site_type or '기타': count for site_type, count in self.crawled_data.count_by('type').items()}
         
         # 리포트 텍스트 생성
         report = f"""크롤링 데이터 분석 리포트
@@ -2350,11 +1639,18 @@ URL: {url}
     # 스케줄링 관련 메서드들
     def add_schedule(self):
         """새로운 스케줄을 추가합니다."""
+        from apscheduler.triggers.cron import CronTrigger
+        
+        # 예약 실행은 알림 탭의 이메일 설정을 읽으므로 미리 구성
+        self.ensure_tab(self.alert_frame)
+        
         schedule_type = self.schedule_type.get()
         hour = int(self.schedule_hour.get())
         minute = int(self.schedule_minute.get())
         
         try:
+            scheduler = self.get_scheduler()
+            
             if schedule_type == "일회성":
                 # 오늘 또는 내일 지정된 시간에 실행
                 now = datetime.now()
@@ -2362,7 +1658,7 @@ URL: {url}
                 if scheduled_time <= now:
                     scheduled_time += timedelta(days=1)
                 
-                job = self.scheduler.add_job(
+                job = scheduler.add_job(
                     func=self.scheduled_crawl,
                     trigger='date',
                     run_date=scheduled_time,
@@ -2370,7 +1666,7 @@ URL: {url}
                 )
                 
             elif schedule_type == "매일":
-                job = self.scheduler.add_job(
+                job = scheduler.add_job(
                     func=self.scheduled_crawl,
                     trigger=CronTrigger(hour=hour, minute=minute),
                     id=f"daily_{hour:02d}{minute:02d}"
@@ -2381,7 +1677,7 @@ URL: {url}
                              "금요일": 4, "토요일": 5, "일요일": 6}
                 weekday = weekday_map[self.schedule_weekday.get()]
                 
-                job = self.scheduler.add_job(
+                job = scheduler.add_job(
                     func=self.scheduled_crawl,
                     trigger=CronTrigger(day_of_week=weekday, hour=hour, minute=minute),
                     id=f"weekly_{weekday}_{hour:02d}{minute:02d}"
@@ -2389,7 +1685,7 @@ URL: {url}
                 
             elif schedule_type == "매월":
                 day = int(self.schedule_day.get())
-                job = self.scheduler.add_job(
+                job = scheduler.add_job(
                     func=self.scheduled_crawl,
                     trigger=CronTrigger(day=day, hour=hour, minute=minute),
                     id=f"monthly_{day}_{hour:02d}{minute:02d}"
@@ -2477,31 +1773,14 @@ URL: {url}
             
             # 결과 요약 생성
             total_items = len(self.crawled_data)
-            sites = set(urlparse(item.get('url', '')).netloc for item in self.crawled_data)
+            sites = set(self.crawled_data.count_by('domain'))
             
             # 엑셀 파일 생성
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             excel_filename = f"scheduled_crawling_{timestamp}.xlsx"
             
-            # 임시로 엑셀 파일 저장
-            processed_data = []
-            for item in self.crawled_data:
-                processed_item = {}
-                for key, value in item.items():
-                    if isinstance(value, str):
-                        value = unicodedata.normalize('NFC', value)
-                        value = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', value)
-                        value = re.sub(r'\s+', ' ', value).strip()
-                        if len(value) > 32000:
-                            value = value[:32000] + "..."
-                    processed_item[key] = value
-                processed_data.append(processed_item)
-            
-            df = pd.DataFrame(processed_data)
-            df.columns = ['타입', '제목/텍스트', 'URL', '설명']
-            
-            with pd.ExcelWriter(excel_filename, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='CrawlingResults', index=False)
+            # 임시로 엑셀 파일 저장 (내보내기와 같은 스트리밍 경로)
+            write_excel(self.crawled_data, excel_filename)
             
             # 이메일 내용 구성
             subject = f"웹 크롤링 결과 - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
@@ -2592,10 +1871,10 @@ URL: {url}
                 'retry_count': self.retry_count
             }
             
-            with open(self.checkpoint_file, 'wb') as f:
-                pickle.dump(checkpoint_data, f)
+            # 지난 체크포인트 이후의 레코드만 저널에 덧붙임
+            write_checkpoint(self.checkpoint_file, checkpoint_data)
             
-            self.update_checkpoint_status()
+            self.update_checkpoint_status(checkpoint_data)
             
         except Exception as e:
             print(f"체크포인트 저장 오류: {e}")
@@ -2603,18 +1882,18 @@ URL: {url}
     def load_checkpoint(self):
         """저장된 체크포인트를 로드합니다."""
         try:
-            if not os.path.exists(self.checkpoint_file):
-                return None
-            
-            with open(self.checkpoint_file, 'rb') as f:
-                checkpoint_data = pickle.load(f)
-            
-            return checkpoint_data
+            return read_checkpoint(self.checkpoint_path())
             
         except Exception as e:
             print(f"체크포인트 로드 오류: {e}")
             return None
     
+    def checkpoint_path(self):
+        """읽을 체크포인트 파일 (저널이 없으면 이전 버전의 pickle 파일)"""
+        if not os.path.exists(self.checkpoint_file) and os.path.exists(self.legacy_checkpoint_file):
+            return self.legacy_checkpoint_file
+        return self.checkpoint_file
+    
     def restore_last_task(self):
         """마지막 작업을 복구합니다."""
         checkpoint_data = self.load_checkpoint()
@@ -2637,6 +1916,9 @@ URL: {url}
                 self.browser_mode.set(self.current_task['browser_mode'])
                 self.max_pages.set(str(self.current_task['max_pages']))
                 self.crawl_delay.set(str(self.current_task['crawl_delay']))
+                self.concurrent_workers.set(str(self.current_task.get('workers', 1)))
+                self.html_parser.set(self.current_task.get('html_parser', 'auto'))
+                self.resource_blocking.set(self.current_task.get('resource_blocking', 'auto'))
                 self.site_type.set(self.current_task['site_type'])
             
             # 진행 상황 표시
@@ -2670,16 +1952,14 @@ URL: {url}
             self.stop_button.config(state='normal')
             self.progress.start()
             
+            self.parse_options = self.build_parse_options()
+            self.extract_options = self.extraction_options()
+            
             # 실패한 페이지부터 재시작
             url = self.current_task['url']
+            self.crawl_config = self.build_crawl_config(url)
             
-            if self.current_task['browser_mode'] == "selenium":
-                thread = threading.Thread(target=self.crawl_with_selenium_checkpoint, args=(url, False, True))
-            elif self.current_task['browser_mode'] == "playwright":
-                thread = threading.Thread(target=self.crawl_with_playwright_checkpoint, args=(url, False, True))
-            else:
-                thread = threading.Thread(target=self.crawl_website_checkpoint, args=(url, False, True))
-            
+            thread = threading.Thread(target=self.crawl_website_checkpoint, args=(url, False, True))
             thread.daemon = True
             thread.start()
             
@@ -2689,8 +1969,9 @@ URL: {url}
     def clear_checkpoint(self, show_message=True):
         """체크포인트를 삭제합니다."""
         try:
-            if os.path.exists(self.checkpoint_file):
-                os.remove(self.checkpoint_file)
+            remove_checkpoint(self.checkpoint_file)
+            if os.path.exists(self.legacy_checkpoint_file):
+                os.remove(self.legacy_checkpoint_file)
             
             self.task_progress = {
                 'total_pages': 0,
@@ -2713,275 +1994,98 @@ URL: {url}
             else:
                 print(f"체크포인트 삭제 오류: {str(e)}")
     
-    def update_checkpoint_status(self):
-        """체크포인트 상태를 업데이트합니다."""
+    def update_checkpoint_status(self, checkpoint_data=None):
+        """체크포인트 상태를 업데이트합니다. (방금 저장한 데이터가 있으면 파일을 다시 읽지 않음)"""
         try:
-            if os.path.exists(self.checkpoint_file):
+            if checkpoint_data is None:
+                if not os.path.exists(self.checkpoint_path()):
+                    self.checkpoint_status.set("체크포인트 없음")
+                    return
                 checkpoint_data = self.load_checkpoint()
-                if checkpoint_data:
-                    timestamp = checkpoint_data['timestamp'].strftime('%Y-%m-%d %H:%M:%S')
-                    completed = checkpoint_data['task_progress']['completed_pages']
-                    total = checkpoint_data['task_progress']['total_pages']
-                    self.checkpoint_status.set(f"체크포인트 있음: {timestamp} ({completed}/{total})")
-                else:
-                    self.checkpoint_status.set("체크포인트 파일 손상됨")
+            
+            if checkpoint_data:
+                timestamp = checkpoint_data['timestamp'].strftime('%Y-%m-%d %H:%M:%S')
+                completed = checkpoint_data['task_progress']['completed_pages']
+                total = checkpoint_data['task_progress']['total_pages']
+                self.checkpoint_status.set(f"체크포인트 있음: {timestamp} ({completed}/{total})")
             else:
-                self.checkpoint_status.set("체크포인트 없음")
+                self.checkpoint_status.set("체크포인트 파일 손상됨")
         except:
             self.checkpoint_status.set("체크포인트 상태 확인 불가")
     
     # 체크포인트를 포함한 크롤링 메서드들
     def crawl_website_checkpoint(self, url, scheduled=False, resume=False):
-        """체크포인트 기능이 포함된 기본 크롤링"""
+        """체크포인트 기능이 포함된 크롤링 (모든 브라우저 모드를 UI 독립 엔진으로 실행, 작업 스레드)"""
+        print(f"[DEBUG] 크롤링 시작 - URL: {url}, 모드: {self.crawl_config.browser_mode}, "
+              f"스케줄됨: {scheduled}, 재시작: {resume}")
+        
+        if self.crawl_config.browser_mode.startswith("playwright") and not PLAYWRIGHT_AVAILABLE:
+            self.root.after(0, self.show_error, "Playwright가 설치되지 않았습니다. pip install playwright 후 playwright install을 실행하세요.")
+            return
+        
+        self.run_crawl_engine(self.crawl_config, scheduled, resume)
+    
+    def run_crawl_engine(self, config, scheduled=False, resume=False):
+        """CrawlEngine으로 크롤링하고 결과/상태/체크포인트를 화면에 연결합니다. (작업 스레드)"""
         try:
-            print(f"[DEBUG] 크롤링 시작 - URL: {url}, 스케줄됨: {scheduled}, 재시작: {resume}")
-            
             start_page = self.current_page if resume else 1
-            max_pages = int(self.max_pages.get()) if self.max_pages.get().isdigit() else 1
-            
-            print(f"[DEBUG] 페이지 범위: {start_page} ~ {max_pages}")
+            engine = CrawlEngine(
+                config,
+                on_page=self.deliver_engine_page,
+                on_status=lambda message: self.root.after(0, self.status_var.set, message),
+                on_checkpoint=self.save_engine_checkpoint,
+                should_continue=lambda: self.is_crawling,
+                progress=self.task_progress,
+                rate_limiter=self.rate_limiter,
+                retry_policy=self.retry_policy,
+                response_cache=self.response_cache
+            )
+            self.crawl_engine = engine
             
-            for page in range(start_page, max_pages + 1):
-                if not self.is_crawling:
-                    print(f"[DEBUG] 크롤링 중지됨 (페이지 {page})")
-                    break
-                
-                print(f"[DEBUG] 페이지 {page} 크롤링 시작")
-                self.current_page = page
-                self.task_progress['completed_pages'] = page - 1
-                
-                # 체크포인트 저장
-                if self.auto_save.get() and page % 5 == 0:  # 5페이지마다 저장
-                    print(f"[DEBUG] 체크포인트 저장 중 (페이지 {page})")
-                    self.save_checkpoint()
-                
-                # 페이지 크롤링 시도
-                success = False
-                for retry in range(self.max_retries):
-                    try:
-                        page_url = self.generate_page_url(url, page)
-                        print(f"[DEBUG] 요청 URL: {page_url} (재시도 {retry+1}/{self.max_retries})")
-                        
-                        # HTTP 요청 수행
-                        headers = {
-                            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                        }
-                        
-                        print(f"[DEBUG] HTTP 요청 시작: headers={headers}")
-                        response = requests.get(page_url, headers=headers, timeout=10)
-                        print(f"[DEBUG] HTTP 응답 수신: status_code={response.status_code}, encoding={response.encoding}")
-                        
-                        response.raise_for_status()
-                        
-                        # 한글 인코딩 처리
-                        if response.encoding == 'ISO-8859-1':
-                            response.encoding = response.apparent_encoding
-                        elif not response.encoding:
-                            response.encoding = 'utf-8'
-                        
-                        print(f"[DEBUG] 인코딩 처리 완료: {response.encoding}")
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        print(f"[DEBUG] BeautifulSoup 파싱 완료")
-                        
-                        self.root.after(0, self.update_results, page_url, response, soup)
-                        success = True
-                        break
-                            
-                    except Exception as e:
-                        print(f"[DEBUG] 크롤링 오류 (재시도 {retry+1}): {str(e)}")
-                        self.root.after(0, lambda r=retry+1, err=str(e): self.status_var.set(f"페이지 {page} 오류, 재시도 {r}/{self.max_retries}: {err[:30]}"))
-                        time.sleep(2)
-                
-                if not success:
-                    print(f"[DEBUG] 페이지 {page} 크롤링 실패 - 실패 목록에 추가")
-                    self.task_progress['failed_pages'].append(page)
-                else:
-                    print(f"[DEBUG] 페이지 {page} 크롤링 성공")
-                
-                # 크롤링 간격
-                if page < max_pages and self.is_crawling:
-                    delay = float(self.crawl_delay.get()) if self.crawl_delay.get().replace('.', '').isdigit() else 1
-                    print(f"[DEBUG] {delay}초 대기 중...")
-                    time.sleep(delay)
+            engine.run(start_page)
+            self.current_page = engine.current_page
             
             # 작업 완료 처리
             print(f"[DEBUG] 크롤링 완료 처리 시작")
-            self.root.after(0, self.finalize_crawling_checkpoint, scheduled)
+            self.ui_queue.put(self.finalize_crawling_checkpoint, scheduled)
             
         except Exception as e:
             print(f"[DEBUG] 치명적 오류: {str(e)}")
             import traceback
             traceback.print_exc()
             self.root.after(0, self.show_error, f"체크포인트 크롤링 오류: {str(e)}")
-    
-    def crawl_with_selenium_checkpoint(self, url, scheduled=False, resume=False):
-        """체크포인트 기능이 포함된 Selenium 크롤링"""
-        print(f"[DEBUG] Selenium 크롤링 시작 - URL: {url}")
-        
-        if not self.setup_selenium_driver():
-            print(f"[DEBUG] Selenium 드라이버 설정 실패")
-            return
-        
-        try:
-            start_page = self.current_page if resume else 1
-            max_pages = int(self.max_pages.get()) if self.max_pages.get().isdigit() else 1
-            print(f"[DEBUG] Selenium 페이지 범위: {start_page} ~ {max_pages}")
-            
-            for page in range(start_page, max_pages + 1):
-                if not self.is_crawling:
-                    print(f"[DEBUG] Selenium 크롤링 중지됨 (페이지 {page})")
-                    break
-                
-                print(f"[DEBUG] Selenium 페이지 {page} 크롤링 시작")
-                self.current_page = page
-                self.task_progress['completed_pages'] = page - 1
-                
-                # 체크포인트 저장
-                if self.auto_save.get() and page % 3 == 0:  # 3페이지마다 저장
-                    print(f"[DEBUG] Selenium 체크포인트 저장 중 (페이지 {page})")
-                    self.save_checkpoint()
-                
-                success = False
-                for retry in range(self.max_retries):
-                    try:
-                        page_url = self.generate_page_url(url, page)
-                        print(f"[DEBUG] Selenium 페이지 로드: {page_url} (재시도 {retry+1})")
-                        
-                        self.driver.get(page_url)
-                        print(f"[DEBUG] Selenium 페이지 로드 완료")
-                        
-                        WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.TAG_NAME, "body"))
-                        )
-                        print(f"[DEBUG] Selenium body 요소 로드 완료")
-                        
-                        # 사이트별 특화 크롤링
-                        site_type = self.site_type.get()
-                        print(f"[DEBUG] 사이트 타입: {site_type}")
-                        
-                        if site_type == "네이버 쇼핑":
-                            self.crawl_naver_shopping()
-                        elif site_type == "인스타그램":
-                            self.crawl_instagram()
-                        elif site_type == "부동산":
-                            self.crawl_real_estate()
-                        else:
-                            self.crawl_general_selenium()
-                        
-                        print(f"[DEBUG] Selenium 페이지 {page} 크롤링 성공")
-                        success = True
-                        break
-                        
-                    except Exception as e:
-                        print(f"[DEBUG] Selenium 오류 (재시도 {retry+1}): {str(e)}")
-                        self.root.after(0, lambda r=retry+1, err=str(e): self.status_var.set(f"Selenium 페이지 {page} 재시도 {r}/{self.max_retries}: {err[:30]}"))
-                        time.sleep(2)
-                
-                if not success:
-                    print(f"[DEBUG] Selenium 페이지 {page} 크롤링 실패")
-                    self.task_progress['failed_pages'].append(page)
-                
-                if page < max_pages and self.is_crawling:
-                    delay = float(self.crawl_delay.get()) if self.crawl_delay.get().replace('.', '').isdigit() else 1
-                    print(f"[DEBUG] Selenium {delay}초 대기 중...")
-                    time.sleep(delay)
-            
-            print(f"[DEBUG] Selenium 크롤링 완료 처리 시작")
-            self.root.after(0, self.finalize_crawling_checkpoint, scheduled)
-            
-        except Exception as e:
-            print(f"[DEBUG] Selenium 치명적 오류: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            self.root.after(0, self.show_error, f"Selenium 체크포인트 크롤링 오류: {str(e)}")
         finally:
-            if self.driver:
-                try:
-                    print(f"[DEBUG] Selenium 드라이버 종료 중...")
-                    self.driver.quit()
-                    print(f"[DEBUG] Selenium 드라이버 종료 완료")
-                except:
-                    print(f"[DEBUG] Selenium 드라이버 종료 실패")
-                    pass
-                self.driver = None
-    
-    def crawl_with_playwright_checkpoint(self, url, scheduled=False, resume=False):
-        """체크포인트 기능이 포함된 Playwright 크롤링"""
-        if not self.setup_playwright():
-            return
-        
-        try:
-            start_page = self.current_page if resume else 1
-            max_pages = int(self.max_pages.get()) if self.max_pages.get().isdigit() else 1
-            
-            for page in range(start_page, max_pages + 1):
-                if not self.is_crawling:
-                    break
-                
-                self.current_page = page
-                self.task_progress['completed_pages'] = page - 1
-                
-                # 체크포인트 저장
-                if self.auto_save.get() and page % 3 == 0:  # 3페이지마다 저장
-                    self.save_checkpoint()
-                
-                success = False
-                for retry in range(self.max_retries):
-                    try:
-                        page_url = self.generate_page_url(url, page)
-                        self.page.goto(page_url, wait_until='domcontentloaded', timeout=30000)
-                        self.page.wait_for_load_state('networkidle', timeout=10000)
-                        self.page.wait_for_timeout(2000)
-                        
-                        domain = urlparse(page_url).netloc.lower()
-                        if 'shopping.naver.com' in domain:
-                            self.crawl_naver_shopping_playwright()
-                        elif 'instagram.com' in domain:
-                            self.crawl_instagram_playwright()
-                        elif any(keyword in domain for keyword in ['zigbang', 'dabang', '부동산']):
-                            self.crawl_real_estate_playwright()
-                        else:
-                            self.crawl_general_playwright()
-                        
-                        success = True
-                        break
-                        
-                    except Exception as e:
-                        self.root.after(0, lambda r=retry+1, err=str(e): self.status_var.set(f"Playwright 페이지 {page} 재시도 {r}/{self.max_retries}: {err[:30]}"))
-                        time.sleep(2)
-                
-                if not success:
-                    self.task_progress['failed_pages'].append(page)
-                
-                if page < max_pages and self.is_crawling:
-                    time.sleep(float(self.crawl_delay.get()) if self.crawl_delay.get().replace('.', '').isdigit() else 1)
-            
-            self.root.after(0, self.finalize_crawling_checkpoint, scheduled)
-            
-        except Exception as e:
-            self.root.after(0, self.show_error, f"Playwright 체크포인트 크롤링 오류: {str(e)}")
-        finally:
-            # Playwright 정리
-            if self.page:
-                try:
-                    self.page.close()
-                except:
-                    pass
-                self.page = None
-            
-            if self.browser:
-                try:
-                    self.browser.close()
-                except:
-                    pass
-                self.browser = None
-            
-            if self.playwright:
-                try:
-                    self.playwright.stop()
-                except:
-                    pass
-                self.playwright = None
+            self.crawl_engine = None
+    
+    def deliver_engine_page(self, outcome):
+        """엔진이 끝낸 페이지를 저장소에 추가하고 표시 배치를 메인 스레드에 전달합니다. (작업 스레드)"""
+        # 저장소 추가는 여기서 바로 (이후 저장하는 체크포인트의 completed_pages가 저장된 결과보다 앞서지 않도록)
+        if outcome.records:
+            self.crawled_data.extend(outcome.records)
+        
+        if outcome.page_result is not None:
+            # 일반 페이지: 표시용 문자열과 테이블 행까지 만든 뒤 메인 스레드에는 배치만 전달
+            display = self.build_page_display(outcome.url, outcome.response, outcome.page_result, outcome.records)
+            self.ui_queue.put(self.show_page_display, display, should_continue=lambda: self.is_crawling)
+        elif outcome.records:
+            self.ui_queue.put(self.show_records, outcome.records, should_continue=lambda: self.is_crawling)
+    
+    def save_engine_checkpoint(self, engine):
+        """엔진이 알린 시점에 체크포인트를 저장합니다."""
+        self.current_page = engine.current_page
+        if self.auto_save.get():
+            print(f"[DEBUG] 체크포인트 저장 중 (페이지 {engine.current_page})")
+            self.save_checkpoint()
+    
+    def get_concurrent_workers(self):
+        """동시 요청 작업자 수를 반환합니다. (1이면 순차 크롤링)"""
+        value = self.concurrent_workers.get().strip()
+        workers = int(value) if value.isdigit() else 1
+        return min(max(workers, 1), 16)
+    
+    def get_crawl_delay(self):
+        """크롤링 간격(초)을 반환합니다."""
+        return float(self.crawl_delay.get()) if self.crawl_delay.get().replace('.', '').isdigit() else 1
     
     def finalize_crawling_checkpoint(self, scheduled=False):
         """체크포인트 기능이 포함된 크롤링 완료 처리"""
@@ -3002,6 +2106,12 @@ URL: {url}
         
         self.status_var.set(status_msg)
         
+        if self.use_response_cache:
+            self.response_cache.flush()  # 크롤링 동안 미뤄 둔 인덱스 저장
+            cache_stats = self.response_cache.stats()
+            print(f"[DEBUG] 응답 캐시: 적중 {cache_stats['hits']}, 실패 {cache_stats['misses']}, "
+                  f"항목 {cache_stats['entries']}개, 제거 {cache_stats['evictions']}개")
+        
         # 스마트 뷰 업데이트
         self.update_smart_view()
         
@@ -3011,14 +2121,15 @@ URL: {url}
     
     def update_smart_view(self):
         """스마트 뷰 업데이트"""
+        # 탭이 보이지 않으면 뷰어 생성을 탭을 열 때로 미룸
+        if self.notebook.select() != str(self.smart_view_frame):
+            self.smart_view_pending = bool(self.crawled_data)
+            return
+        self.smart_view_pending = False
+        
         try:
             # 크롤링된 데이터가 있을 때만 스마트 뷰어 생성/업데이트
             if self.crawled_data:
-                # 크롤링 시간 추가
-                for item in self.crawled_data:
-                    if 'crawl_time' not in item:
-                        item['crawl_time'] = datetime.now()
-                
                 # 고급 UI 모듈 import (필요시에만)
                 try:
                     from advanced_ui import AdvancedResultsViewer
@@ -3027,7 +2138,7 @@ URL: {url}
                     for widget in self.smart_view_frame.winfo_children():
                         widget.destroy()
                     
-                    # 새로운 스마트 뷰어 생성
+                    # 새로운 스마트 뷰어 생성 (저장소를 그대로 전달, 뷰어가 전체 결과를 이어 읽음)
                     self.smart_viewer = AdvancedResultsViewer(self.smart_view_frame, self.crawled_data)
                     
                 except ImportError:
@@ -3046,5 +2157,13 @@ def main():
     app = WebCrawlerApp(root)
     root.mainloop()
 
+def cli_main(argv=None):
+    """헤드리스 실행 (crawl / schedule / monitor). tk.Tk()를 만들지 않으므로 디스플레이가 필요 없습니다."""
+    from crawler_cli import run_cli
+    return run_cli(argv)
+
 if __name__ == "__main__":
+    # 명령줄 인자가 있으면 헤드리스 CLI, 없으면 GUI
+    if len(sys.argv) > 1:
+        sys.exit(cli_main(sys.argv[1:]))
     main() 
\ No newline at end of file
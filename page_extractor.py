@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+페이지 추출기
+파싱된 문서를 한 번만 순회하여 제목, 메타 설명, 링크, 이미지, 본문 텍스트를
+PageResult로 만듭니다. 텍스트 탭과 결과 테이블이 같은 결과를 공유하며,
+script/style 태그를 제거(decompose)하지 않으므로 원본 트리를 변경하지 않습니다.
+파서 백엔드(lxml 우선)와 추출 옵션에 맞춘 부분 파싱(SoupStrainer)도 제공합니다.
+"""
+
+import re
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag, NavigableString, CData
+
+from text_clean import clean_text, clean_text_cached, truncate_text
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    print("lxml이 설치되지 않았습니다. html.parser로 파싱합니다.")
+
+# UI에서 선택 가능한 파서 ('auto'는 lxml이 있으면 lxml)
+PARSER_CHOICES = ["auto", "lxml", "html.parser"]
+
+# 본문 텍스트에서 제외할 태그
+SKIP_TEXT_TAGS = frozenset(['script', 'style'])
+
+# get_text()와 같이 일반 텍스트 노드만 본문으로 사용 (주석, 선언문 등 제외)
+TEXT_TYPES = (NavigableString, CData)
+
+
+def resolve_parser(name=None):
+    """파서 이름을 실제 BeautifulSoup 백엔드 이름으로 변환합니다."""
+    if name in (None, '', 'auto', 'lxml'):
+        return 'lxml' if LXML_AVAILABLE else 'html.parser'
+    return name
+
+
+def page_strainer(extract_links=True, extract_images=True, extract_text=True):
+    """추출 옵션에 필요한 태그만 파싱하는 SoupStrainer (텍스트 추출 시에는 None)"""
+    if extract_text:
+        return None
+
+    names = ['title', 'meta']
+    if extract_links:
+        names.append('a')
+    if extract_images:
+        names.append('img')
+    return SoupStrainer(names)
+
+
+def parse_html(markup, parser=None, parse_only=None):
+    """선택한 파서로 HTML을 파싱합니다."""
+    return BeautifulSoup(markup, resolve_parser(parser), parse_only=parse_only)
+
+
+class PageResult:
+    """한 페이지의 추출 결과"""
+
+    def __init__(self, url):
+        self.url = url
+        self.title = "제목 없음"
+        self.description = "설명 없음"
+        # (텍스트, 절대 URL) 목록 - 표시 한도까지만 보관
+        self.links = []
+        self.images = []
+        # 전체 개수 (표시 한도와 무관)
+        self.link_count = 0
+        self.image_count = 0
+        self.text = ''
+
+
+def extract_page(url, soup, extract_links=True, extract_images=True, extract_text=True,
+                 max_links=50, max_images=30):
+    """문서를 한 번 순회하여 PageResult를 생성합니다."""
+    result = PageResult(url)
+    title_tag = None
+    meta_tag = None
+    strings = []
+
+    for node in soup.descendants:
+        if isinstance(node, Tag):
+            name = node.name
+            if name == 'a':
+                if extract_links and node.get('href') is not None:
+                    result.link_count += 1
+                    if len(result.links) < max_links:
+                        result.links.append((node.get_text(strip=True), urljoin(url, node['href'])))
+            elif name == 'img':
+                if extract_images and node.get('src') is not None:
+                    result.image_count += 1
+                    if len(result.images) < max_images:
+                        result.images.append((node.get('alt', '대체 텍스트 없음'), urljoin(url, node['src'])))
+            elif name == 'title':
+                if title_tag is None:
+                    title_tag = node
+            elif name == 'meta':
+                if meta_tag is None and node.get('name') == 'description':
+                    meta_tag = node
+        elif extract_text and type(node) in TEXT_TYPES:
+            parent = node.parent
+            if parent is None or parent.name not in SKIP_TEXT_TAGS:
+                strings.append(node)
+
+    if title_tag is not None:
+        title_text = clean_text(title_tag.get_text(strip=True))
+        if title_text:
+            result.title = title_text
+
+    if meta_tag is not None:
+        description = meta_tag.get('content', '설명 없음')
+        if description and description != '설명 없음':
+            description = clean_text(description)
+        result.description = description
+
+    if extract_text:
+        result.text = clean_text(''.join(strings))
+
+    return result
+
+
+def link_display_text(text):
+    """링크 텍스트를 표시용으로 정리합니다. (100자 제한, 반복되는 텍스트는 기억한 결과 사용)"""
+    text = clean_text_cached(text)
+    if not text:
+        return "(텍스트 없음)"
+    return truncate_text(text, 100)
+
+
+# 가격 모니터의 일반 가격 패턴 (셀렉터가 없거나 찾지 못했을 때)
+PRICE_PATTERNS = [
+    re.compile(r'(\d+,?\d*)\s*원'),
+    re.compile(r'\$\s*(\d+,?\d*)'),
+    re.compile(r'price["\'\s]*[:\s]*["\']?(\d+,?\d*)'),
+    re.compile(r'(\d+,?\d*)\s*KRW')
+]
+
+
+def parse_price_text(price_text):
+    """가격 텍스트에서 숫자 추출 (가장 큰 숫자를 가격으로 간주)"""
+    # 콤마 제거하고 숫자만 추출
+    numbers = re.findall(r'\d+', price_text.replace(',', ''))
+    if numbers:
+        return max(int(num) for num in numbers)
+    return None
+
+
+def extract_price_from_html(html, price_selector=None, parser=None):
+    """HTML에서 가격 추출 (사용자 셀렉터 우선, 없으면 일반 가격 패턴)"""
+    soup = parse_html(html, parser)
+
+    # 사용자 정의 셀렉터가 있으면 사용
+    if price_selector:
+        try:
+            price_elem = soup.select_one(price_selector)
+            if price_elem:
+                return parse_price_text(price_elem.get_text(strip=True))
+        except Exception:
+            pass
+
+    text = soup.get_text()
+    for pattern in PRICE_PATTERNS:
+        matches = pattern.findall(text)
+        if matches:
+            try:
+                return int(matches[0].replace(',', ''))
+            except ValueError:
+                continue
+
+    return None
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+가격 모니터링 항목 헬퍼
+가격 알림 메시지와 모니터링 목록 JSON 변환 (GUI 가격 모니터와 CLI 공통, tkinter/matplotlib 불필요)
+"""
+
+from datetime import datetime
+
+
+def price_alert_messages(item, current_price, threshold):
+    """가격 모니터링 항목의 목표 가격 달성/변동률 알림 메시지 (price_history에 현재 가격 기록 후 호출)"""
+    messages = []
+
+    # 목표 가격 체크
+    target_price = item.get('target_price')
+    if target_price and isinstance(target_price, (int, float)):
+        if current_price <= target_price:
+            messages.append(f"목표 가격 달성! {current_price:,}원 ≤ {target_price:,}원")
+
+    # 변동률 체크
+    if len(item.get('price_history', [])) >= 2:
+        previous_price = item['price_history'][-2]['price']
+        change_pct = ((current_price - previous_price) / previous_price) * 100
+
+        if abs(change_pct) >= threshold:
+            direction = "상승" if change_pct > 0 else "하락"
+            messages.append(f"가격 {direction}: {change_pct:.2f}% ({previous_price:,}원 → {current_price:,}원)")
+
+    return messages
+
+
+def monitoring_items_to_json(items):
+    """가격 모니터링 목록을 JSON으로 저장할 수 있게 변환합니다. (datetime -> ISO 문자열)"""
+    save_data = []
+    for item in items:
+        item_copy = dict(item)
+        for key in ('created_at', 'last_check'):
+            if isinstance(item_copy.get(key), datetime):
+                item_copy[key] = item_copy[key].isoformat()
+
+        if 'price_history' in item_copy:
+            item_copy['price_history'] = [
+                dict(entry, timestamp=entry['timestamp'].isoformat())
+                if isinstance(entry.get('timestamp'), datetime) else dict(entry)
+                for entry in item_copy['price_history']
+            ]
+        save_data.append(item_copy)
+    return save_data
+
+
+def monitoring_items_from_json(load_data):
+    """JSON에서 읽은 가격 모니터링 목록의 datetime 필드를 복원합니다."""
+    for item in load_data:
+        for key in ('created_at', 'last_check'):
+            if isinstance(item.get(key), str):
+                item[key] = datetime.fromisoformat(item[key])
+
+        for entry in item.get('price_history', []):
+            if isinstance(entry.get('timestamp'), str):
+                entry['timestamp'] = datetime.fromisoformat(entry['timestamp'])
+    return load_data
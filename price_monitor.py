@@ -13,10 +13,15 @@ from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import pandas as pd
-import requests
 from threading import Thread
 import time
 
+from http_session import HttpSessionManager
+from rate_limiter import shared_rate_limiter
+from response_cache import get_shared_cache
+from page_extractor import parse_html, extract_price_from_html, parse_price_text
+from price_alerts import price_alert_messages, monitoring_items_to_json, monitoring_items_from_json
+
 class PriceMonitoringSystem:
     """가격 모니터링 시스템"""
     
@@ -31,9 +36,19 @@ class PriceMonitoringSystem:
             'check_interval': 300,  # 5분
             'price_change_threshold': 5.0,  # 5% 변동
             'email_alerts': False,
-            'desktop_alerts': True
+            'desktop_alerts': True,
+            'html_parser': 'auto'  # auto: lxml이 있으면 lxml
         }
         
+        # 상품 페이지 요청용 세션 (호스트별 커넥션 재사용)
+        self.http_sessions = HttpSessionManager(pool_size=4, per_host=True)
+        
+        # 크롤러와 공유하는 도메인별 요청 제한기 (같은 쇼핑몰 상품을 연속 체크할 때만 대기)
+        self.rate_limiter = shared_rate_limiter
+        
+        # 크롤러와 공유하는 디스크 응답 캐시 (변경 없는 상품 페이지는 304로 확인)
+        self.response_cache = get_shared_cache()
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -181,7 +196,7 @@ class PriceMonitoringSystem:
     
     def add_monitoring_item(self):
         """모니터링 아이템 추가"""
-        dialog = AddMonitoringItemDialog(self.parent_frame)
+        dialog = AddMonitoringItemDialog(self.parent_frame, self.http_sessions)
         if dialog.result:
             item = dialog.result
             item['id'] = f"item_{len(self.monitoring_items)}"
@@ -328,14 +343,24 @@ class PriceMonitoringSystem:
             if not url:
                 return
             
-            # HTTP 요청으로 가격 정보 가져오기
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
+            # HTTP 요청으로 가격 정보 가져오기 (세션 재사용)
+            self.rate_limiter.acquire(url, should_continue=lambda: self.is_monitoring)
+            response = self.response_cache.fetch(self.http_sessions, url,
+                                                 timeout=self.settings.get('timeout', 10))
             response.raise_for_status()
             
+            # 304: 페이지가 바뀌지 않았으면 파싱 없이 직전 가격을 그대로 기록
+            if response.not_modified and item.get('price_history'):
+                price = item['price_history'][-1]['price']
+                item['price_history'].append({
+                    'price': price,
+                    'timestamp': datetime.now(),
+                    'url': url
+                })
+                item['last_check'] = datetime.now()
+                self.parent_frame.after(0, self.refresh_monitoring_list)
+                return
+            
             # 가격 추출 (사이트별 맞춤형 파싱 필요)
             price = self.extract_price_from_html(response.text, item.get('price_selector'))
             
@@ -368,66 +393,17 @@ class PriceMonitoringSystem:
     
     def extract_price_from_html(self, html, price_selector=None):
         """HTML에서 가격 추출"""
-        from bs4 import BeautifulSoup
-        
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # 사용자 정의 셀렉터가 있으면 사용
-        if price_selector:
-            try:
-                price_elem = soup.select_one(price_selector)
-                if price_elem:
-                    price_text = price_elem.get_text(strip=True)
-                    return self.parse_price_text(price_text)
-            except:
-                pass
-        
-        # 일반적인 가격 패턴 검색
-        price_patterns = [
-            r'(\d+,?\d*)\s*원',
-            r'\$\s*(\d+,?\d*)',
-            r'price["\'\s]*[:\s]*["\']?(\d+,?\d*)',
-            r'(\d+,?\d*)\s*KRW'
-        ]
-        
-        text = soup.get_text()
-        for pattern in price_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                try:
-                    price_str = matches[0].replace(',', '')
-                    return int(price_str)
-                except:
-                    continue
-        
-        return None
+        return extract_price_from_html(html, price_selector, self.settings.get('html_parser'))
     
     def parse_price_text(self, price_text):
         """가격 텍스트에서 숫자 추출"""
-        # 콤마 제거하고 숫자만 추출
-        numbers = re.findall(r'\d+', price_text.replace(',', ''))
-        if numbers:
-            # 가장 큰 숫자를 가격으로 간주
-            return max(int(num) for num in numbers)
-        return None
+        return parse_price_text(price_text)
     
     def check_price_alerts(self, item, current_price):
         """가격 알림 체크"""
         try:
-            # 목표 가격 체크
-            target_price = item.get('target_price')
-            if target_price and isinstance(target_price, (int, float)):
-                if current_price <= target_price:
-                    self.send_alert(item, f"목표 가격 달성! {current_price:,}원 ≤ {target_price:,}원")
-            
-            # 변동률 체크
-            if len(item.get('price_history', [])) >= 2:
-                previous_price = item['price_history'][-2]['price']
-                change_pct = ((current_price - previous_price) / previous_price) * 100
-                
-                if abs(change_pct) >= self.settings['price_change_threshold']:
-                    direction = "상승" if change_pct > 0 else "하락"
-                    self.send_alert(item, f"가격 {direction}: {change_pct:.2f}% ({previous_price:,}원 → {current_price:,}원)")
+            for message in price_alert_messages(item, current_price, self.settings['price_change_threshold']):
+                self.send_alert(item, message)
         
         except Exception as e:
             print(f"[DEBUG] 알림 체크 오류: {e}")
@@ -571,24 +547,7 @@ class PriceMonitoringSystem:
         if filename:
             try:
                 # datetime 객체를 문자열로 변환
-                save_data = []
-                for item in self.monitoring_items:
-                    item_copy = item.copy()
-                    
-                    # datetime 필드 처리
-                    if 'created_at' in item_copy and isinstance(item_copy['created_at'], datetime):
-                        item_copy['created_at'] = item_copy['created_at'].isoformat()
-                    
-                    if 'last_check' in item_copy and isinstance(item_copy['last_check'], datetime):
-                        item_copy['last_check'] = item_copy['last_check'].isoformat()
-                    
-                    # price_history의 datetime 처리
-                    if 'price_history' in item_copy:
-                        for entry in item_copy['price_history']:
-                            if isinstance(entry.get('timestamp'), datetime):
-                                entry['timestamp'] = entry['timestamp'].isoformat()
-                    
-                    save_data.append(item_copy)
+                save_data = monitoring_items_to_json(self.monitoring_items)
                 
                 with open(filename, 'w', encoding='utf-8') as f:
                     json.dump(save_data, f, ensure_ascii=False, indent=2)
@@ -613,18 +572,7 @@ class PriceMonitoringSystem:
                     load_data = json.load(f)
                 
                 # datetime 필드 복원
-                for item in load_data:
-                    if 'created_at' in item and isinstance(item['created_at'], str):
-                        item['created_at'] = datetime.fromisoformat(item['created_at'])
-                    
-                    if 'last_check' in item and isinstance(item['last_check'], str):
-                        item['last_check'] = datetime.fromisoformat(item['last_check'])
-                    
-                    # price_history의 datetime 복원
-                    if 'price_history' in item:
-                        for entry in item['price_history']:
-                            if isinstance(entry.get('timestamp'), str):
-                                entry['timestamp'] = datetime.fromisoformat(entry['timestamp'])
+                monitoring_items_from_json(load_data)
                 
                 self.monitoring_items = load_data
                 self.refresh_monitoring_list()
@@ -638,9 +586,10 @@ class PriceMonitoringSystem:
 class AddMonitoringItemDialog:
     """모니터링 아이템 추가 대화상자"""
     
-    def __init__(self, parent):
+    def __init__(self, parent, http_sessions=None):
         self.parent = parent
         self.result = None
+        self.http_sessions = http_sessions
         
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("상품 추가")
@@ -708,15 +657,14 @@ class AddMonitoringItemDialog:
             messagebox.showwarning("경고", "URL을 입력해주세요.")
             return
         
+        # 모니터링 시스템의 세션이 없으면 임시 세션 사용
+        sessions = self.http_sessions or HttpSessionManager(pool_size=1)
+        
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
+            response = sessions.get(url)
             response.raise_for_status()
             
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = parse_html(response.text)
             
             # 제목 추출
             title = soup.find('title')
@@ -746,6 +694,9 @@ class AddMonitoringItemDialog:
         
         except Exception as e:
             messagebox.showerror("오류", f"정보 가져오기 실패:\n{str(e)}")
+        finally:
+            if sessions is not self.http_sessions:
+                sessions.close()
     
     def ok(self):
         """확인 버튼"""
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+도메인별 요청 속도 제한 (토큰 버킷)
+고정 sleep 대신 호스트별 요청 예산(초당 요청 수 + 버스트)을 관리하여
+예산이 실제로 소진된 경우에만 대기합니다.
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+SLEEP_CHECK_INTERVAL = 0.2  # 대기 중 중지 요청 확인 간격 (초)
+
+
+def interruptible_sleep(seconds, should_continue=None):
+    """중지 요청을 확인하면서 대기합니다. (요청 제한기와 재시도 정책이 함께 사용)"""
+    deadline = time.monotonic() + seconds
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if should_continue is not None and not should_continue():
+            return
+        time.sleep(min(remaining, SLEEP_CHECK_INTERVAL))
+
+
+class TokenBucket:
+    """단일 호스트용 토큰 버킷"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = max(1, int(burst))
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+
+    def reserve(self, now):
+        """토큰 하나를 예약하고 대기해야 할 시간(초)을 반환합니다."""
+        # 경과 시간만큼 토큰 충전
+        elapsed = now - self.updated_at
+        self.updated_at = now
+        if self.rate:
+            self.tokens = min(float(self.burst), self.tokens + elapsed * self.rate)
+        else:
+            self.tokens = float(self.burst)
+
+        # 서버가 요청한 대기 시간(Retry-After 등)이 남아 있으면 그 이후로 예약
+        wait = max(0.0, self.blocked_until - now)
+
+        self.tokens -= 1
+        if self.tokens < 0 and self.rate:
+            wait = max(wait, -self.tokens / self.rate)
+        return wait
+
+
+class DomainRateLimiter:
+    """도메인별 토큰 버킷 요청 제한기"""
+
+    def __init__(self, rate=1.0, burst=1):
+        # rate: 초당 요청 수 (None 또는 0이면 제한 없음)
+        self.default_rate = rate
+        self.default_burst = burst
+        self._buckets = {}
+        self._limits = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def domain_of(url_or_domain):
+        """URL 또는 도메인 문자열에서 도메인을 추출합니다."""
+        if '://' in url_or_domain:
+            return urlparse(url_or_domain).netloc.lower()
+        return url_or_domain.lower()
+
+    def configure(self, url_or_domain, rate=None, burst=None):
+        """특정 도메인의 요청 속도와 버스트를 설정합니다."""
+        domain = self.domain_of(url_or_domain)
+        with self._lock:
+            self._limits[domain] = (rate, burst or self.default_burst)
+            bucket = self._buckets.get(domain)
+            if bucket:
+                bucket.rate = rate
+                bucket.burst = max(1, int(burst or self.default_burst))
+                bucket.tokens = min(bucket.tokens, float(bucket.burst))
+
+    def configure_delay(self, url_or_domain, delay, burst=None):
+        """기존 '요청 간격(초)' 설정을 초당 요청 수로 변환하여 적용합니다."""
+        rate = 1.0 / delay if delay and delay > 0 else None
+        self.configure(url_or_domain, rate, burst)
+
+    def _bucket_for(self, domain):
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            rate, burst = self._limits.get(domain, (self.default_rate, self.default_burst))
+            bucket = TokenBucket(rate, burst)
+            self._buckets[domain] = bucket
+        return bucket
+
+    def reserve(self, url_or_domain):
+        """요청 순번을 예약하고 기다려야 할 시간(초)을 반환합니다. (대기는 호출한 쪽에서, 비동기 엔진용)"""
+        domain = self.domain_of(url_or_domain)
+        with self._lock:
+            return self._bucket_for(domain).reserve(time.monotonic())
+
+    def acquire(self, url_or_domain, should_continue=None):
+        """요청 전에 호출합니다. 예산이 없으면 필요한 만큼만 대기하고 대기한 시간을 반환합니다."""
+        wait = self.reserve(url_or_domain)
+        if wait > 0:
+            interruptible_sleep(wait, should_continue)
+        return wait
+
+    def defer(self, url_or_domain, seconds):
+        """서버 요청(Retry-After 등)에 따라 도메인 전체 요청을 일정 시간 미룹니다."""
+        domain = self.domain_of(url_or_domain)
+        with self._lock:
+            bucket = self._bucket_for(domain)
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + seconds)
+
+
+# 크롤링 엔진과 가격 모니터가 공유하는 기본 제한기
+shared_rate_limiter = DomainRateLimiter(rate=1.0, burst=1)
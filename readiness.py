@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+페이지 준비 상태 판단
+고정 대기(networkidle + 2초) 대신 사이트 프로필에 선언한 조건
+(셀렉터 존재, 항목 수 안정화, 특정 XHR 완료)을 페이지 안에서 폴링합니다.
+조건이 없거나 시간 안에 충족되지 않으면 공통 기본 조건(문서 로드 완료 +
+리소스 요청이 잠시 멈춤)을 짧게 기다린 뒤 추출을 진행합니다.
+Playwright는 wait_for_function(동기/비동기 API), Selenium은 WebDriverWait + execute_script를 사용합니다.
+
+조건 형식:
+    {'selector': css}                              - 요소가 존재
+    {'count_stable': css, 'min': 1, 'stable_ms': 500} - 항목 수가 min 이상이고 stable_ms 동안 변하지 않음
+    {'response': 'api/search'}                     - URL에 문자열이 포함된 XHR/fetch 응답 완료
+    {'ready_state': 'complete'}                    - document.readyState
+    {'resources_quiet_ms': 500}                    - 새 리소스 요청이 일정 시간 없음
+"""
+
+# 모든 조건을 만족하면 true를 반환하는 페이지 내 스크립트 (상태는 window에 보관, 페이지 이동 시 초기화)
+READY_SCRIPT = """
+(conditions) => {
+    const state = window.__crawlerReadyState || (window.__crawlerReadyState = {});
+    const now = Date.now();
+    const stable = (key, value, minMs) => {
+        const previous = state[key];
+        if (!previous || previous.value !== value) {
+            state[key] = {value: value, since: now};
+            return false;
+        }
+        return now - previous.since >= minMs;
+    };
+
+    return conditions.every((c, i) => {
+        if (c.selector) {
+            return document.querySelector(c.selector) !== null;
+        }
+        if (c.count_stable) {
+            const count = document.querySelectorAll(c.count_stable).length;
+            return stable('count' + i, count, c.stable_ms || 500) && count >= (c.min || 1);
+        }
+        if (c.response) {
+            return performance.getEntriesByType('resource').some((entry) =>
+                (entry.initiatorType === 'xmlhttprequest' || entry.initiatorType === 'fetch') &&
+                entry.name.indexOf(c.response) !== -1);
+        }
+        if (c.ready_state) {
+            return document.readyState === c.ready_state;
+        }
+        if (c.resources_quiet_ms) {
+            if (!state.bufferResized && performance.setResourceTimingBufferSize) {
+                performance.setResourceTimingBufferSize(10000);
+                state.bufferResized = true;
+            }
+            const total = performance.getEntriesByType('resource').length;
+            return stable('resources' + i, total, c.resources_quiet_ms);
+        }
+        return true;
+    });
+}
+"""
+
+SELENIUM_READY_SCRIPT = "return (" + READY_SCRIPT.strip() + ")(arguments[0]);"
+
+# 프로필 조건이 없거나 충족되지 않을 때의 공통 조건
+DEFAULT_CONDITIONS = [{'ready_state': 'complete'}, {'resources_quiet_ms': 500}]
+
+DEFAULT_TIMEOUT = 10       # 프로필 조건 대기 (초)
+FALLBACK_TIMEOUT = 3       # 공통 조건 대기 (초)
+POLL_INTERVAL = 0.1        # 폴링 간격 (초)
+
+
+def wait_playwright(page, conditions, timeout=DEFAULT_TIMEOUT):
+    """Playwright 페이지에서 조건이 충족될 때까지 기다립니다. 충족되면 True"""
+    try:
+        page.wait_for_function(READY_SCRIPT, arg=conditions, timeout=timeout * 1000,
+                               polling=int(POLL_INTERVAL * 1000))
+        return True
+    except Exception as e:
+        print(f"[DEBUG] 준비 조건 대기 시간 초과 또는 오류: {str(e)[:80]}")
+        return False
+
+
+def wait_selenium(driver, conditions, timeout=DEFAULT_TIMEOUT):
+    """Selenium 드라이버에서 조건이 충족될 때까지 기다립니다. 충족되면 True
+    시간 초과뿐 아니라 스크립트 실행 오류(JavascriptException 등)도 False를 반환해 공통 조건으로 대신합니다.
+    """
+    from selenium.common.exceptions import WebDriverException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            lambda d: d.execute_script(SELENIUM_READY_SCRIPT, conditions)
+        )
+        return True
+    except WebDriverException as e:
+        # TimeoutException도 WebDriverException의 하위 클래스
+        print(f"[DEBUG] 준비 조건 대기 시간 초과 또는 오류: {str(e)[:80]}")
+        return False
+
+
+def wait_until_ready(wait, target, profile=None, timeout=DEFAULT_TIMEOUT, fallback_timeout=FALLBACK_TIMEOUT):
+    """프로필 조건을 기다리고, 없거나 실패하면 공통 조건으로 대신합니다.
+
+    wait: wait_playwright 또는 wait_selenium
+    반환값: 프로필 조건이 충족되었으면 True
+    """
+    conditions = (profile or {}).get('ready')
+    if conditions and wait(target, conditions, timeout):
+        return True
+
+    wait(target, DEFAULT_CONDITIONS, fallback_timeout)
+    return False
+
+
+async def wait_playwright_async(page, conditions, timeout=DEFAULT_TIMEOUT):
+    """wait_playwright의 playwright.async_api 버전"""
+    try:
+        await page.wait_for_function(READY_SCRIPT, arg=conditions, timeout=timeout * 1000,
+                                     polling=int(POLL_INTERVAL * 1000))
+        return True
+    except Exception as e:
+        print(f"[DEBUG] 준비 조건 대기 시간 초과 또는 오류: {str(e)[:80]}")
+        return False
+
+
+async def wait_until_ready_async(page, profile=None, timeout=DEFAULT_TIMEOUT, fallback_timeout=FALLBACK_TIMEOUT):
+    """wait_until_ready의 비동기 버전 (Playwright 비동기 페이지 전용)"""
+    conditions = (profile or {}).get('ready')
+    if conditions and await wait_playwright_async(page, conditions, timeout):
+        return True
+
+    await wait_playwright_async(page, DEFAULT_CONDITIONS, fallback_timeout)
+    return False
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+브라우저 리소스 차단 프로필
+추출기는 DOM 텍스트와 src/href 속성만 읽으므로 이미지, 폰트, 스타일시트,
+미디어, 트래커 요청을 막아 페이지 로딩 시간과 전송량을 줄입니다.
+Playwright는 리소스 종류/출처 단위로 route에서 차단하고,
+Selenium은 Chrome DevTools(Network.setBlockedURLs)의 URL 패턴으로 차단합니다.
+"""
+
+from urllib.parse import urlparse
+
+# 프로필별 차단 설정
+#   resource_types: 차단할 리소스 종류 (Playwright request.resource_type 기준)
+#   third_party: 다른 사이트에서 오는 하위 리소스를 모두 차단
+#   trackers: 알려진 분석/광고 도메인 차단
+BLOCKING_PROFILES = {
+    'none': {'resource_types': frozenset(), 'third_party': False, 'trackers': False},
+    'text-only': {
+        'resource_types': frozenset(['image', 'media', 'font', 'stylesheet']),
+        'third_party': False,
+        'trackers': True
+    },
+    'no-media': {
+        'resource_types': frozenset(['image', 'media', 'font']),
+        'third_party': False,
+        'trackers': True
+    },
+    'no-third-party': {'resource_types': frozenset(), 'third_party': True, 'trackers': True},
+}
+
+PROFILE_CHOICES = ["auto"] + list(BLOCKING_PROFILES)
+
+# 'auto'일 때 사이트 종류별 기본 프로필
+# (쇼핑/부동산/인스타그램은 CDN 도메인의 스크립트가 필요하므로 제3자 전체 차단은 사용하지 않음)
+SITE_TYPE_PROFILES = {
+    '일반': 'text-only',
+    '네이버 쇼핑': 'no-media',
+    '인스타그램': 'no-media',
+    '부동산': 'no-media'
+}
+
+TRACKER_DOMAINS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googlesyndication.com', 'facebook.net', 'connect.facebook.net',
+    'analytics.naver.com', 'wcs.naver.net', 'hotjar.com', 'criteo.com'
+)
+
+# Selenium(CDP)은 리소스 종류를 알 수 없으므로 확장자 패턴으로 대신함
+RESOURCE_URL_PATTERNS = {
+    'image': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico'],
+    'media': ['*.mp4', '*.webm', '*.mp3', '*.m3u8', '*.ts'],
+    'font': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'stylesheet': ['*.css']
+}
+
+# 2단계 국가 도메인 (site_of 계산용)
+SECOND_LEVEL_SUFFIXES = ('co.kr', 'or.kr', 'go.kr', 'ne.kr', 'ac.kr', 'co.jp', 'co.uk', 'com.au', 'com.cn')
+
+
+def site_of(host):
+    """호스트의 사이트(등록 도메인)를 근사적으로 구합니다. (예: shopping.naver.com -> naver.com)"""
+    host = (host or '').lower().split(':')[0]
+    labels = host.split('.')
+    if len(labels) >= 3 and '.'.join(labels[-2:]) in SECOND_LEVEL_SUFFIXES:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+def resolve_profile(name, site_type='일반', extract_images=False):
+    """프로필 이름('auto' 포함)을 실제 차단 설정으로 변환합니다.
+
+    이미지 추출이 켜져 있으면 이미지 요청은 차단하지 않습니다.
+    """
+    if not name or name == 'auto':
+        name = SITE_TYPE_PROFILES.get(site_type, 'text-only')
+
+    profile = dict(BLOCKING_PROFILES.get(name, BLOCKING_PROFILES['none']))
+    profile['name'] = name
+    if extract_images:
+        profile['resource_types'] = profile['resource_types'] - {'image'}
+    return profile
+
+
+class RequestBlocker:
+    """첫 페이지 URL 기준으로 요청 차단 여부를 판단합니다."""
+
+    def __init__(self, profile, first_party_url):
+        self.profile = profile
+        self.first_party_site = site_of(urlparse(first_party_url).netloc)
+        self.blocked = 0
+        self.allowed = 0
+
+    @property
+    def active(self):
+        profile = self.profile
+        return bool(profile['resource_types'] or profile['third_party'] or profile['trackers'])
+
+    def should_block(self, url, resource_type):
+        """요청을 차단해야 하면 True"""
+        # 문서 자체는 항상 허용
+        if resource_type == 'document':
+            return False
+
+        if resource_type in self.profile['resource_types']:
+            return True
+
+        host = urlparse(url).netloc.lower().split(':')[0]
+        if self.profile['trackers'] and any(host == d or host.endswith('.' + d) for d in TRACKER_DOMAINS):
+            return True
+
+        if self.profile['third_party'] and host and site_of(host) != self.first_party_site:
+            return True
+
+        return False
+
+    # Playwright
+    def handle_route(self, route, request):
+        """page.route / context.route 핸들러"""
+        if self.should_block(request.url, request.resource_type):
+            self.blocked += 1
+            route.abort()
+        else:
+            self.allowed += 1
+            route.continue_()
+
+    def install_playwright(self, context):
+        """컨텍스트의 모든 탭에 차단 규칙을 적용합니다."""
+        if self.active:
+            context.route("**/*", self.handle_route)
+
+    # Playwright 비동기 API (route 처리가 코루틴)
+    async def handle_route_async(self, route, request):
+        """비동기 page.route / context.route 핸들러"""
+        if self.should_block(request.url, request.resource_type):
+            self.blocked += 1
+            await route.abort()
+        else:
+            self.allowed += 1
+            await route.continue_()
+
+    async def install_playwright_async(self, context):
+        """비동기 컨텍스트의 모든 탭에 차단 규칙을 적용합니다."""
+        if self.active:
+            await context.route("**/*", self.handle_route_async)
+
+    # Selenium (Chrome DevTools Protocol)
+    def url_patterns(self):
+        """CDP Network.setBlockedURLs용 URL 패턴 (제3자 전체 차단은 표현할 수 없어 제외)"""
+        patterns = []
+        for resource_type in sorted(self.profile['resource_types']):
+            patterns.extend(RESOURCE_URL_PATTERNS.get(resource_type, []))
+        if self.profile['trackers']:
+            patterns.extend(f"*{domain}*" for domain in TRACKER_DOMAINS)
+        return patterns
+
+    def install_selenium(self, driver):
+        """드라이버에 차단 규칙을 적용합니다. (풀에서 재사용되므로 빈 목록도 매번 설정)"""
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.url_patterns()})
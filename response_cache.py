@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+디스크 기반 HTTP 응답 캐시
+정규화된 URL 기준으로 본문/헤더/검증자(ETag, Last-Modified)를 저장하고,
+재방문 시 조건부 요청을 보내 304 응답이면 저장된 본문을 재사용합니다.
+LRU 인덱스(index.json)는 응답마다 다시 쓰지 않고 INDEX_SAVE_INTERVAL초마다, 그리고 flush()/종료 시 저장합니다.
+본문/메타데이터 파일은 잠금 밖에서 임시 파일에 쓰고 os.replace로 교체하며(중단되어도 잘린 파일이 남지 않음),
+잠금은 인덱스/용량 계산과 제거 대상 선정에만 사용합니다.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_CACHE_DIR = "http_cache"
+INDEX_SAVE_INTERVAL = 5.0  # 인덱스 파일 저장 최소 간격 (초)
+
+
+def normalize_url(url):
+    """캐시 키용 URL 정규화 (스킴/호스트 소문자, 기본 포트/프래그먼트 제거, 쿼리 정렬)"""
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse((scheme, netloc, parsed.path or '/', parsed.params, query, ''))
+
+
+class ResponseCache:
+    """LRU 방식으로 크기가 제한된 디스크 응답 캐시"""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=200 * 1024 * 1024, max_entries=5000):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.index_file = os.path.join(directory, "index.json")
+
+        # 키 -> 본문 크기 (앞쪽일수록 오래 사용하지 않은 항목)
+        self._index = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._index_dirty = False
+        self._last_index_save = 0.0
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    # 인덱스 관리
+    def _load_index(self):
+        """저장된 LRU 인덱스를 처음 사용할 때 불러옵니다."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        for key, size in entries:
+            if os.path.exists(self._body_path(key)):
+                self._index[key] = size
+                self._total_bytes += size
+
+    def _save_index(self):
+        """LRU 인덱스를 원자적으로 저장합니다."""
+        os.makedirs(self.directory, exist_ok=True)
+        temp_file = self.index_file + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(list(self._index.items()), f)
+        os.replace(temp_file, self.index_file)
+        self._index_dirty = False
+        self._last_index_save = time.monotonic()
+
+    def _index_changed(self):
+        """인덱스 변경을 표시하고, 저장 간격이 지났으면 저장합니다. (잠금 안에서 호출)"""
+        self._index_dirty = True
+        if time.monotonic() - self._last_index_save >= INDEX_SAVE_INTERVAL:
+            self._save_index()
+
+    def flush(self):
+        """저장하지 않은 인덱스 변경을 기록합니다."""
+        with self._lock:
+            if self._index_dirty:
+                self._save_index()
+
+    def _body_path(self, key):
+        return os.path.join(self.directory, key + ".body")
+
+    def _meta_path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    @staticmethod
+    def key_for(url):
+        """URL의 캐시 키를 반환합니다."""
+        return hashlib.sha1(normalize_url(url).encode('utf-8')).hexdigest()
+
+    # 조회/저장
+    def lookup(self, url):
+        """캐시 항목(메타데이터)을 반환합니다. 없으면 None"""
+        key = self.key_for(url)
+        with self._lock:
+            self._load_index()
+            if key not in self._index:
+                return None
+            self._index.move_to_end(key)
+
+        try:
+            with open(self._meta_path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            self._remove(key)
+            return None
+
+    def read_body(self, url, expected_size=None):
+        """캐시된 본문을 읽습니다. (크기가 저장 당시와 다르면 OSError)"""
+        with open(self._body_path(self.key_for(url)), 'rb') as f:
+            body = f.read()
+        if expected_size is not None and len(body) != expected_size:
+            raise OSError(f"캐시 본문 크기 불일치: {len(body)} != {expected_size}")
+        return body
+
+    @staticmethod
+    def conditional_headers(entry):
+        """재검증 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, response):
+        """검증자가 있는 200 응답을 저장합니다."""
+        if response.status_code != 200:
+            return False
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return False
+        if 'no-store' in response.headers.get('Cache-Control', '').lower():
+            return False
+
+        body = response.content
+        if len(body) > self.max_bytes:
+            return False
+
+        key = self.key_for(url)
+        meta = {
+            'url': normalize_url(url),
+            'status': response.status_code,
+            'headers': dict(response.headers),
+            'encoding': response.encoding,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': time.time(),
+            'size': len(body)
+        }
+
+        with self._lock:
+            self._load_index()
+
+        # 파일 쓰기는 잠금 밖에서 (본문을 먼저 교체해야 메타데이터의 크기로 본문을 검증할 수 있음)
+        os.makedirs(self.directory, exist_ok=True)
+        self._write_atomic(self._body_path(key), body)
+        self._write_atomic(self._meta_path(key), json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+
+        with self._lock:
+            self._total_bytes -= self._index.pop(key, 0)
+            self._index[key] = len(body)
+            self._total_bytes += len(body)
+            self.stores += 1
+
+            evicted = self._evict()
+            self._index_changed()
+
+        for evicted_key in evicted:
+            self._delete_files(evicted_key)
+        return True
+
+    @staticmethod
+    def _write_atomic(path, data):
+        """임시 파일에 쓰고 교체합니다. (스레드별 임시 파일 이름)"""
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def _evict(self):
+        """용량/개수 제한을 넘으면 가장 오래 사용하지 않은 항목부터 인덱스에서 빼고 그 키 목록을 반환합니다.
+        (잠금 안에서 호출, 파일 삭제는 호출한 쪽에서 잠금 밖에서)
+        """
+        evicted = []
+        while self._index and (self._total_bytes > self.max_bytes or len(self._index) > self.max_entries):
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            evicted.append(key)
+        return evicted
+
+    def _remove(self, key):
+        with self._lock:
+            if key not in self._index:
+                return
+            self._total_bytes -= self._index.pop(key)
+            self._index_changed()
+        self._delete_files(key)
+
+    def _delete_files(self, key):
+        for path in (self._body_path(key), self._meta_path(key)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def build_response(self, url, entry):
+        """캐시 항목으로 requests.Response 객체를 만듭니다."""
+        response = requests.models.Response()
+        response.status_code = entry.get('status', 200)
+        response._content = self.read_body(url, entry.get('size'))
+        response.headers = CaseInsensitiveDict(entry.get('headers', {}))
+        response.encoding = entry.get('encoding')
+        response.url = url
+        return response
+
+    def fetch(self, sessions, url, **kwargs):
+        """조건부 요청으로 URL을 가져옵니다.
+
+        반환된 응답의 not_modified 속성이 True이면 서버가 304를 돌려주어
+        캐시된 본문을 재사용한 것입니다.
+        """
+        entry = self.lookup(url)
+        request_headers = dict(kwargs.pop('headers', None) or {})
+        headers = dict(request_headers)
+        if entry:
+            headers.update(self.conditional_headers(entry))
+
+        response = sessions.get(url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            try:
+                cached = self.build_response(url, entry)
+            except OSError:
+                cached = None
+
+            if cached is not None:
+                with self._lock:
+                    self.hits += 1
+                cached.not_modified = True
+                return cached
+
+            # 재사용할 본문이 없으므로 항목을 지우고 검증자 없이 전체 본문을 받음
+            self._remove(self.key_for(url))
+            response = sessions.get(url, headers=request_headers, **kwargs)
+
+        with self._lock:
+            self.misses += 1
+
+        response.not_modified = False
+        if response.status_code == 200:
+            self.store(url, response)
+        return response
+
+    def stats(self):
+        """캐시 적중/실패 통계를 반환합니다."""
+        with self._lock:
+            self._load_index()
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits / total * 100) if total else 0.0,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'entries': len(self._index),
+                'bytes': self._total_bytes
+            }
+
+    def clear(self):
+        """캐시를 모두 비웁니다."""
+        with self._lock:
+            self._load_index()
+            for key in list(self._index):
+                self._delete_files(key)
+            self._index.clear()
+            self._total_bytes = 0
+            if os.path.isdir(self.directory):
+                self._save_index()
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache(directory=DEFAULT_CACHE_DIR):
+    """크롤러와 모니터가 함께 사용하는 캐시 인스턴스를 반환합니다."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache(directory)
+            atexit.register(_shared_cache.flush)
+        return _shared_cache
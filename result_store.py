@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 결과 저장소
+결과 레코드를 메모리 목록 대신 저장소에 쌓아 두고, 내보내기/스마트 뷰/분석 탭은
+저장소를 조회하거나 일정 개수씩 이어 읽습니다.
+목록과 같은 append/extend/len/반복/슬라이스를 지원하므로 기존 crawled_data 코드를 그대로 쓸 수 있습니다.
+레코드는 CrawlRecord로 저장/반환합니다. (dict를 추가하면 변환)
+
+- MemoryResultStore: 파이썬 목록 (테스트/짧은 크롤링용)
+- SQLiteResultStore: SQLite 파일. 크롤링 스레드의 추가는 버퍼에 모았다가 한 트랜잭션으로 기록하고,
+  타입/도메인/수집 시각 인덱스로 조회하며, id 기준 커서로 나눠 읽어 메모리 사용량이 일정합니다.
+  경로를 지정하지 않으면 임시 디렉터리에 프로세스별 파일을 만들고 close()할 때 삭제합니다.
+  (여러 창/프로세스가 같은 파일을 지우거나 섞어 쓰지 않도록)
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from crawl_record import CrawlRecord, as_record
+
+DEFAULT_DB_DIR = os.path.join(tempfile.gettempdir(), "crawling-practice")
+DEFAULT_BATCH_SIZE = 200      # 한 트랜잭션에 기록할 레코드 수
+DEFAULT_FLUSH_INTERVAL = 1.0  # 버퍼를 기록하는 최대 간격 (초)
+DEFAULT_FETCH_SIZE = 500      # 반복 시 한 번에 읽는 레코드 수
+
+STORE_BACKENDS = ["sqlite", "memory"]
+
+
+def session_db_path(directory=DEFAULT_DB_DIR):
+    """이 프로세스 전용 결과 DB 경로"""
+    return os.path.join(directory, f"crawl_results_{os.getpid()}.sqlite3")
+
+
+def _timestamp(value):
+    """datetime 또는 epoch 초를 epoch 초로 변환합니다."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class ResultStore(ABC):
+    """결과 저장소 공통 인터페이스
+
+    하위 클래스는 add_many, iter_records, count, count_by, slice_records, clear를 구현합니다.
+    조회 조건: record_type(레코드 'type'), domain, since/until(수집 시각, datetime 또는 epoch 초)
+    generation은 clear()할 때마다 늘어나며, 체크포인트 저널이 새 크롤링인지 판단할 때 사용합니다.
+    """
+
+    generation = 0
+
+    @abstractmethod
+    def add_many(self, records):
+        """레코드 목록을 저장 순서대로 추가합니다."""
+
+    @abstractmethod
+    def iter_records(self, record_type=None, domain=None, since=None, until=None):
+        """조건에 맞는 레코드를 저장 순서대로 반환합니다."""
+
+    @abstractmethod
+    def count(self, record_type=None, domain=None, since=None, until=None):
+        """조건에 맞는 레코드 수"""
+
+    @abstractmethod
+    def count_by(self, field):
+        """'type' 또는 'domain'별 레코드 수 {값: 개수} (많은 순)"""
+
+    @abstractmethod
+    def slice_records(self, start, stop):
+        """저장 순서로 start 이상 stop 미만 번째 레코드 목록"""
+
+    @abstractmethod
+    def records_after(self, cursor, limit=None):
+        """커서(0 또는 이전에 돌려준 값) 뒤에 저장된 레코드 목록과 새 커서 (체크포인트 증분용)"""
+
+    @abstractmethod
+    def clear(self):
+        """모든 레코드를 지우고 generation을 늘립니다."""
+
+    def recent(self, limit):
+        """마지막에 저장한 limit개 레코드 (저장 순서)"""
+        total = len(self)
+        return self.slice_records(max(0, total - limit), total)
+
+    def flush(self):
+        """버퍼에 남은 레코드를 기록합니다."""
+
+    def close(self):
+        self.flush()
+
+    # 목록 호환 인터페이스 (기존 crawled_data 사용 코드용)
+    def append(self, record):
+        self.add_many([record])
+
+    def extend(self, records):
+        self.add_many(list(records))
+
+    def __len__(self):
+        return self.count()
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __iter__(self):
+        return self.iter_records()
+
+    def __getitem__(self, index):
+        total = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(total)
+            records = self.slice_records(start, stop) if start < stop else []
+            return records[::step] if step != 1 else records
+
+        if index < 0:
+            index += total
+        if not 0 <= index < total:
+            raise IndexError("결과 저장소 인덱스 범위 초과")
+        return self.slice_records(index, index + 1)[0]
+
+
+class MemoryResultStore(ResultStore):
+    """파이썬 목록에 보관하는 저장소"""
+
+    def __init__(self):
+        self._records = []
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    def add_many(self, records):
+        records = [as_record(record) for record in records]
+        with self._lock:
+            self._records.extend(records)
+
+    def iter_records(self, record_type=None, domain=None, since=None, until=None):
+        since, until = _timestamp(since), _timestamp(until)
+        with self._lock:
+            records = list(self._records)
+        for record in records:
+            if record_type is not None and record.type != record_type:
+                continue
+            if domain is not None and record.domain != domain.lower():
+                continue
+            if since is not None and record.crawl_time < since:
+                continue
+            if until is not None and record.crawl_time >= until:
+                continue
+            yield record
+
+    def count(self, record_type=None, domain=None, since=None, until=None):
+        if record_type is None and domain is None and since is None and until is None:
+            return len(self._records)
+        return sum(1 for _ in self.iter_records(record_type, domain, since, until))
+
+    def count_by(self, field):
+        counts = {}
+        for record in self.iter_records():
+            value = getattr(record, field)
+            counts[value] = counts.get(value, 0) + 1
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
+    def slice_records(self, start, stop):
+        with self._lock:
+            return self._records[start:stop]
+
+    def records_after(self, cursor, limit=None):
+        """커서는 목록 인덱스"""
+        with self._lock:
+            stop = len(self._records) if limit is None else min(len(self._records), cursor + limit)
+            return self._records[cursor:stop], max(cursor, stop)
+
+    def clear(self):
+        with self._lock:
+            self._records = []
+            self.generation += 1
+
+
+class SQLiteResultStore(ResultStore):
+    """SQLite 파일에 보관하는 저장소
+
+    여러 스레드에서 추가할 수 있으며, 추가한 레코드는 batch_size개가 모이거나
+    flush_interval초가 지나면 한 트랜잭션으로 기록합니다. 조회 전에는 버퍼를 먼저 기록합니다.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            type TEXT,
+            domain TEXT,
+            crawl_time REAL NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_records_type ON records (type);
+        CREATE INDEX IF NOT EXISTS idx_records_domain ON records (domain);
+        CREATE INDEX IF NOT EXISTS idx_records_crawl_time ON records (crawl_time);
+    """
+
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL,
+                 fetch_size=DEFAULT_FETCH_SIZE, delete_on_close=False):
+        self.path = path
+        self.delete_on_close = delete_on_close
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fetch_size = fetch_size
+        self.generation = 0
+
+        self._pending = []  # 아직 기록하지 않은 (type, domain, 수집 시각, JSON)
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ':memory:':
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    def add_many(self, records):
+        rows = []
+        for record in records:
+            record = as_record(record)
+            rows.append((record.type, record.domain, record.crawl_time,
+                         json.dumps(record.to_dict(), ensure_ascii=False, default=str)))
+
+        with self._lock:
+            self._pending.extend(rows)
+            if (len(self._pending) >= self.batch_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._pending:
+                with self._conn:  # 한 트랜잭션
+                    self._conn.executemany(
+                        "INSERT INTO records (type, domain, crawl_time, data) VALUES (?, ?, ?, ?)",
+                        self._pending
+                    )
+                self._pending = []
+            self._last_flush = time.monotonic()
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            self.flush()
+            return self._conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _where(record_type=None, domain=None, since=None, until=None):
+        clauses, params = [], []
+        if record_type is not None:
+            clauses.append("type = ?")
+            params.append(record_type)
+        if domain is not None:
+            clauses.append("domain = ?")
+            params.append(domain.lower())
+        if since is not None:
+            clauses.append("crawl_time >= ?")
+            params.append(_timestamp(since))
+        if until is not None:
+            clauses.append("crawl_time < ?")
+            params.append(_timestamp(until))
+        return clauses, params
+
+    @staticmethod
+    def _output(row):
+        return CrawlRecord(crawl_time=row[1], **json.loads(row[2]))
+
+    def iter_records(self, record_type=None, domain=None, since=None, until=None):
+        """id 기준 커서로 fetch_size개씩 읽습니다. (읽는 동안 트랜잭션/잠금을 유지하지 않음)"""
+        clauses, params = self._where(record_type, domain, since, until)
+        last_id = 0
+        while True:
+            sql = "SELECT id, crawl_time, data FROM records WHERE " + " AND ".join(clauses + ["id > ?"])
+            rows = self._query(sql + " ORDER BY id LIMIT ?", params + [last_id, self.fetch_size])
+            for row in rows:
+                yield self._output(row)
+            if len(rows) < self.fetch_size:
+                return
+            last_id = rows[-1][0]
+
+    def count(self, record_type=None, domain=None, since=None, until=None):
+        clauses, params = self._where(record_type, domain, since, until)
+        sql = "SELECT COUNT(*) FROM records"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        return self._query(sql, params)[0][0]
+
+    def count_by(self, field):
+        if field not in ('type', 'domain'):
+            raise ValueError(f"집계할 수 없는 필드: {field}")
+        rows = self._query(f"SELECT {field}, COUNT(*) FROM records GROUP BY {field} ORDER BY COUNT(*) DESC")
+        return dict(rows)
+
+    def slice_records(self, start, stop):
+        if stop <= start:
+            return []
+        rows = self._query("SELECT id, crawl_time, data FROM records ORDER BY id LIMIT ? OFFSET ?",
+                           (stop - start, start))
+        return [self._output(row) for row in rows]
+
+    def records_after(self, cursor, limit=None):
+        """커서는 마지막으로 읽은 id (OFFSET 없이 id 인덱스로 바로 찾음)"""
+        rows = self._query("SELECT id, crawl_time, data FROM records WHERE id > ? ORDER BY id LIMIT ?",
+                           (cursor, -1 if limit is None else limit))
+        if not rows:
+            return [], cursor
+        return [self._output(row) for row in rows], rows[-1][0]
+
+    def clear(self):
+        with self._lock:
+            self._pending = []
+            with self._conn:
+                self._conn.execute("DELETE FROM records")
+            self.generation += 1
+
+    def close(self):
+        with self._lock:
+            if self.delete_on_close:
+                self._pending = []
+            else:
+                self.flush()
+            self._conn.close()
+
+        if self.delete_on_close and self.path != ':memory:':
+            for suffix in ('', '-wal', '-shm'):
+                try:
+                    os.remove(self.path + suffix)
+                except OSError:
+                    pass
+
+
+def create_result_store(backend="sqlite", path=None, **options):
+    """설정한 방식의 결과 저장소를 만듭니다. (SQLite 파일을 열 수 없으면 메모리 저장소)
+
+    path가 없으면 session_db_path()의 프로세스별 파일을 사용하고 close()할 때 삭제합니다.
+    """
+    if backend == "sqlite":
+        if path is None:
+            path = session_db_path()
+            options.setdefault('delete_on_close', True)
+        try:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            return SQLiteResultStore(path, **options)
+        except sqlite3.Error as e:
+            print(f"[DEBUG] SQLite 결과 저장소 열기 실패, 메모리 저장소 사용: {e}")
+    return MemoryResultStore()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+재시도 정책
+오류를 재시도 가능/불가능으로 분류하고, 지수 백오프(지터 포함)와
+Retry-After 헤더를 적용합니다. requests, Selenium, Playwright 경로가 함께 사용합니다.
+"""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from rate_limiter import interruptible_sleep
+
+
+class HttpStatusError(Exception):
+    """HTTP 오류 상태 코드 (브라우저 엔진 응답용)"""
+
+    def __init__(self, status, url='', headers=None):
+        super().__init__(f"HTTP {status}: {url}")
+        self.status = status
+        self.url = url
+        self.headers = headers or {}
+
+
+class RetryPolicy:
+    """지수 백오프 재시도 정책"""
+
+    # 일시적인 오류로 보고 재시도하는 상태 코드
+    RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+    # 다시 시도해도 결과가 같은 오류 (잘못된 URL, 파싱/코드 오류 등)
+    FATAL_ERRORS = (ValueError, TypeError, AttributeError, KeyError)
+
+    def __init__(self, max_retries=3, base_delay=1.0, max_delay=30.0, jitter=0.5,
+                 retryable_statuses=None, max_retry_after=120):
+        # max_retries: 페이지당 최대 시도 횟수
+        self.max_retries = max(1, int(max_retries))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retryable_statuses = frozenset(retryable_statuses or self.RETRYABLE_STATUSES)
+        self.max_retry_after = max_retry_after
+
+    @staticmethod
+    def status_of(error):
+        """오류에서 HTTP 상태 코드를 추출합니다. (없으면 None)"""
+        if isinstance(error, HttpStatusError):
+            return error.status
+        response = getattr(error, 'response', None)
+        return getattr(response, 'status_code', None)
+
+    @staticmethod
+    def headers_of(error):
+        """오류에서 응답 헤더를 추출합니다."""
+        if isinstance(error, HttpStatusError):
+            return error.headers
+        response = getattr(error, 'response', None)
+        return getattr(response, 'headers', None) or {}
+
+    def is_retryable(self, error):
+        """재시도할 가치가 있는 오류인지 판단합니다."""
+        status = self.status_of(error)
+        if status is not None:
+            return status in self.retryable_statuses
+
+        if isinstance(error, self.FATAL_ERRORS):
+            return False
+
+        # 연결 오류, 타임아웃, 브라우저 오류는 일시적일 수 있음
+        return True
+
+    def should_retry(self, error, attempt):
+        """attempt(0부터 시작)번째 시도가 실패한 뒤 다시 시도할지 결정합니다."""
+        return attempt + 1 < self.max_retries and self.is_retryable(error)
+
+    def retry_after(self, error):
+        """Retry-After 헤더 값을 초 단위로 반환합니다. (없으면 None)"""
+        headers = self.headers_of(error)
+        value = None
+        for key, header_value in headers.items():
+            if key.lower() == 'retry-after':
+                value = str(header_value).strip()
+                break
+
+        if not value:
+            return None
+
+        if value.isdigit():
+            seconds = float(value)
+        else:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+        return min(max(seconds, 0.0), self.max_retry_after)
+
+    def backoff(self, attempt):
+        """지터가 적용된 지수 백오프 대기 시간을 계산합니다."""
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(delay * (1 - self.jitter), delay)
+
+    def next_delay(self, attempt, error):
+        """다음 시도 전 대기 시간 (Retry-After 우선)"""
+        retry_after = self.retry_after(error)
+        if retry_after is not None:
+            return retry_after
+        return self.backoff(attempt)
+
+    # 중지 요청을 확인하면서 대기 (요청 제한기와 같은 함수)
+    sleep = staticmethod(interruptible_sleep)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+사이트별 추출 프로필
+사이트마다 목록/제목/가격/링크/이미지 셀렉터(대체 셀렉터 포함)를 정의하고, 브라우저 안에서
+한 번의 스크립트 실행으로 모든 항목을 JSON 배열로 가져오는 일괄 추출에 사용합니다.
+Playwright는 page.evaluate, Selenium은 execute_script로 실행하여 항목마다
+query_selector/find_element/get_attribute를 호출하는 왕복 비용을 없앱니다.
+"""
+
+from urllib.parse import urljoin, urlparse
+
+from crawl_record import CrawlRecord
+
+# 페이지 안에서 실행되는 일괄 추출 스크립트 (spec -> [{title, price, url, image_url}, ...])
+BULK_EXTRACT_SCRIPT = """
+(spec) => {
+    const first = (root, selectors) => {
+        for (const selector of selectors || []) {
+            try {
+                const node = root.querySelector(selector);
+                if (node) return node;
+            } catch (e) {}
+        }
+        return null;
+    };
+    const textProperty = spec.text_property || 'textContent';
+    const text = (node) => node ? (node[textProperty] || '').trim() : null;
+    const attr = (node, name) => node ? node.getAttribute(name) : null;
+
+    let items = Array.from(document.querySelectorAll(spec.item));
+    if (spec.limit) items = items.slice(0, spec.limit);
+
+    return items.map((el) => ({
+        title: text(first(el, spec.title)),
+        price: text(first(el, spec.price)),
+        url: attr(first(el, spec.link), 'href'),
+        image_url: attr(first(el, spec.image), 'src')
+    }));
+}
+"""
+
+# Selenium execute_script용 래퍼 (arguments[0]으로 사양 전달)
+SELENIUM_BULK_EXTRACT_SCRIPT = "return (" + BULK_EXTRACT_SCRIPT.strip() + ")(arguments[0]);"
+
+# Playwright 크롤링용 사이트 프로필
+PLAYWRIGHT_PROFILES = {
+    'naver_shopping': {
+        'type': '네이버쇼핑',
+        'wait': '.basicList_list_basis__uNBZx, .product_list, .goods_list',
+        'item': '.basicList_item__FxDgW, .product_item, .goods_item',
+        'limit': 20,
+        'title': ['.basicList_title__3P9Q7, .product_title, .goods_name'],
+        'price': ['.price_num__2WUXn, .product_price, .price'],
+        'link': ['a'],
+        'image': ['img'],
+        'title_fallback': "상품 {n}",
+        'description': "네이버 쇼핑 상품 (페이지 {page})",
+        # 준비 조건 (readiness.py 형식): 상품 수가 늘어나지 않을 때까지
+        'ready': [{'count_stable': '.basicList_item__FxDgW, .product_item, .goods_item', 'stable_ms': 500}]
+    },
+    'instagram': {
+        'type': '인스타그램',
+        'wait': 'article, ._aagu',
+        'item': 'article, ._aagu',
+        'limit': 10,
+        'title': [],
+        'price': [],
+        'link': [],  # 게시물 링크 대신 현재 페이지 URL 사용
+        'image': ['img'],
+        'fixed_title': "Instagram Post {n}",
+        'description': "인스타그램 게시물 (페이지 {page})",
+        'ready': [{'selector': 'article img, ._aagu img'}]
+    },
+    'real_estate': {
+        'type': '부동산',
+        'wait': '.item, .property, .list-item',
+        'item': '.item, .property, .list-item',
+        'limit': 15,
+        'title': ['.item-title, .property-title, .title, h3, h4'],
+        'price': ['.price, .item-price, .property-price'],
+        'link': ['a'],
+        'image': ['img'],
+        'title_fallback': "매물 {n}",
+        'description': "부동산 매물 (페이지 {page})",
+        'ready': [{'count_stable': '.item, .property, .list-item', 'stable_ms': 500}]
+    }
+}
+
+
+# Selenium 크롤링용 사이트 프로필
+# required: 이 필드를 찾지 못한 항목은 건너뜀 (해당 추출 옵션이 켜진 경우)
+SELENIUM_PROFILES = {
+    'naver_shopping': {
+        'type': '네이버쇼핑',
+        'wait': '.basicList_list__2YY7H, .product_list, .list_basis',
+        'item': '.basicList_item__1MBN3, .product_item, .item',
+        'title': ['.basicList_title__3P9Q7, .product_title, .item_title'],
+        'price': ['.price_num__2WUXn, .product_price, .item_price'],
+        'link': ['a'],
+        'image': ['img'],
+        'required': ['title', 'price', 'url', 'image_url'],
+        'text_property': 'innerText',  # WebElement.text와 같이 화면에 보이는 텍스트
+        'description': "네이버쇼핑 상품 (페이지 {page})",
+        'ready': [{'count_stable': '.basicList_item__1MBN3, .product_item, .item', 'stable_ms': 500}]
+    },
+    'instagram': {
+        'type': '인스타그램',
+        'item': 'article, ._aagu, .v1Nh3',
+        'limit': 10,
+        'title': [],
+        'price': [],
+        'link': [],
+        'image': ['img'],
+        'text_property': 'innerText',
+        'fixed_title': "Instagram Post {n}",
+        'description': "인스타그램 게시물 (페이지 {page})",
+        'ready': [{'selector': 'article img, ._aagu img, .v1Nh3 img'}]
+    },
+    'real_estate': {
+        'type': '부동산',
+        'item': '.item, .list-item, .property-item, .estate-item',
+        'title': ['.item-title', '.property-title', '.title', 'h3', 'h4'],
+        'price': ['.price', '.cost', '.amount', '.fee'],
+        'link': ['a'],
+        'image': [],
+        'text_property': 'innerText',
+        'description': "부동산 매물 (페이지 {page})",
+        'ready': [{'count_stable': '.item, .list-item, .property-item, .estate-item', 'stable_ms': 500}]
+    }
+}
+
+
+# UI 사이트 종류 -> 프로필 키 (Selenium 모드)
+SITE_TYPE_KEYS = {
+    '네이버 쇼핑': 'naver_shopping',
+    '인스타그램': 'instagram',
+    '부동산': 'real_estate'
+}
+
+
+def profile_key_for_url(url):
+    """URL의 도메인으로 사이트 프로필 키를 찾습니다. (일반 사이트는 None)"""
+    domain = urlparse(url).netloc.lower()
+    if 'shopping.naver.com' in domain:
+        return 'naver_shopping'
+    if 'instagram.com' in domain:
+        return 'instagram'
+    if any(keyword in domain for keyword in ['zigbang', 'dabang', '부동산']):
+        return 'real_estate'
+    return None
+
+
+def script_spec(profile):
+    """일괄 추출 스크립트에 넘길 셀렉터 사양"""
+    return {
+        'item': profile['item'],
+        'limit': profile.get('limit'),
+        'title': profile.get('title', []),
+        'price': profile.get('price', []),
+        'link': profile.get('link', []),
+        'image': profile.get('image', []),
+        'text_property': profile.get('text_property', 'textContent')
+    }
+
+
+def build_records(profile, items, page_url, current_page,
+                  extract_title=True, extract_price=True, extract_images=True):
+    """일괄 추출 결과를 crawled_data 레코드(CrawlRecord)로 변환합니다."""
+    records = []
+    required = set(profile.get('required', ()))
+    enabled = {'title': extract_title, 'price': extract_price, 'url': True, 'image_url': extract_images}
+
+    for i, item in enumerate(items):
+        # 필수 필드가 없는 항목은 건너뜀
+        if any(enabled[field] and item.get(field) is None for field in required):
+            continue
+
+        data = CrawlRecord(profile['type'])
+
+        if profile.get('fixed_title'):
+            data['title'] = profile['fixed_title'].format(n=i + 1)
+        elif extract_title:
+            if item.get('title') is not None:
+                data['title'] = item['title']
+            elif profile.get('title_fallback'):
+                data['title'] = profile['title_fallback'].format(n=i + 1)
+
+        if extract_price and item.get('price') is not None:
+            data['price'] = item['price']
+
+        data['url'] = urljoin(page_url, item['url']) if item.get('url') else page_url
+
+        if extract_images and item.get('image_url'):
+            data['image_url'] = urljoin(page_url, item['image_url'])
+
+        data['description'] = profile['description'].format(page=current_page)
+        records.append(data)
+
+    return records
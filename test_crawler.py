@@ -6,6 +6,7 @@
 
 import pytest
 import unittest
+import contextlib
 from unittest.mock import Mock, patch, MagicMock
 import tkinter as tk
 import threading
@@ -14,7 +15,7 @@ import os
 import tempfile
 import json
 import pickle
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # 테스트 대상 모듈 import
 import main
@@ -389,6 +390,1485 @@ class TestPerformance(unittest.TestCase):
         self.assertEqual(len(df), 1000)
 
 
+class TestHttpSessionManager(unittest.TestCase):
+    """HTTP 세션 풀 테스트"""
+    
+    def test_session_reuse(self):
+        """같은 크롤링 안에서 세션 재사용 테스트"""
+        from http_session import HttpSessionManager
+        
+        with HttpSessionManager(pool_size=4) as sessions:
+            first = sessions.session_for("https://a.example.com/page1")
+            second = sessions.session_for("https://b.example.com/page2")
+            self.assertIs(first, second)
+            self.assertIn('User-Agent', first.headers)
+            self.assertEqual(first.headers['Connection'], 'keep-alive')
+    
+    def test_per_host_sessions(self):
+        """호스트별 세션 분리 테스트"""
+        from http_session import HttpSessionManager
+        
+        with HttpSessionManager(per_host=True) as sessions:
+            first = sessions.session_for("https://a.example.com/page1")
+            same_host = sessions.session_for("https://A.example.com/page2")
+            other_host = sessions.session_for("https://b.example.com/")
+            self.assertIs(first, same_host)
+            self.assertIsNot(first, other_host)
+    
+    @patch('requests.Session.get')
+    def test_get_uses_default_timeout(self, mock_get):
+        """기본 타임아웃 적용 테스트"""
+        from http_session import HttpSessionManager
+        
+        sessions = HttpSessionManager(timeout=7)
+        sessions.get("https://example.com")
+        mock_get.assert_called_once_with("https://example.com", timeout=7)
+        sessions.close()
+
+
+class TestRateLimiter(unittest.TestCase):
+    """도메인별 토큰 버킷 요청 제한 테스트"""
+    
+    def test_burst_then_wait(self):
+        """버스트 이후에만 대기하는지 테스트"""
+        from rate_limiter import DomainRateLimiter
+        
+        limiter = DomainRateLimiter(rate=20, burst=2)
+        self.assertEqual(limiter.acquire("https://example.com/1"), 0)
+        self.assertEqual(limiter.acquire("https://example.com/2"), 0)
+        self.assertGreater(limiter.acquire("https://example.com/3"), 0)
+    
+    def test_domains_are_independent(self):
+        """다른 도메인 요청은 대기하지 않는지 테스트"""
+        from rate_limiter import DomainRateLimiter
+        
+        limiter = DomainRateLimiter(rate=1, burst=1)
+        limiter.acquire("https://a.example.com/")
+        self.assertEqual(limiter.acquire("https://b.example.com/"), 0)
+    
+    def test_delay_conversion(self):
+        """요청 간격 설정 변환 테스트"""
+        from rate_limiter import DomainRateLimiter
+        
+        limiter = DomainRateLimiter(rate=1, burst=1)
+        limiter.configure_delay("https://fast.example.com", 0)
+        for _ in range(5):
+            self.assertEqual(limiter.acquire("https://fast.example.com/page"), 0)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """재시도 정책 테스트"""
+    
+    def make_http_error(self, status, headers=None):
+        import requests
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers or {})
+        return requests.exceptions.HTTPError(f"{status} error", response=response)
+    
+    def test_error_classification(self):
+        """상태 코드/오류 종류별 재시도 여부 테스트"""
+        import requests
+        from retry_policy import RetryPolicy, HttpStatusError
+        
+        policy = RetryPolicy(max_retries=3)
+        self.assertFalse(policy.is_retryable(self.make_http_error(404)))
+        self.assertTrue(policy.is_retryable(self.make_http_error(503)))
+        self.assertTrue(policy.is_retryable(HttpStatusError(429)))
+        self.assertTrue(policy.is_retryable(requests.exceptions.ConnectionError("reset")))
+        self.assertFalse(policy.is_retryable(requests.exceptions.MissingSchema("bad url")))
+        
+        # 마지막 시도 이후에는 재시도하지 않음
+        self.assertTrue(policy.should_retry(self.make_http_error(500), 0))
+        self.assertFalse(policy.should_retry(self.make_http_error(500), 2))
+    
+    def test_retry_after_header(self):
+        """Retry-After 헤더 적용 테스트"""
+        from retry_policy import RetryPolicy
+        
+        policy = RetryPolicy(max_retry_after=60)
+        self.assertEqual(policy.next_delay(0, self.make_http_error(429, {'Retry-After': '7'})), 7)
+        self.assertEqual(policy.retry_after(self.make_http_error(429, {'Retry-After': '600'})), 60)
+        self.assertIsNone(policy.retry_after(self.make_http_error(503)))
+    
+    def test_exponential_backoff(self):
+        """지터가 적용된 지수 백오프 범위 테스트"""
+        from retry_policy import RetryPolicy
+        
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0.5)
+        for attempt, upper in [(0, 1.0), (1, 2.0), (2, 4.0), (5, 5.0)]:
+            delay = policy.backoff(attempt)
+            self.assertGreaterEqual(delay, upper * 0.5)
+            self.assertLessEqual(delay, upper)
+    
+    def test_sleep_shared_with_rate_limiter(self):
+        """재시도 대기가 요청 제한기와 같은 대기 함수를 쓰고 중지 요청에 바로 멈추는지 테스트"""
+        from rate_limiter import interruptible_sleep
+        from retry_policy import RetryPolicy
+        
+        self.assertIs(RetryPolicy.sleep, interruptible_sleep)
+        
+        started = time.monotonic()
+        RetryPolicy().sleep(5, should_continue=lambda: False)
+        self.assertLess(time.monotonic() - started, 0.5)
+
+
+class TestResponseCache(unittest.TestCase):
+    """디스크 응답 캐시 테스트"""
+    
+    def make_response(self, status, body=b'', headers=None):
+        import requests
+        response = requests.Response()
+        response.status_code = status
+        response._content = body
+        response.headers.update(headers or {})
+        return response
+    
+    def test_conditional_revalidation(self):
+        """ETag 저장 후 304 응답 시 캐시 본문 재사용 테스트"""
+        from response_cache import ResponseCache
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ResponseCache(temp_dir)
+            sessions = Mock()
+            sessions.get.return_value = self.make_response(200, b'<html>v1</html>', {'ETag': '"abc"'})
+            
+            first = cache.fetch(sessions, "https://Example.com:443/list?b=2&a=1#top")
+            self.assertFalse(first.not_modified)
+            
+            sessions.get.return_value = self.make_response(304)
+            second = cache.fetch(sessions, "https://example.com/list?a=1&b=2")
+            self.assertTrue(second.not_modified)
+            self.assertEqual(second.content, b'<html>v1</html>')
+            self.assertEqual(sessions.get.call_args[1]['headers']['If-None-Match'], '"abc"')
+            self.assertEqual((cache.stats()['hits'], cache.stats()['misses']), (1, 1))
+    
+    def test_missing_body_refetches_unconditionally(self):
+        """304인데 캐시 본문이 없거나 손상되면 항목을 지우고 조건 없이 다시 요청하는지 테스트"""
+        from response_cache import ResponseCache
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ResponseCache(temp_dir)
+            url = "https://example.com/list"
+            sessions = Mock()
+            sessions.get.return_value = self.make_response(200, b'<html>v1</html>', {'ETag': '"abc"'})
+            cache.fetch(sessions, url)
+            
+            # 본문 파일이 잘림
+            with open(cache._body_path(cache.key_for(url)), 'wb') as f:
+                f.write(b'<ht')
+            
+            sessions.get.side_effect = [self.make_response(304),
+                                        self.make_response(200, b'<html>v2</html>', {'ETag': '"def"'})]
+            response = cache.fetch(sessions, url, headers={'User-Agent': 'test'})
+            
+            self.assertFalse(response.not_modified)
+            self.assertEqual(response.content, b'<html>v2</html>')
+            retry_headers = sessions.get.call_args[1]['headers']
+            self.assertEqual(retry_headers, {'User-Agent': 'test'})
+            self.assertEqual(cache.lookup(url)['etag'], '"def"')
+    
+    def test_index_write_is_deferred(self):
+        """응답마다 인덱스 파일을 다시 쓰지 않고 flush()에서 저장하는지 테스트"""
+        from response_cache import ResponseCache
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ResponseCache(temp_dir)
+            headers = {'ETag': '"v"'}
+            with patch.object(cache, '_save_index', wraps=cache._save_index) as save_index:
+                for i in range(20):
+                    cache.store(f"https://example.com/{i}", self.make_response(200, b'x', headers))
+                self.assertEqual(save_index.call_count, 1)
+                
+                cache.flush()
+                self.assertEqual(save_index.call_count, 2)
+            
+            self.assertEqual(ResponseCache(temp_dir).stats()['entries'], 20)
+    
+    def test_store_writes_files_outside_lock(self):
+        """본문/메타데이터를 잠금 밖에서 임시 파일로 쓰고 교체하는지 테스트"""
+        from response_cache import ResponseCache
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ResponseCache(temp_dir)
+            lock_free = []
+            write_atomic = cache._write_atomic
+            
+            def checked_write(path, data):
+                acquired = cache._lock.acquire(blocking=False)
+                lock_free.append(acquired)
+                if acquired:
+                    cache._lock.release()
+                write_atomic(path, data)
+            
+            with patch.object(cache, '_write_atomic', side_effect=checked_write):
+                cache.store("https://example.com/1", self.make_response(200, b'body', {'ETag': '"v"'}))
+            
+            self.assertEqual(lock_free, [True, True])
+            self.assertEqual(cache.read_body("https://example.com/1", 4), b'body')
+            self.assertFalse([name for name in os.listdir(temp_dir) if name.endswith('.tmp')])
+    
+    def test_lru_eviction(self):
+        """용량 제한 초과 시 가장 오래된 항목 제거 테스트"""
+        from response_cache import ResponseCache
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ResponseCache(temp_dir, max_bytes=25)
+            headers = {'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+            cache.store("https://example.com/1", self.make_response(200, b'x' * 10, headers))
+            cache.store("https://example.com/2", self.make_response(200, b'x' * 10, headers))
+            cache.lookup("https://example.com/1")
+            cache.store("https://example.com/3", self.make_response(200, b'x' * 10, headers))
+            
+            self.assertIsNotNone(cache.lookup("https://example.com/1"))
+            self.assertIsNone(cache.lookup("https://example.com/2"))
+            self.assertEqual(cache.stats()['evictions'], 1)
+            
+            # 검증자가 없는 응답은 저장하지 않음
+            self.assertFalse(cache.store("https://example.com/4", self.make_response(200, b'x')))
+
+
+class TestPageExtractor(unittest.TestCase):
+    """단일 순회 페이지 추출 테스트"""
+    
+    def test_extract_page(self):
+        """제목/설명/링크/이미지/본문 추출 및 원본 트리 보존 테스트"""
+        from bs4 import BeautifulSoup
+        from page_extractor import extract_page
+        
+        html = """
+        <html><head><title> 테스트 \n 페이지 </title>
+        <meta name="description" content="설명  내용">
+        <style>.a { color: red; }</style></head>
+        <body><p>본문   텍스트</p><script>var x = 1;</script>
+        <a href="/one">첫 링크</a><a href="two">두번째</a><a>href 없음</a>
+        <img src="/a.png" alt="그림"><img alt="src 없음"></body></html>
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        result = extract_page("https://example.com/dir/", soup, max_links=1)
+        
+        self.assertEqual(result.title, "테스트 페이지")
+        self.assertEqual(result.description, "설명 내용")
+        self.assertEqual(result.link_count, 2)
+        self.assertEqual(result.links, [("첫 링크", "https://example.com/one")])
+        self.assertEqual(result.images, [("그림", "https://example.com/a.png")])
+        self.assertIn("본문 텍스트", result.text)
+        self.assertNotIn("var x", result.text)
+        self.assertNotIn("color", result.text)
+        
+        # script/style 태그를 제거하지 않음
+        self.assertIsNotNone(soup.find('script'))
+    
+    def test_strainer_parsing(self):
+        """텍스트 추출을 끈 경우 필요한 태그만 파싱하는지 테스트"""
+        from page_extractor import parse_html, page_strainer, extract_page, resolve_parser, LXML_AVAILABLE
+        
+        self.assertEqual(resolve_parser('auto'), 'lxml' if LXML_AVAILABLE else 'html.parser')
+        self.assertIsNone(page_strainer(extract_text=True))
+        
+        html = "<html><head><title>제목</title></head><body><div><p>본문</p><a href='/x'>링크</a><img src='y.png'></div></body></html>"
+        options = {'extract_links': True, 'extract_images': False, 'extract_text': False}
+        soup = parse_html(html, 'auto', page_strainer(**options))
+        
+        self.assertIsNone(soup.find('p'))
+        self.assertIsNone(soup.find('img'))
+        result = extract_page("https://example.com/", soup, **options)
+        self.assertEqual(result.title, "제목")
+        self.assertEqual(result.links, [("링크", "https://example.com/x")])
+
+
+class TestUiUpdateQueue(unittest.TestCase):
+    """작업 스레드 → 메인 스레드 UI 큐 테스트"""
+    
+    def test_bounded_queue_and_drain(self):
+        """크기 제한, 중지 시 포기, 순서대로 반영 테스트"""
+        from ui_bridge import UiUpdateQueue
+        
+        ui_queue = UiUpdateQueue(Mock(), maxsize=2)
+        applied = []
+        self.assertTrue(ui_queue.put(applied.append, 1))
+        self.assertTrue(ui_queue.put(applied.append, 2))
+        
+        # 큐가 가득 찬 상태에서 중지 요청이 있으면 기다리지 않음
+        self.assertFalse(ui_queue.put(applied.append, 3, should_continue=lambda: False))
+        
+        self.assertEqual(ui_queue.drain(), 2)
+        self.assertEqual(applied, [1, 2])
+        self.assertEqual(ui_queue.pending(), 0)
+    
+    def test_treeview_batch_sink(self):
+        """행 묶음 반영과 화면 행 수 제한 테스트"""
+        from ui_bridge import TreeviewBatchSink
+        
+        root = Mock()
+        tree = Mock()
+        tree.insert.side_effect = [f"row{i}" for i in range(5)]
+        sink = TreeviewBatchSink(root, tree, batch_size=3, max_live_rows=2)
+        
+        sink.add_many([{'type': '링크', 'title': f'항목 {i}', 'url': f'https://example.com/{i}'} for i in range(5)])
+        self.assertEqual(root.after.call_count, 1)  # 행마다 이벤트를 만들지 않음
+        self.assertEqual(root.after.call_args[0][0], 0)  # 묶음 크기를 넘으면 즉시 반영
+        
+        sink.flush()
+        self.assertEqual(tree.insert.call_count, 3)
+        sink.flush()
+        self.assertEqual(tree.insert.call_count, 5)
+        
+        # 오래된 행부터 화면에서 제거
+        self.assertEqual(sink.trimmed_rows, 3)
+        self.assertEqual(list(sink._live_rows), ["row3", "row4"])
+
+
+class TestSiteProfiles(unittest.TestCase):
+    """사이트 프로필 일괄 추출 테스트"""
+    
+    def test_build_records_from_bulk_items(self):
+        """일괄 추출 결과의 레코드 변환 테스트"""
+        from site_profiles import PLAYWRIGHT_PROFILES, build_records, profile_key_for_url
+        
+        self.assertEqual(profile_key_for_url("https://search.shopping.naver.com/search"), 'naver_shopping')
+        self.assertIsNone(profile_key_for_url("https://example.com"))
+        
+        items = [
+            {'title': '노트북', 'price': '1,200,000원', 'url': '/catalog/1', 'image_url': None},
+            {'title': None, 'price': None, 'url': None, 'image_url': 'https://img.example.com/2.jpg'}
+        ]
+        records = build_records(PLAYWRIGHT_PROFILES['naver_shopping'], items,
+                                "https://shopping.naver.com/list", 3, extract_images=True)
+        
+        self.assertEqual(records[0]['url'], "https://shopping.naver.com/catalog/1")
+        self.assertEqual(records[0]['price'], '1,200,000원')
+        self.assertNotIn('image_url', records[0])
+        self.assertEqual(records[1]['title'], "상품 2")
+        self.assertEqual(records[1]['url'], "https://shopping.naver.com/list")
+        self.assertEqual(records[1]['description'], "네이버 쇼핑 상품 (페이지 3)")
+    
+    def test_selenium_required_fields(self):
+        """Selenium 프로필의 필수 필드 누락 항목 제외 테스트"""
+        from site_profiles import SELENIUM_PROFILES, SELENIUM_BULK_EXTRACT_SCRIPT, build_records
+        
+        self.assertTrue(SELENIUM_BULK_EXTRACT_SCRIPT.startswith("return ("))
+        items = [
+            {'title': '상품', 'price': '10,000원', 'url': 'https://shopping.naver.com/1', 'image_url': None},
+            {'title': '상품', 'price': None, 'url': 'https://shopping.naver.com/2', 'image_url': None}
+        ]
+        records = build_records(SELENIUM_PROFILES['naver_shopping'], items,
+                                "https://shopping.naver.com/", 1, extract_images=False)
+        self.assertEqual([record['url'] for record in records], ["https://shopping.naver.com/1"])
+        
+        # 부동산 프로필은 제목이 없어도 항목을 유지
+        records = build_records(SELENIUM_PROFILES['real_estate'], [{'title': None, 'price': None, 'url': None}],
+                                "https://zigbang.com/list", 1)
+        self.assertNotIn('title', records[0])
+        self.assertEqual(records[0]['url'], "https://zigbang.com/list")
+
+
+class TestSeleniumDriverPool(unittest.TestCase):
+    """Selenium 드라이버 풀 테스트 (가짜 드라이버 사용)"""
+    
+    def test_reuse_and_recycle(self):
+        """드라이버 재사용, 페이지 수 기준 교체, 응답 없는 드라이버 교체 테스트"""
+        from driver_pool import SeleniumDriverPool
+        
+        created = []
+        def factory():
+            driver = MagicMock()
+            driver.execute_script.return_value = None
+            created.append(driver)
+            return driver
+        
+        pool = SeleniumDriverPool(size=1, max_pages=2, driver_factory=factory)
+        
+        lease = pool.acquire()
+        lease.record_page()
+        pool.release(lease)
+        
+        # 같은 브라우저 재사용, 풀 크기를 넘으면 대기 후 시간 초과
+        lease = pool.acquire()
+        self.assertIs(lease.driver, created[0])
+        with self.assertRaises(TimeoutError):
+            pool.acquire(timeout=0.1)
+        
+        # 페이지 수 기준을 넘으면 반납 시 종료하고 다음 대여 때 새로 생성
+        lease.record_page()
+        pool.release(lease)
+        created[0].quit.assert_called_once()
+        self.assertIs(pool.acquire().driver, created[1])
+        
+        pool.close()
+        with self.assertRaises(RuntimeError):
+            pool.acquire()
+
+    
+    def test_health_check_runs_outside_lock(self):
+        """대기 중인 드라이버의 상태 확인 동안 풀 잠금을 잡지 않고, 응답 없으면 같은 자리에 새로 만드는지 테스트"""
+        from driver_pool import SeleniumDriverPool
+        
+        created = []
+        def factory():
+            driver = MagicMock()
+            driver.execute_script.return_value = None
+            created.append(driver)
+            return driver
+        
+        pool = SeleniumDriverPool(size=1, driver_factory=factory)
+        pool.release(pool.acquire())
+        
+        lock_free = []
+        def try_lock():
+            acquired = pool._condition.acquire(blocking=False)
+            lock_free.append(acquired)
+            if acquired:
+                pool._condition.release()
+        
+        def is_healthy(lease):
+            # 다른 스레드가 잠금을 바로 얻을 수 있어야 함
+            checker = threading.Thread(target=try_lock)
+            checker.start()
+            checker.join()
+            return False
+        
+        with patch.object(pool, 'is_healthy', side_effect=is_healthy):
+            lease = pool.acquire()
+        
+        self.assertEqual(lock_free, [True])
+        created[0].quit.assert_called_once()
+        self.assertIs(lease.driver, created[1])
+        self.assertEqual(pool._leased, 1)
+        pool.close()
+
+class TestPlaywrightBrowserService(unittest.TestCase):
+    """Playwright 브라우저 서비스 테스트 (브라우저 실행 없이 소유 스레드 동작 확인)"""
+    
+    def test_jobs_run_on_single_owner_thread(self):
+        """모든 작업이 같은 소유 스레드의 이벤트 루프에서 같은 브라우저로 실행되는지 테스트"""
+        from browser_service import PlaywrightBrowserService
+        
+        browser = object()
+        launches = []
+        service = PlaywrightBrowserService()
+        
+        async def ensure_browser():
+            launches.append(1)
+            return browser
+        
+        service._ensure_browser = ensure_browser
+        
+        async def job(received_browser, value):
+            return received_browser, threading.current_thread().name, value
+        
+        async def fail(received_browser):
+            return int("x")
+        
+        try:
+            first = service.call(job, 1)
+            second = service.submit(job, 2).result(timeout=5)
+            self.assertIs(first[0], browser)
+            self.assertEqual(first[1], second[1])
+            self.assertNotEqual(first[1], threading.current_thread().name)
+            self.assertEqual(second[2], 2)
+            
+            # 작업 오류는 호출한 쪽으로 전달
+            with self.assertRaises(ValueError):
+                service.call(fail)
+        finally:
+            service.close()
+        self.assertIsNone(service._thread)
+    
+    def test_waiting_job_does_not_block_others(self):
+        """한 작업이 대기(await)하는 동안 다른 작업이 먼저 끝나는지 테스트"""
+        import asyncio
+        from browser_service import PlaywrightBrowserService
+        
+        service = PlaywrightBrowserService()
+        
+        async def ensure_browser():
+            return None
+        
+        service._ensure_browser = ensure_browser
+        finished = []
+        
+        async def job(browser, name, delay):
+            await asyncio.sleep(delay)  # 요청 제한/재시도 대기
+            finished.append(name)
+        
+        try:
+            slow = service.submit(job, "slow", 0.3)
+            fast = service.submit(job, "fast", 0.01)
+            fast.result(timeout=5)
+            self.assertEqual(finished, ["fast"])
+            slow.result(timeout=5)
+        finally:
+            service.close()
+
+
+class TestResourceBlocking(unittest.TestCase):
+    """브라우저 리소스 차단 프로필 테스트"""
+    
+    def test_profiles_and_image_bypass(self):
+        """프로필별 차단 판단과 이미지 추출 시 예외 처리 테스트"""
+        from resource_blocking import RequestBlocker, resolve_profile, site_of
+        
+        self.assertEqual(site_of("shopping.naver.com"), "naver.com")
+        self.assertEqual(site_of("www.example.co.kr"), "example.co.kr")
+        
+        blocker = RequestBlocker(resolve_profile('auto', '네이버 쇼핑'), "https://shopping.naver.com/list")
+        self.assertTrue(blocker.should_block("https://shopping-phinf.pstatic.net/a.jpg", 'image'))
+        self.assertTrue(blocker.should_block("https://www.google-analytics.com/collect", 'xhr'))
+        self.assertFalse(blocker.should_block("https://ssl.pstatic.net/app.js", 'script'))
+        self.assertFalse(blocker.should_block("https://shopping.naver.com/list", 'document'))
+        self.assertIn('*.jpg', blocker.url_patterns())
+        
+        # 이미지 추출이 켜져 있으면 이미지는 허용
+        blocker = RequestBlocker(resolve_profile('text-only', extract_images=True), "https://example.com")
+        self.assertFalse(blocker.should_block("https://example.com/a.png", 'image'))
+        self.assertTrue(blocker.should_block("https://example.com/a.css", 'stylesheet'))
+        
+        blocker = RequestBlocker(resolve_profile('no-third-party'), "https://m.example.com")
+        self.assertTrue(blocker.should_block("https://cdn.other.com/lib.js", 'script'))
+        self.assertFalse(blocker.should_block("https://static.example.com/lib.js", 'script'))
+        
+        # 차단 없음 프로필은 route를 설치하지 않음
+        context = Mock()
+        RequestBlocker(resolve_profile('none'), "https://example.com").install_playwright(context)
+        context.route.assert_not_called()
+
+
+class TestReadiness(unittest.TestCase):
+    """페이지 준비 조건 테스트"""
+    
+    def test_profile_conditions_with_fallback(self):
+        """프로필 조건 우선, 실패 시 공통 조건으로 대체하는지 테스트"""
+        from readiness import wait_until_ready, wait_playwright, DEFAULT_CONDITIONS
+        
+        calls = []
+        def fake_wait(target, conditions, timeout):
+            calls.append(conditions)
+            return conditions is not DEFAULT_CONDITIONS and target == 'ready'
+        
+        profile = {'ready': [{'selector': '.item'}]}
+        self.assertTrue(wait_until_ready(fake_wait, 'ready', profile))
+        self.assertEqual(calls, [[{'selector': '.item'}]])
+        
+        calls.clear()
+        self.assertFalse(wait_until_ready(fake_wait, 'slow', profile))
+        self.assertEqual(calls, [[{'selector': '.item'}], DEFAULT_CONDITIONS])
+        
+        # 프로필이 없으면 공통 조건만 사용
+        calls.clear()
+        wait_until_ready(fake_wait, 'ready', None)
+        self.assertEqual(calls, [DEFAULT_CONDITIONS])
+        
+        # Playwright 대기 시간 초과는 예외 대신 False
+        page = Mock()
+        page.wait_for_function.side_effect = Exception("Timeout 10000ms exceeded")
+        self.assertFalse(wait_playwright(page, DEFAULT_CONDITIONS, timeout=1))
+        self.assertEqual(page.wait_for_function.call_args[1]['arg'], DEFAULT_CONDITIONS)
+    
+    def test_selenium_script_error_falls_back(self):
+        """Selenium 스크립트 실행 오류도 예외 대신 False로 공통 조건 대기로 넘어가는지 테스트"""
+        from selenium.common.exceptions import JavascriptException
+        from readiness import wait_until_ready, wait_selenium, DEFAULT_CONDITIONS
+        
+        driver = Mock()
+        driver.execute_script.side_effect = JavascriptException("Content Security Policy")
+        
+        self.assertFalse(wait_selenium(driver, DEFAULT_CONDITIONS, timeout=1))
+        self.assertFalse(wait_until_ready(wait_selenium, driver, {'ready': [{'selector': '.item'}]},
+                                          timeout=1, fallback_timeout=1))
+        self.assertEqual(driver.execute_script.call_args[0][1], DEFAULT_CONDITIONS)
+
+
+class TestAsyncPlaywrightEngine(unittest.TestCase):
+    """비동기 Playwright 엔진 테스트 (브라우저 실행 없이 가짜 탭으로 확인)"""
+    
+    def test_crawl_page_retries_and_extracts(self):
+        """실패한 페이지를 재시도하고 일반 페이지를 PageResult로 추출하는지 테스트"""
+        import asyncio
+        from async_engine import AsyncPlaywrightEngine
+        from retry_policy import RetryPolicy
+        
+        class FakeTab:
+            def __init__(self):
+                self.url = "https://example.com/list?page=2"
+                self.gotos = 0
+            
+            async def goto(self, url, **kwargs):
+                self.gotos += 1
+                if self.gotos == 1:
+                    raise TimeoutError("navigation timeout")
+                return Mock(status=200, headers={})
+            
+            async def wait_for_function(self, *args, **kwargs):
+                return True
+            
+            async def content(self):
+                return "<html><head><title>목록</title></head><body><a href='/a'>A</a></body></html>"
+        
+        engine = AsyncPlaywrightEngine(retry_policy=RetryPolicy(max_retries=3, base_delay=0.01, jitter=0))
+        tab = FakeTab()
+        outcome = asyncio.run(engine.crawl_page(tab, 2, tab.url))
+        
+        self.assertTrue(outcome.ok)
+        self.assertEqual(outcome.attempts, 2)
+        self.assertEqual(outcome.page_result.title, "목록")
+        self.assertEqual(outcome.page_result.links, [("A", "https://example.com/a")])
+        
+        # 중지 요청 후에는 요청하지 않음
+        engine.cancel()
+        outcome = asyncio.run(engine.crawl_page(FakeTab(), 3, tab.url))
+        self.assertEqual(outcome.attempts, 1)
+        self.assertIsNone(outcome.page_result)
+    
+    def test_workers_limit_host_and_deliver_off_loop(self):
+        """호스트별 동시 요청 수를 지키고 결과 전달은 이벤트 루프 밖에서 하는지 테스트"""
+        import asyncio
+        from async_engine import AsyncPlaywrightEngine
+        
+        state = {'active': 0, 'max_active': 0}
+        
+        class FakeTab:
+            url = "https://example.com/"
+            
+            async def goto(self, url, **kwargs):
+                self.url = url
+                state['active'] += 1
+                state['max_active'] = max(state['max_active'], state['active'])
+                await asyncio.sleep(0.02)
+                state['active'] -= 1
+                return Mock(status=200, headers={})
+            
+            async def wait_for_function(self, *args, **kwargs):
+                return True
+            
+            async def content(self):
+                return "<html><head><title>목록</title></head></html>"
+            
+            async def close(self):
+                pass
+        
+        class FakeContext:
+            async def new_page(self):
+                return FakeTab()
+        
+        delivered = []
+        
+        def on_page(outcome):
+            time.sleep(0.01)  # 느린 체크포인트 저장 등
+            delivered.append((outcome.page_no, threading.current_thread().name))
+        
+        async def run():
+            queue = asyncio.Queue()
+            for page in range(1, 7):
+                queue.put_nowait((page, f"https://example.com/?page={page}"))
+            return await engine.run_workers(FakeContext(), queue, on_page)
+        
+        engine = AsyncPlaywrightEngine(concurrency=4, max_per_host=2)
+        results = asyncio.run(run())
+        
+        self.assertEqual(sum(results), 6)
+        self.assertEqual(state['max_active'], 2)
+        self.assertEqual(sorted(page for page, _ in delivered), [1, 2, 3, 4, 5, 6])
+        self.assertTrue(all(name.startswith("async-delivery") for _, name in delivered))
+    
+    def test_run_uses_service_browser(self):
+        """run()이 브라우저를 새로 실행하지 않고 서비스 브라우저의 새 컨텍스트에서 크롤링하는지 테스트"""
+        from async_engine import AsyncPlaywrightEngine
+        from browser_service import PlaywrightBrowserService
+        
+        contexts = []
+        
+        class FakeTab:
+            url = "https://example.com/"
+            
+            async def goto(self, url, **kwargs):
+                self.url = url
+                return Mock(status=200, headers={})
+            
+            async def wait_for_function(self, *args, **kwargs):
+                return True
+            
+            async def content(self):
+                return "<html><head><title>목록</title></head></html>"
+            
+            async def close(self):
+                pass
+        
+        class FakeContext:
+            closed = False
+            
+            async def add_init_script(self, script):
+                pass
+            
+            async def new_page(self):
+                return FakeTab()
+            
+            async def close(self):
+                self.closed = True
+        
+        class FakeBrowser:
+            async def new_context(self, **options):
+                contexts.append(FakeContext())
+                return contexts[-1]
+        
+        browser = FakeBrowser()
+        service = PlaywrightBrowserService()
+        
+        async def ensure_browser():
+            return browser
+        
+        service._ensure_browser = ensure_browser
+        delivered = []
+        try:
+            for _ in range(2):
+                engine = AsyncPlaywrightEngine(concurrency=2)
+                pages = [(page, f"https://example.com/?page={page}") for page in range(1, 4)]
+                self.assertEqual(engine.run(pages, delivered.append, service=service), 3)
+        finally:
+            service.close()
+        
+        self.assertEqual(len(contexts), 2)
+        self.assertTrue(all(context.closed for context in contexts))
+        self.assertEqual(sorted(outcome.page_no for outcome in delivered), [1, 1, 2, 2, 3, 3])
+    
+    def test_completion_tracker(self):
+        """뒤섞인 완료 순서에서 연속 완료 지점을 기록하는지 테스트"""
+        from async_engine import CompletionTracker
+        
+        tracker = CompletionTracker(start_page=3)
+        self.assertEqual(tracker.mark(4), 2)
+        self.assertEqual(tracker.mark(5), 2)
+        self.assertEqual(tracker.mark(3), 5)
+        self.assertEqual(tracker.next_page, 6)
+        self.assertEqual(tracker.count, 3)
+
+
+class TestCrawlEngine(unittest.TestCase):
+    """UI 독립 크롤링 엔진/헤드리스 CLI 테스트 (HTTP 세션은 가짜 객체)"""
+    
+    def fake_sessions(self):
+        from retry_policy import HttpStatusError
+        
+        def get(url, **kwargs):
+            if url.endswith('page=2'):
+                raise HttpStatusError(404, url)
+            response = Mock(status_code=200, encoding='utf-8', headers={})
+            response.text = f"<html><head><title>{url}</title></head><body><a href='/a'>A</a></body></html>"
+            return response
+        
+        sessions = Mock()
+        sessions.get.side_effect = get
+        return sessions
+    
+    def test_engine_runs_with_plain_config(self):
+        """Tk 없이 설정 객체만으로 크롤링하고 진행 상황을 기록하는지 테스트"""
+        from crawl_engine import CrawlConfig, CrawlEngine
+        from rate_limiter import DomainRateLimiter
+        
+        config = CrawlConfig("https://example.com/list", max_pages=3, crawl_delay=0,
+                             use_response_cache=False, extract_images=False)
+        pages = []
+        engine = CrawlEngine(config, on_page=pages.append, rate_limiter=DomainRateLimiter(rate=None))
+        
+        with patch('crawl_engine.HttpSessionManager', return_value=self.fake_sessions()):
+            progress = engine.run()
+        
+        self.assertEqual([outcome.page_no for outcome in pages], [1, 3])
+        self.assertEqual(pages[0].records[0]['title'], "https://example.com/list")
+        self.assertEqual(pages[0].records[1]['url'], "https://example.com/a")
+        self.assertEqual(progress['failed_pages'], [2])
+        self.assertEqual(progress['settings']['max_pages'], 3)
+    
+    def test_cli_crawl_without_tk(self):
+        """CLI 크롤링이 tk.Tk()를 만들지 않고 결과 파일을 쓰는지 테스트"""
+        out_path = os.path.join(tempfile.mkdtemp(), "result.json")
+        
+        with patch('crawl_engine.HttpSessionManager', return_value=self.fake_sessions()), \
+             patch('main.tk.Tk', side_effect=AssertionError("GUI 생성됨")):
+            code = main.cli_main(['crawl', 'https://example.com/list', '--pages', '1', '--delay', '0',
+                                  '--no-cache', '-o', out_path])
+        
+        self.assertEqual(code, 0)
+        with open(out_path, encoding='utf-8') as f:
+            records = json.load(f)
+        self.assertEqual(records[0]['type'], '페이지')
+    
+    def concurrent_engine(self, max_pages, workers, delays=None, on_page=None):
+        """crawl_pages_concurrently용 엔진 (페이지별 응답 지연을 줄 수 있는 가짜 세션)"""
+        from crawl_engine import CrawlConfig, CrawlEngine
+        from rate_limiter import DomainRateLimiter
+        
+        config = CrawlConfig("https://example.com/list", max_pages=max_pages, crawl_delay=0, workers=workers,
+                             max_requests_per_host=workers, use_response_cache=False, extract_images=False)
+        engine = CrawlEngine(config, on_page=on_page, rate_limiter=DomainRateLimiter(rate=None))
+        sessions = self.fake_sessions()
+        get = sessions.get.side_effect
+        
+        def delayed_get(url, **kwargs):
+            page = int(url.rsplit('page=', 1)[1]) if 'page=' in url else 1
+            time.sleep((delays or {}).get(page, 0))
+            return get(url, **kwargs)
+        
+        sessions.get.side_effect = delayed_get
+        engine.http_sessions = sessions
+        return engine
+    
+    def test_concurrent_pages_delivered_in_order(self):
+        """작업 스레드가 뒤섞인 순서로 끝나도 페이지 순서대로 전달하고 실패 페이지를 기록하는지 테스트"""
+        pages = []
+        finished = []
+        # 앞 페이지일수록 늦게 끝남
+        engine = self.concurrent_engine(5, workers=4, delays={1: 0.15, 3: 0.1, 4: 0.05}, on_page=pages.append)
+        original_fetch = engine.fetch_page
+        
+        def fetch_page(page_url, page):
+            outcome = original_fetch(page_url, page)
+            finished.append(page)
+            return outcome
+        
+        with patch.object(engine, 'fetch_page', side_effect=fetch_page):
+            engine.crawl_pages_concurrently(1, 5, workers=4)
+        
+        self.assertNotEqual(finished[:4], sorted(finished[:4]))
+        self.assertEqual([outcome.page_no for outcome in pages], [1, 3, 4, 5])
+        self.assertEqual(engine.progress['failed_pages'], [2])
+        self.assertEqual(engine.progress['completed_pages'], 5)
+    
+    def test_concurrent_pages_stop_cancels_queued(self):
+        """중지하면 대기 중인 페이지를 요청하지 않고 실패로 기록하지도 않는지 테스트"""
+        pages = []
+        
+        def on_page(outcome):
+            pages.append(outcome)
+            engine.stop()
+        
+        engine = self.concurrent_engine(20, workers=2, delays={page: 0.05 for page in range(2, 21)},
+                                        on_page=on_page)
+        engine.crawl_pages_concurrently(1, 20, workers=2)
+        
+        self.assertEqual([outcome.page_no for outcome in pages], [1])
+        self.assertLessEqual(engine.http_sessions.get.call_count, 4)  # 미리 요청한 페이지(워커 수 x 2)까지만
+        self.assertEqual(engine.progress['failed_pages'], [])
+    
+    def test_playwright_tabs_run_concurrently(self):
+        """Playwright 모드는 탭 수와 관계없이 브라우저 서비스 루프의 비동기 엔진으로 진행하는지 테스트"""
+        from crawl_engine import CrawlConfig, CrawlEngine
+        
+        for workers in (1, 3):
+            engine = CrawlEngine(CrawlConfig("https://example.com", browser_mode="playwright", workers=workers,
+                                             use_response_cache=False))
+            with patch.object(engine, 'crawl_playwright_async') as crawl_async:
+                engine.crawl_playwright(2)
+            
+            crawl_async.assert_called_once_with(2, concurrency=workers)
+
+    def test_price_alert_helpers_roundtrip(self):
+        """가격 알림 헬퍼가 GUI 모듈 없이 동작하고 JSON 변환이 왕복되는지 테스트"""
+        import price_alerts
+        from datetime import datetime
+
+        now = datetime(2024, 1, 1, 9, 0)
+        item = {'name': '상품', 'target_price': 9000, 'created_at': now,
+                'price_history': [{'price': 10000, 'timestamp': now}, {'price': 8000, 'timestamp': now}]}
+
+        messages = price_alerts.price_alert_messages(item, 8000, 5.0)
+        self.assertEqual(len(messages), 2)
+        self.assertIn("목표 가격 달성", messages[0])
+        self.assertIn("하락", messages[1])
+
+        saved = price_alerts.monitoring_items_to_json([item])
+        self.assertEqual(saved[0]['created_at'], now.isoformat())
+        loaded = price_alerts.monitoring_items_from_json(json.loads(json.dumps(saved)))
+        self.assertEqual(loaded[0]['price_history'][1]['timestamp'], now)
+        self.assertNotIn('tkinter', price_alerts.__dict__)
+
+
+class TestStartupTime(unittest.TestCase):
+    """프로그램 시작(import main) 시간 테스트"""
+    
+    # 처음 사용할 때 불러와야 하는 무거운 의존성
+    LAZY_MODULES = ['pandas', 'matplotlib', 'seaborn', 'selenium', 'webdriver_manager',
+                    'playwright', 'plyer', 'schedule']
+    
+    def measure_import(self):
+        """새 인터프리터에서 main을 import하는 시간과 함께 불러온 무거운 모듈을 측정합니다."""
+        import subprocess
+        import sys
+        
+        script = (
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import main\n"
+            "elapsed = time.perf_counter() - start\n"
+            f"loaded = [name for name in {self.LAZY_MODULES!r} if name in sys.modules]\n"
+            "print(json.dumps({'elapsed': elapsed, 'loaded': loaded}))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return json.loads(result.stdout.strip().splitlines()[-1])
+    
+    def test_heavy_dependencies_load_lazily(self):
+        """import main이 무거운 의존성을 불러오지 않고 시간 기준 안에 끝나는지 테스트"""
+        measurement = self.measure_import()
+        
+        self.assertEqual(measurement['loaded'], [])
+        # 성능 기준: 느린 환경을 고려해 1.5초 이내 (무거운 모듈 회귀는 위 검사가 잡음)
+        self.assertLess(measurement['elapsed'], 1.5)
+
+
+class FakeTkVar:
+    """디스플레이 없이 WebCrawlerApp/스마트 뷰어를 만들기 위한 Tk 변수 대용"""
+    
+    def __init__(self, master=None, value=None):
+        self.value = value
+    
+    def get(self):
+        return '' if self.value is None else self.value
+    
+    def set(self, value):
+        self.value = value
+    
+    def trace(self, mode, callback):
+        pass
+
+
+@contextlib.contextmanager
+def headless_app():
+    """Tk 위젯을 Mock으로 바꾼 WebCrawlerApp (임시 폴더에서 실행)"""
+    fake_tk = MagicMock(StringVar=FakeTkVar, BooleanVar=FakeTkVar, IntVar=FakeTkVar)
+    original_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            with patch.multiple(main, tk=fake_tk, ttk=MagicMock(), scrolledtext=MagicMock()):
+                app = WebCrawlerApp(MagicMock())
+                try:
+                    yield app
+                finally:
+                    app.result_store.close()
+        finally:
+            os.chdir(original_dir)
+
+
+class TestLazyTabs(unittest.TestCase):
+    """탭 지연 구성 및 스케줄러 지연 시작 테스트 (Tk 없이 메서드만 호출)"""
+    
+    def test_tab_built_once_on_first_open(self):
+        """탭을 처음 열 때 한 번만 구성하고, 구성 메서드를 공유하는 탭도 완료 처리하는지 테스트"""
+        from types import SimpleNamespace
+        
+        static_content = Mock()
+        alert_tab = Mock()
+        app = SimpleNamespace(lazy_tabs={'.recommend': static_content, '.tech': static_content,
+                                         '.alert': alert_tab})
+        
+        WebCrawlerApp.ensure_tab(app, '.tech')
+        WebCrawlerApp.ensure_tab(app, '.recommend')
+        WebCrawlerApp.ensure_tab(app, '.info')  # 지연 구성 대상이 아닌 탭
+        
+        static_content.assert_called_once_with()
+        alert_tab.assert_not_called()
+        self.assertEqual(list(app.lazy_tabs), ['.alert'])
+    
+    def test_scheduler_starts_on_first_use(self):
+        """스케줄러가 처음 필요할 때 한 번만 생성/시작되는지 테스트"""
+        from types import SimpleNamespace
+        
+        app = SimpleNamespace(scheduler=None)
+        with patch('apscheduler.schedulers.background.BackgroundScheduler') as scheduler_class:
+            first = WebCrawlerApp.get_scheduler(app)
+            second = WebCrawlerApp.get_scheduler(app)
+        
+        self.assertIs(first, second)
+        scheduler_class.assert_called_once_with()
+        first.start.assert_called_once_with()
+    
+    def test_crawl_starts_without_opening_tabs(self):
+        """지연 구성 탭을 열지 않아도 크롤링을 시작하고 체크포인트 상태를 갱신하는지 테스트"""
+        with headless_app() as app:
+            with patch.object(main.threading, 'Thread') as thread_class:
+                app.start_crawling()
+        
+        self.assertFalse(hasattr(app, 'schedule_tree'))  # 스케줄링 탭은 구성되지 않음
+        self.assertEqual(thread_class.call_args.kwargs['target'], app.crawl_website_checkpoint)
+        thread_class.return_value.start.assert_called_once_with()
+        self.assertTrue(app.checkpoint_status.get().startswith("체크포인트 있음"))
+    
+    def test_browser_modes_run_through_engine(self):
+        """Selenium 모드도 작업 스레드에서 Tk 변수 대신 CrawlEngine 설정으로 크롤링하는지 테스트"""
+        with headless_app() as app:
+            app.browser_mode.set("selenium")
+            app.extract_price.set(False)
+            with patch.object(main.threading, 'Thread') as thread_class:
+                app.start_crawling()
+            
+            # 작업 스레드 시작 후 화면 설정을 바꿔도 엔진 설정은 그대로
+            app.extract_price.set(True)
+            target = thread_class.call_args.kwargs['target']
+            with patch.object(main, 'CrawlEngine') as engine_class:
+                target(*thread_class.call_args.kwargs['args'])
+        
+        config = engine_class.call_args.args[0]
+        self.assertEqual(config.browser_mode, "selenium")
+        self.assertFalse(config.extract_price)
+        engine_class.return_value.run.assert_called_once_with(1)
+    
+    def test_engine_pages_stored_before_checkpoint(self):
+        """작업 스레드에서 결과를 저장소에 바로 추가하고 메인 스레드에는 테이블 표시만 넘기는지 테스트"""
+        from async_engine import PageOutcome
+        
+        with headless_app() as app:
+            app.is_crawling = True
+            app.ui_queue = Mock()
+            outcome = PageOutcome(1, "https://example.com")
+            outcome.records = [{'type': '상품', 'title': 'A'}, {'type': '상품', 'title': 'B'}]
+            
+            app.deliver_engine_page(outcome)
+            # 메인 스레드가 큐를 처리하기 전에 저장하는 체크포인트에도 포함됨
+            self.assertEqual([record['title'] for record in app.crawled_data], ['A', 'B'])
+            
+            callback, records = app.ui_queue.put.call_args.args
+            app.table_sink = Mock()
+            callback(records)
+            app.table_sink.add_many.assert_called_once_with(records)
+            self.assertEqual(len(app.crawled_data), 2)
+
+
+class TestCheckpointJournal(unittest.TestCase):
+    """추가 전용 체크포인트 저널 테스트"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "checkpoint.jsonl")
+    
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def checkpoint(self, records, completed):
+        return {
+            'task_progress': {'total_pages': 10, 'completed_pages': completed, 'failed_pages': []},
+            'current_task': {'url': 'https://test.com', 'started_at': datetime(2024, 1, 1, 9, 0)},
+            'crawled_data': records,
+            'timestamp': datetime.now(),
+            'current_page': completed + 1,
+            'retry_count': 0
+        }
+    
+    def test_appends_only_new_records_and_replays(self):
+        """체크포인트마다 새 레코드만 덧붙이고, 재생 시 전체 결과를 복원하는지 테스트"""
+        from checkpoint_journal import CheckpointJournal
+        
+        journal = CheckpointJournal(self.path, fsync_interval=0)
+        records = []
+        for page in range(1, 4):
+            records.extend({'title': f'Item {page}-{i}', 'url': f'https://test.com/{page}/{i}'} for i in range(2))
+            journal.append(self.checkpoint(records, page))
+        
+        with open(self.path, encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual([len(line['records']) for line in lines], [0, 2, 2, 2])
+        self.assertTrue(lines[0]['reset'])
+        self.assertTrue(lines[1]['snapshot'])
+        
+        # 쓰는 도중 중단된 줄은 무시
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('{"reset": false, "records": [{"title": "잘')
+        
+        loaded = CheckpointJournal(self.path).load()
+        self.assertEqual(loaded['crawled_data'], records)
+        self.assertEqual(loaded['task_progress']['completed_pages'], 3)
+        self.assertEqual(loaded['current_task']['started_at'], datetime(2024, 1, 1, 9, 0))
+    
+    def test_new_crawl_and_compaction_rewrite_snapshot(self):
+        """새 크롤링 목록과 압축 기준 초과 시 스냅샷으로 다시 쓰는지 테스트"""
+        from checkpoint_journal import CheckpointJournal
+        
+        journal = CheckpointJournal(self.path, fsync_interval=0, compact_after=2)
+        records = [{'title': 'A'}]
+        for page in range(1, 5):
+            records.append({'title': f'P{page}'})
+            journal.append(self.checkpoint(records, page))
+        
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 2)  # 증분 2줄 후 네 번째 저장에서 스냅샷(머리 + 레코드 1줄)으로 압축
+        self.assertEqual(journal.load()['crawled_data'], records)
+        
+        journal.append(self.checkpoint([{'title': 'new'}], 1))
+        self.assertEqual(journal.load()['crawled_data'], [{'title': 'new'}])
+    
+    def test_snapshot_streams_records_in_chunks(self):
+        """스냅샷을 머리 줄과 SNAPSHOT_CHUNK개씩 나눈 레코드 줄로 기록하고 복원하는지 테스트"""
+        from checkpoint_journal import CheckpointJournal, SNAPSHOT_CHUNK
+        from result_store import MemoryResultStore
+        
+        store = MemoryResultStore()
+        store.extend({'title': f'Item {i}'} for i in range(SNAPSHOT_CHUNK * 2 + 5))
+        journal = CheckpointJournal(self.path, fsync_interval=0)
+        journal.append(self.checkpoint(store, 3))
+        store.append({'title': 'after'})
+        journal.append(self.checkpoint(store, 4))
+        
+        with open(self.path, encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual([len(line['records']) for line in lines], [0, SNAPSHOT_CHUNK, SNAPSHOT_CHUNK, 5, 1])
+        self.assertNotIn('state', lines[1])
+        
+        loaded = CheckpointJournal(self.path).load()
+        self.assertEqual(len(loaded['crawled_data']), len(store))
+        self.assertEqual(loaded['crawled_data'][-1]['title'], 'after')
+        self.assertEqual(loaded['task_progress']['completed_pages'], 4)
+    
+    def test_reads_legacy_pickle_checkpoint(self):
+        """이전 버전의 pickle 체크포인트를 읽고 다음 저장부터 저널로 바꾸는지 테스트"""
+        from checkpoint_journal import read_checkpoint, write_checkpoint, remove_checkpoint
+        
+        data = self.checkpoint([{'title': 'old'}], 2)
+        with open(self.path, 'wb') as f:
+            pickle.dump(data, f)
+        
+        loaded = read_checkpoint(self.path)
+        self.assertEqual(loaded['crawled_data'], [{'title': 'old'}])
+        
+        loaded['crawled_data'].append({'title': 'next'})
+        write_checkpoint(self.path, loaded)
+        self.assertEqual(read_checkpoint(self.path)['crawled_data'], [{'title': 'old'}, {'title': 'next'}])
+        
+        remove_checkpoint(self.path)
+        self.assertIsNone(read_checkpoint(self.path))
+
+
+class TestResultStore(unittest.TestCase):
+    """결과 저장소 테스트"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "results.sqlite3")
+    
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_sqlite_store_batches_threaded_inserts_and_queries(self):
+        """여러 스레드의 추가를 묶어 기록하고 타입/도메인 조건과 커서 반복으로 조회하는지 테스트"""
+        from result_store import SQLiteResultStore
+        
+        store = SQLiteResultStore(self.path, batch_size=50, flush_interval=60, fetch_size=7)
+        
+        def add(worker):
+            for i in range(30):
+                store.append({'type': '링크' if i % 3 else '페이지', 'title': f'{worker}-{i}',
+                              'url': f'https://site{worker % 2}.com/{i}'})
+        
+        threads = [threading.Thread(target=add, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(store), 120)
+        self.assertEqual(store.count(record_type='페이지'), 40)
+        self.assertEqual(store.count_by('domain'), {'site0.com': 60, 'site1.com': 60})
+        self.assertEqual(len(list(store.iter_records(domain='SITE1.com'))), 60)
+        self.assertEqual(store.count(since=datetime.now() + timedelta(hours=1)), 0)
+        
+        # 목록과 같은 접근
+        self.assertEqual(store[5:8], list(store)[5:8])
+        self.assertEqual(store[-1], store.recent(1)[0])
+        
+        store.clear()
+        self.assertFalse(store)
+        self.assertEqual(store.generation, 1)
+        store.close()
+        
+        # 공통 인터페이스는 추상 클래스
+        from result_store import ResultStore
+        with self.assertRaises(TypeError):
+            ResultStore()
+    
+    def test_session_store_is_per_process_and_removed_on_close(self):
+        """기본 저장소가 프로세스별 임시 파일을 쓰고 창을 닫으면 닫혀 삭제되는지 테스트"""
+        with headless_app() as app:
+            path = app.result_store.path
+            self.assertIn(str(os.getpid()), os.path.basename(path))
+            self.assertNotEqual(os.path.dirname(path), os.getcwd())
+            
+            app.crawled_data.append({'type': '링크', 'title': 'a'})
+            app.result_store.flush()
+            self.assertTrue(os.path.exists(path))
+            
+            app.on_closing()
+            app.root.destroy.assert_called_once()
+            self.assertFalse(os.path.exists(path))
+    
+    def test_smart_viewer_reads_whole_store(self):
+        """스마트 뷰어가 저장소를 복사하지 않고 전체 항목으로 개수/태그/통계를 계산하는지 테스트"""
+        import advanced_ui
+        from result_store import SQLiteResultStore
+        
+        store = SQLiteResultStore(self.path, fetch_size=50)
+        store.extend({'type': '네이버쇼핑', 'title': f'상품 {i}' + (' 특가' if i % 2 else ''),
+                      'price': f'{(i + 1) * 1000}원', 'url': f'https://shop{i % 3}.com/{i}'}
+                     for i in range(advanced_ui.DISPLAY_LIMIT + 100))
+        
+        fake_tk = MagicMock(StringVar=FakeTkVar, BooleanVar=FakeTkVar, IntVar=FakeTkVar)
+        with patch.multiple(advanced_ui, tk=fake_tk, ttk=MagicMock()):
+            viewer = advanced_ui.AdvancedResultsViewer(MagicMock(), store)
+            
+            self.assertIs(viewer.crawled_data, store)
+            self.assertEqual(viewer.filtered_count, len(store))
+            self.assertEqual(len(viewer.filtered_data), advanced_ui.DISPLAY_LIMIT)
+            self.assertEqual(viewer.tag_counts['할인'], len(store) // 2)
+            
+            viewer.keyword_var.set("특가")
+            viewer.sort_var.set("가격 높은순")
+            viewer.apply_filters()
+            self.assertEqual(viewer.filtered_count, len(store) // 2)
+            self.assertEqual(viewer.filtered_data[0]['title'], f'상품 {len(store) - 1} 특가')
+            self.assertEqual(sum(1 for _ in viewer.iter_filtered()), len(store) // 2)
+        store.close()
+    
+    def test_checkpoint_journal_follows_store(self):
+        """체크포인트 저널이 저장소의 새 레코드만 id 커서로 덧붙이고, 저장소를 비우면 새로 쓰는지 테스트"""
+        from result_store import SQLiteResultStore
+        from checkpoint_journal import CheckpointJournal
+        
+        store = SQLiteResultStore(self.path)
+        journal = CheckpointJournal(os.path.join(self.temp_dir, "checkpoint.jsonl"), fsync_interval=0)
+        
+        # LIMIT/OFFSET 슬라이스 대신 마지막으로 기록한 id 뒤를 조회
+        with patch.object(store, 'slice_records', side_effect=AssertionError("OFFSET 조회")):
+            for page in range(3):
+                store.extend({'type': '링크', 'title': f'{page}-{i}'} for i in range(2))
+                journal.append({'task_progress': {'completed_pages': page}, 'crawled_data': store})
+        with open(journal.path, encoding='utf-8') as f:
+            self.assertEqual([len(json.loads(line)['records']) for line in f], [0, 2, 2, 2])
+        self.assertEqual(store.records_after(4), (store[4:6], 6))
+        self.assertEqual(store.records_after(6), ([], 6))
+        
+        store.clear()
+        store.append({'type': '페이지', 'title': 'new'})
+        journal.append({'task_progress': {'completed_pages': 1}, 'crawled_data': store})
+        self.assertEqual([record['title'] for record in journal.load()['crawled_data']], ['new'])
+        store.close()
+
+
+class TestCrawlRecord(unittest.TestCase):
+    """슬롯 기반 결과 레코드 테스트"""
+    
+    def test_record_behaves_like_dict(self):
+        """dict 레코드와 같게 비교/조회/설정되고 가격과 도메인을 미리 계산하는지 테스트"""
+        from crawl_record import CrawlRecord, records_to_dicts
+        
+        record = CrawlRecord('네이버쇼핑')
+        record['title'] = '상품 1'
+        record['price'] = '12,900원'
+        record['url'] = 'https://Shopping.Naver.com/item/1'
+        
+        self.assertEqual(record, {'type': '네이버쇼핑', 'title': '상품 1', 'price': '12,900원',
+                                  'url': 'https://Shopping.Naver.com/item/1'})
+        self.assertEqual(record.price_value, 12900)
+        self.assertEqual(record.domain, 'shopping.naver.com')
+        self.assertNotIn('image_url', record)
+        self.assertIsNone(record.get('description'))
+        
+        other = CrawlRecord(type='네이버쇼핑', url='https://shopping.naver.com/item/2')
+        self.assertIs(record.type, other.type)
+        self.assertIs(record.domain, other.domain)
+        
+        converted = records_to_dicts([record], with_crawl_time=True)[0]
+        self.assertIs(type(converted), dict)
+        self.assertIsInstance(converted['crawl_time'], datetime)
+    
+    def test_record_smaller_than_dict(self):
+        """같은 내용의 dict보다 메모리를 적게 쓰는지 테스트"""
+        import tracemalloc
+        from crawl_record import CrawlRecord
+        
+        rows = [{'type': '링크', 'title': f'링크 {i}', 'url': f'https://test.com/{i}', 'description': f'링크 #{i}'}
+                for i in range(2000)]
+        
+        tracemalloc.start()
+        dicts = [dict(row) for row in rows]
+        dict_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        tracemalloc.start()
+        records = [CrawlRecord(**row) for row in rows]
+        record_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        self.assertEqual(records, dicts)
+        self.assertLess(record_bytes, dict_bytes)
+
+
+class TestExporters(unittest.TestCase):
+    """스트리밍 Excel 내보내기 테스트"""
+    
+    def test_write_excel_streams_records(self):
+        """레코드 필드로 열을 정하고 모든 행을 정리된 값으로 기록하는지 테스트"""
+        from openpyxl import load_workbook
+        from crawl_record import CrawlRecord
+        from exporters import write_excel
+        
+        def records():
+            for i in range(3000):
+                yield CrawlRecord(type='링크', title=f' 링크\t제목\x00 {i} ', url=f'https://test.com/{i}',
+                                  tags=['a', 'b'])
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'results.xlsx')
+            count = write_excel(records(), path, sample_size=50)
+            
+            workbook = load_workbook(path, read_only=False)
+            worksheet = workbook['CrawlingResults']
+            rows = list(worksheet.iter_rows(values_only=True))
+            width = worksheet.column_dimensions['B'].width
+            workbook.close()
+        
+        self.assertEqual(count, 3000)
+        self.assertEqual(len(rows), 3001)
+        self.assertEqual(rows[0], ('타입', '제목/텍스트', '가격', 'URL', '이미지 URL', '설명', '태그'))
+        self.assertEqual(rows[1], ('링크', '링크제목 0', None, 'https://test.com/0', None, None, 'a, b'))
+        self.assertEqual(rows[-1][1], '링크제목 2999')
+        self.assertGreaterEqual(width, 8)
+    
+    def test_export_records_by_extension(self):
+        """확장자로 형식을 고르고 선택한 필드만 청크 단위로 기록하는지 테스트"""
+        import csv
+        import gzip
+        from crawl_record import CrawlRecord
+        from exporters import export_format, export_records
+        
+        records = [CrawlRecord(type='링크', title=f'링크 {i}', url=f'https://test.com/{i}', tags=['a', 'b'])
+                   for i in range(25)]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, 'results.csv.gz')
+            jsonl_path = os.path.join(temp_dir, 'results.jsonl')
+            json_path = os.path.join(temp_dir, 'results.json')
+            
+            self.assertEqual(export_format(csv_path), '.csv.gz')
+            self.assertEqual(export_records(records, csv_path, fields=['title', 'tags', 'price']), 25)
+            export_records(iter(records), jsonl_path, fields=['url'])
+            export_records(records, json_path)
+            
+            with gzip.open(csv_path, 'rt', encoding='utf-8-sig', newline='') as f:
+                rows = list(csv.reader(f))
+            with open(jsonl_path, encoding='utf-8') as f:
+                lines = [json.loads(line) for line in f]
+            with open(json_path, encoding='utf-8') as f:
+                array = json.load(f)
+        
+        self.assertEqual(rows[0], ['title', 'tags', 'price'])
+        self.assertEqual(rows[1], ['링크 0', 'a, b', ''])
+        self.assertEqual(len(rows), 26)
+        self.assertEqual(lines[-1], {'url': 'https://test.com/24'})
+        self.assertEqual(array[3], {'type': '링크', 'title': '링크 3', 'url': 'https://test.com/3', 'tags': ['a', 'b']})
+        
+        with self.assertRaises(ValueError):
+            export_records(records, os.path.join(temp_dir, 'results.txt'))
+
+    
+    def test_columns_include_fields_missing_from_sample(self):
+        """표본에 없던 레코드 필드도 열에 포함하는지 테스트"""
+        import csv
+        from exporters import write_csv
+        
+        records = [{'type': '링크', 'title': f'링크 {i}'} for i in range(20)]
+        records.append({'type': '상품', 'title': '상품', 'price': '1,000원'})
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'results.csv')
+            write_csv(records, path, sample_size=5)
+            with open(path, encoding='utf-8-sig', newline='') as f:
+                rows = list(csv.DictReader(f))
+        
+        self.assertEqual(len(rows), 21)
+        self.assertEqual(rows[-1]['price'], '1,000원')
+    
+    def test_export_window_writes_all_filtered_rows(self):
+        """스마트 뷰어 내보내기가 화면에 그린 항목이 아닌 필터에 맞는 전체 항목을 기록하는지 테스트"""
+        import advanced_ui
+        from result_store import MemoryResultStore
+        
+        store = MemoryResultStore()
+        total = advanced_ui.DISPLAY_LIMIT * 2
+        store.extend({'type': '링크', 'title': f'링크 {i}' + (' 세일' if i % 2 else ''),
+                      'url': f'https://test.com/{i}'} for i in range(total))
+        
+        fake_tk = MagicMock(StringVar=FakeTkVar, BooleanVar=FakeTkVar, IntVar=FakeTkVar)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'selected.jsonl')
+            with patch.multiple(advanced_ui, tk=fake_tk, ttk=MagicMock(), messagebox=MagicMock(),
+                                filedialog=MagicMock(**{'asksaveasfilename.return_value': path})):
+                viewer = advanced_ui.AdvancedResultsViewer(MagicMock(), store)
+                viewer.keyword_var.set("세일")
+                viewer.apply_filters()
+                
+                window = advanced_ui.ExportWindow(MagicMock(), store, predicate=viewer.matches,
+                                                  prepare=viewer.tagged_item)
+                window.format_var.set('.jsonl')
+                window.export_data()
+            
+            with open(path, encoding='utf-8') as f:
+                lines = [json.loads(line) for line in f]
+        
+        self.assertEqual(len(lines), total // 2)
+        self.assertIn('할인', lines[0]['tags'])
+
+class TestTextClean(unittest.TestCase):
+    """텍스트 정리 테스트"""
+    
+    @staticmethod
+    def legacy_clean(text):
+        """이전에 각 호출 위치에 있던 정리 코드 (기준 커밋 main.py update_results 그대로, 빈 값 처리만 추가)"""
+        import re
+        import unicodedata
+        if not text:
+            return ''
+        # 유니코드 정규화 (한글 호환성 문자 처리)
+        text = unicodedata.normalize('NFC', text)
+        # 제어 문자 제거
+        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
+        # 연속된 공백 정리
+        text = re.sub(r'\s+', ' ', text).strip()
+        return text
+    
+    def test_same_result_as_legacy(self):
+        """이전 정리 코드와 같은 결과인지 테스트"""
+        import unicodedata
+        from text_clean import clean_text, clean_text_cached
+        
+        samples = ['더보기', '  Home\n', unicodedata.normalize('NFD', '한글 제목\t\t테스트'),
+                   'a\x00b \x85 c\x1c', '\x00 앞 제어문자', '\u3000전각\u00a0공백', 'a\tb', '줄\r\n바꿈 ', '', None]
+        for text in samples:
+            self.assertEqual(clean_text(text), self.legacy_clean(text))
+            if text is not None:
+                self.assertEqual(clean_text_cached(text), self.legacy_clean(text))
+    
+    def test_faster_than_legacy(self):
+        """링크 텍스트 정리 마이크로 벤치마크 (이전 코드보다 빠른지)"""
+        import timeit
+        from text_clean import clean_text, clean_text_cached
+        
+        texts = ([f'Item {i} link' for i in range(300)] + ['더보기', '다음', 'Home', '로그인'] * 100
+                 + [f'상품명 {i}\n  설명' for i in range(300)])
+        
+        def bench(func):
+            return min(timeit.repeat(lambda: [func(text) for text in texts], number=5, repeat=3))
+        
+        legacy_time = bench(self.legacy_clean)
+        clean_time = bench(clean_text)
+        cached_time = bench(clean_text_cached)
+        print(f"\n[DEBUG] 텍스트 정리: 이전 {legacy_time:.4f}s, clean_text {clean_time:.4f}s, "
+              f"clean_text_cached {cached_time:.4f}s")
+        
+        self.assertLess(clean_time, legacy_time)
+        self.assertLess(cached_time, legacy_time)
+
+
 def run_gui_tests():
     """GUI 환경에서 실행할 수 있는 테스트"""
     print("GUI 컴포넌트 테스트 시작...")
@@ -443,7 +1923,27 @@ if __name__ == "__main__":
         TestCrawlingFunctionality, 
         TestDataProcessing,
         TestIntegration,
-        TestPerformance
+        TestPerformance,
+        TestHttpSessionManager,
+        TestRateLimiter,
+        TestRetryPolicy,
+        TestResponseCache,
+        TestPageExtractor,
+        TestUiUpdateQueue,
+        TestSiteProfiles,
+        TestSeleniumDriverPool,
+        TestPlaywrightBrowserService,
+        TestResourceBlocking,
+        TestReadiness,
+        TestAsyncPlaywrightEngine,
+        TestCrawlEngine,
+        TestStartupTime,
+        TestLazyTabs,
+        TestCheckpointJournal,
+        TestResultStore,
+        TestCrawlRecord,
+        TestExporters,
+        TestTextClean
     ]
     
     for test_class in test_classes:
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+텍스트 정리
+페이지 추출(제목, 설명, 링크 텍스트, 본문)과 내보내기 셀 값이 같은 정리 규칙을 사용합니다.
+
+    유니코드 NFC 정규화 -> 제어 문자 제거(탭/줄바꿈 포함) -> 공백 정리(연속 공백을 공백 하나로) -> 앞뒤 공백 제거
+
+- 순서는 이전에 각 호출 위치에 있던 정리 코드와 같습니다. (탭/줄바꿈은 공백이 아니라 제거되어 "a\\tb" -> "ab")
+- ASCII 문자열은 NFC 정규화 결과가 항상 같으므로 정규화를 건너뜁니다.
+- 제어 문자는 미리 컴파일한 패턴으로, 들어 있을 때만 제거합니다.
+- 공백 정리는 정규식 대신 str.split()/join을 사용합니다. (\\s와 같은 유니코드 공백 기준)
+- 같은 링크 텍스트("더보기", "다음" 등)가 반복되는 경우를 위해 결과를 기억하는 clean_text_cached를 제공합니다.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+CONTROL_CHARS = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+CACHE_SIZE = 4096  # clean_text_cached가 기억할 문자열 수
+
+
+def clean_text(text):
+    """유니코드 정규화, 제어 문자 제거, 공백 정리 (빈 값은 '')"""
+    if not text:
+        return ''
+    if not text.isascii():
+        text = unicodedata.normalize('NFC', text)
+    if CONTROL_CHARS.search(text):
+        text = CONTROL_CHARS.sub('', text)
+    return ' '.join(text.split())
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def clean_text_cached(text):
+    """clean_text와 같으며 최근 결과를 기억합니다. (반복되는 짧은 텍스트용)"""
+    return clean_text(text)
+
+
+def truncate_text(text, limit, suffix="..."):
+    """limit자를 넘으면 자르고 suffix를 붙입니다."""
+    if len(text) > limit:
+        return text[:limit] + suffix
+    return text
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+작업 스레드 → Tk 메인 스레드 전달 큐
+작업 스레드는 파싱/추출/문자열 생성을 모두 끝낸 표시용 배치만 넣고,
+메인 스레드는 after() 폴링으로 큐를 비우며 위젯에 반영만 합니다.
+큐 크기가 제한되어 있어 UI가 밀리면 작업 스레드가 잠시 대기합니다.
+TreeviewBatchSink는 결과 행을 모아 타이머마다 묶음으로 테이블에 넣습니다.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+
+
+class UiUpdateQueue:
+    """크기가 제한된 UI 업데이트 큐"""
+
+    def __init__(self, root, maxsize=32, poll_interval=50, time_budget=0.03):
+        self.root = root
+        self.poll_interval = poll_interval  # 폴링 간격 (ms)
+        self.time_budget = time_budget      # 한 번의 폴링에서 사용할 최대 시간 (초)
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._polling = False
+
+    def start(self):
+        """메인 스레드 폴링을 시작합니다."""
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_interval, self._drain)
+
+    def stop(self):
+        """폴링을 중지합니다."""
+        self._polling = False
+
+    def put(self, handler, *args, should_continue=None):
+        """메인 스레드에서 실행할 작업을 넣습니다.
+
+        큐가 가득 차면 자리가 날 때까지 기다립니다. should_continue가 False를
+        반환하면(중지 요청) 기다리지 않고 버리며 False를 반환합니다.
+        """
+        item = (handler, args)
+        while True:
+            try:
+                self._queue.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                if should_continue is not None and not should_continue():
+                    print("[DEBUG] UI 큐 포화 상태에서 중지 요청 - 표시 배치 생략")
+                    return False
+
+    def pending(self):
+        """아직 반영되지 않은 배치 수"""
+        return self._queue.qsize()
+
+    def drain(self):
+        """큐에 쌓인 작업을 시간 예산 안에서 실행합니다. (메인 스레드 전용)"""
+        deadline = time.monotonic() + self.time_budget
+        processed = 0
+
+        while time.monotonic() < deadline:
+            try:
+                handler, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            try:
+                handler(*args)
+            except Exception as e:
+                print(f"[DEBUG] UI 업데이트 오류: {e}")
+            processed += 1
+
+        return processed
+
+    def _drain(self):
+        if not self._polling:
+            return
+        self.drain()
+        try:
+            self.root.after(self.poll_interval, self._drain)
+        except Exception:
+            # 창이 닫힌 경우
+            self._polling = False
+
+
+class TreeviewBatchSink:
+    """결과 행을 모아 일정 주기/개수마다 Treeview에 한 번에 반영합니다."""
+
+    def __init__(self, root, tree, flush_interval=100, batch_size=500, max_live_rows=5000):
+        self.root = root
+        self.tree = tree
+        self.flush_interval = flush_interval  # 반영 주기 (ms)
+        self.batch_size = batch_size          # 한 번에 반영할 최대 행 수
+        self.max_live_rows = max_live_rows    # 위젯에 유지할 최대 행 수 (None이면 무제한)
+
+        self._pending = []
+        self._live_rows = deque()
+        self._lock = threading.Lock()
+        self._flush_scheduled = False
+        self.trimmed_rows = 0
+
+    @staticmethod
+    def row_values(record):
+        """레코드를 테이블 컬럼 값으로 변환합니다."""
+        return (
+            record.get('type', ''),
+            str(record.get('title', ''))[:100],
+            record.get('url', ''),
+            record.get('description', '')
+        )
+
+    def add(self, record):
+        """레코드 하나를 추가합니다. (모든 스레드에서 호출 가능)"""
+        self.add_many([record])
+
+    def add_many(self, records):
+        """여러 레코드를 추가합니다. (모든 스레드에서 호출 가능)"""
+        rows = [self.row_values(record) for record in records]
+        if not rows:
+            return
+
+        with self._lock:
+            self._pending.extend(rows)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+            # 한 묶음이 채워졌으면 바로, 아니면 다음 주기에 반영
+            delay = 0 if len(self._pending) >= self.batch_size else self.flush_interval
+
+        self.root.after(delay, self.flush)
+
+    def flush(self):
+        """대기 중인 행을 최대 batch_size개까지 반영합니다. (메인 스레드 전용)"""
+        with self._lock:
+            rows = self._pending[:self.batch_size]
+            del self._pending[:self.batch_size]
+            remaining = len(self._pending)
+            self._flush_scheduled = remaining > 0
+
+        if rows:
+            try:
+                for values in rows:
+                    self._live_rows.append(self.tree.insert('', 'end', values=values))
+                self._trim()
+            except Exception as e:
+                print(f"테이블 추가 오류: {str(e)}")
+
+        if remaining:
+            # 남은 행은 이벤트 처리를 한 번 양보한 뒤 이어서 반영
+            self.root.after(1, self.flush)
+
+    def _trim(self):
+        """유지 한도를 넘는 오래된 행을 위젯에서 제거합니다. (데이터는 유지)"""
+        if not self.max_live_rows:
+            return
+
+        excess = len(self._live_rows) - self.max_live_rows
+        if excess > 0:
+            old_rows = [self._live_rows.popleft() for _ in range(excess)]
+            self.tree.delete(*old_rows)
+            self.trimmed_rows += excess
+
+    def clear(self):
+        """대기 중인 행과 위젯의 모든 행을 지웁니다. (메인 스레드 전용)"""
+        with self._lock:
+            self._pending.clear()
+        self._live_rows.clear()
+        self.trimmed_rows = 0
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)